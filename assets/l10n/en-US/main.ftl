@@ -9,7 +9,15 @@ close-button = Close
 cancel-button = Cancel
 discard-button = Discard
 all-languages = All Languages
+custom-languages = Selected Languages
+language-subset-button = Languages
+language-subset-tooltip = Choose which languages to show in the table.
 term-count-label = Total Terms: {$count}
+term-count-filtered-label = Found Terms: {$count} of {$total}
+search-placeholder = Search terms...
+search-tooltip = Show only the terms with the text in their key, description or any translation, case-insensitively.
+query-mode-button = Query
+query-mode-tooltip = Filter the terms by conditions instead, e.g. key:UI/* fr:empty, type:sprite or fr.len>40.
 report-dev = Please attach the file you were trying to open and post this error in {$link} tab.
 advanced-title = Advanced
 default-label = (default)
@@ -52,6 +60,8 @@ paste-button = Paste
 paste-tooltip = Paste clipboard's entry to selected row.
 delete-button = Delete
 delete-tooltip = Delete the content of selected row.
+find-replace-button = Find and Replace...
+find-replace-tooltip = Find and replace the text in the translations of the chosen languages.
 
 
 ## View section
@@ -65,6 +75,8 @@ check-updates-now-button = Check for Updates Now
 check-updates-now-tooltip = Manually check for available updates.
 check-updates-startup-button = Check for Updates on Startup
 check-updates-startup-tooltip = Automatically check for updates when the application starts.
+lazy-languages-button = Load Languages on Demand
+lazy-languages-tooltip = Keep the translations of the opened dumps packed until a language is edited. Takes effect on the next opened file.
 
 
 ## Tools section
@@ -75,6 +87,10 @@ import-translations-button = Import Translations
 import-translations-tooltip = Import translations from CSV/TSV file.
 manage-languages-button = Manage Languages
 manage-languages-tooltip = Manage languages in the table.
+memory-report-button = Memory Report
+memory-report-tooltip = View how much memory the translations take.
+convert-dumps-button = Convert Dumps
+convert-dumps-tooltip = Convert dump files into another format without opening them.
 
 
 ## Popup titles
@@ -89,6 +105,10 @@ warning-file-not-found = File does not exist: {$file_path}.
 error-invalid-file = Invalid file.
 error-invalid-extension = Invalid file extension.
 error-no-terms-language = No terms/languages found!
+warning-duplicate-terms = {$count} term names are used more than once: {$terms}.
+info-memory-report = {$cells} translations are stored as {$unique} strings taking {$size} MB, sharing the repeated ones saves {$saved} MB.
+info-memory-report-language = {$language}: {$unique} of {$cells} strings, {$size} MB, {$saved} MB saved
+info-memory-report-language-packed = {$language}: {$cells} translations packed, {$size} MB
 
 error-save-failed = Failed to save: {$error}.
 error-invalid-data = Invalid data format: {$error}.
@@ -99,17 +119,22 @@ warning-language-exists = Language '{$language}' already exists!
 
 question-save-file-open = Would you like to save changes to the file?
 question-save-file-exit = Would you like to save changes before exiting?
+question-overwrite-files = These files already exist and will be replaced: {$files}. Would you like to continue?
 
 
 ## File explorer titles
 open-title = Open
 save-title = Save
+convert-dumps-title = Convert Dumps
+convert-dumps-format = Format of the converted files:
 
 ## File extension names
 all-files = All files
 text-file = Text documents
 json-file = JSON files
 dump-file = UABEA dump files
+raw-dump-file = Raw dump files
+compressed-dump-file = Compressed dump files
 csv-file = CSV files
 tsv-file = TSV files
 
@@ -119,6 +144,9 @@ opening-file = Opening file: {$file_path}
 opened-file = File opened: {$file_path}
 saving-file = Saving file: {$file_path}
 saved-file = File saved: {$file_path}
+converting-file = Converting file: {$file_path}
+converted-files = Files converted: {$count}
+invalid-query = Invalid query: {$error}
 
 
 ## Update module
@@ -172,6 +200,10 @@ export-escape-character-optional = None (optional, e.g. \)
 export-escape-character-required = Required for 'None' Quoting
 export-line-ending-label = Line Ending:
 
+export-terms-label = Terms:
+export-terms-placeholder = All terms, or a query, e.g. key:UI/* fr:empty
+export-button-invalid-query = Invalid query: {$error}
+
 # Status bar message
 exporting-file-data = Exporting data from {$file_name}...
 
@@ -311,3 +343,30 @@ warning-duplicate-code = A language with the code '{$code}' already exists.
 warning-reserved-names = The name you entered is reserved. Please use a different one.
 warning-reserved-codes = The code you entered is reserved. Please use a different one.
 warning-invalid-code-letters = Code of the language should contain ASCII letters only.
+
+## Find and replace dialog
+
+find-replace-title = Find and Replace
+find-replace-find-label = Find:
+find-replace-replace-label = Replace with:
+find-replace-regex = Regular expression
+find-replace-regex-tooltip = Find the text as a regular expression, the replacement may refer to its groups, e.g. \1 or \g<name>.
+find-replace-match-case = Match case
+find-replace-languages-label = Languages:
+find-replace-preview-button = Preview
+find-replace-apply-button = Replace All
+find-replace-searching = Searching...
+find-replace-preview = {$matches ->
+    [one] {$matches} match
+    *[other] {$matches} matches
+} in {$translations ->
+    [one] {$translations} translation
+    *[other] {$translations} translations
+} of {$languages ->
+    [one] {$languages} language
+    *[other] {$languages} languages
+}.
+find-replace-no-matches = No translations to change.
+find-replace-invalid = Invalid regular expression: {$error}
+find-replace-failed = Could not find the matches: {$error}
+find-replace-done = Replaced {$matches} matches in {$translations} translations.
@@ -9,7 +9,15 @@ close-button = Закрити
 cancel-button = Скасувати
 discard-button = Відхилити
 all-languages = Усі мови
+custom-languages = Вибрані мови
+language-subset-button = Мови
+language-subset-tooltip = Вибрати мови, які показувати в таблиці.
 term-count-label = Усього термінів: {$count}
+term-count-filtered-label = Знайдено термінів: {$count} з {$total}
+search-placeholder = Шукати терміни...
+search-tooltip = Показувати лише терміни з текстом у ключі, описі чи будь-якому перекладі, без урахування регістру.
+query-mode-button = Запит
+query-mode-tooltip = Фільтрувати терміни за умовами, напр. key:UI/* fr:empty, type:sprite чи fr.len>40.
 report-dev = Просимо опублікувати цю помилку та прикріпити файл, який ви намагалися відкрити, у вкладці {$link}.
 advanced-title = Розширено
 default-label = (типово)
@@ -52,6 +60,8 @@ paste-button = Вставити
 paste-tooltip = Вставити вміст буфера обміну у вибраний рядок.
 delete-button = Видалити
 delete-tooltip = Видалити вміст вибраного рядка.
+find-replace-button = Знайти та замінити...
+find-replace-tooltip = Знайти та замінити текст у перекладах обраних мов.
 
 
 ## View section
@@ -65,6 +75,8 @@ check-updates-now-button = Перевірити на наявність онов
 check-updates-now-tooltip = Уручну перевірити на наявність оновлення.
 check-updates-startup-button = Перевіряти на наявність оновлення
 check-updates-startup-tooltip = Автоматично перевіряти на наявність оновлення під час запуску застосунку.
+lazy-languages-button = Завантажувати мови за потреби
+lazy-languages-tooltip = Зберігати переклади відкритих дампів упакованими, доки мову не буде змінено. Діє з наступного відкритого файлу.
 
 
 ## Tools section
@@ -75,6 +87,10 @@ import-translations-button = Імпортувати переклади
 import-translations-tooltip = Імпортувати переклади з файлу CSV/TSV.
 manage-languages-button = Керувати мовами
 manage-languages-tooltip = Керувати мовами в таблиці.
+memory-report-button = Звіт про пам'ять
+memory-report-tooltip = Переглянути, скільки пам'яті займають переклади.
+convert-dumps-button = Конвертувати дампи
+convert-dumps-tooltip = Конвертувати дамп файли в інший формат без їх відкриття.
 
 
 ## Popup titles
@@ -89,6 +105,10 @@ warning-file-not-found = Файлу не існує: {$file_path}.
 error-invalid-file = Недійсний файл.
 error-invalid-extension = Недійсне розширення файлу.
 error-no-terms-language = Не знайдено терміни/мови!
+warning-duplicate-terms = Кількість назв термінів, які використовуються більше одного разу: {$count}. {$terms}.
+info-memory-report = Переклади ({$cells}) зберігаються як {$unique} рядків, що займають {$size} МБ. Спільне зберігання повторюваних рядків заощаджує {$saved} МБ.
+info-memory-report-language = {$language}: {$unique} з {$cells} рядків, {$size} МБ, заощаджено {$saved} МБ
+info-memory-report-language-packed = {$language}: упаковано перекладів ({$cells}), {$size} МБ
 
 error-save-failed = Помилка збереження: {$error}.
 error-invalid-data = Недійсний формат даних: {$error}.
@@ -99,17 +119,22 @@ warning-language-exists = Мова «{$language}» уже існує!
 
 question-save-file-open = Бажаєте зберегти зміни до файлу?
 question-save-file-exit = Бажаєте зберегти зміни перед виходом?
+question-overwrite-files = Ці файли вже існують і будуть замінені: {$files}. Бажаєте продовжити?
 
 
 ## File explorer titles
 open-title = Відкрити
 save-title = Зберегти
+convert-dumps-title = Конвертування дампів
+convert-dumps-format = Формат конвертованих файлів:
 
 ## File extension names
 all-files = Усі файли
 text-file = Текстові документи
 json-file = JSON файли
 dump-file = UABEA дамп файли
+raw-dump-file = Необроблені дамп файли
+compressed-dump-file = Стиснені дамп файли
 csv-file = CSV файли
 tsv-file = TSV файли
 
@@ -119,6 +144,9 @@ opening-file = Відкриття файлу: {$file_path}
 opened-file = Файл відкрито: {$file_path}
 saving-file = Збереження файлу: {$file_path}
 saved-file = Файл збережено: {$file_path}
+converting-file = Конвертування файлу: {$file_path}
+converted-files = Файлів конвертовано: {$count}
+invalid-query = Недійсний запит: {$error}
 
 
 ## Update module
@@ -172,6 +200,10 @@ export-escape-character-optional = Відсутній (необов’язков
 export-escape-character-required = Обов’язковий для «Без лапок»
 export-line-ending-label = Послідовність завершення рядка:
 
+export-terms-label = Терміни:
+export-terms-placeholder = Усі терміни або запит, напр. key:UI/* fr:empty
+export-button-invalid-query = Недійсний запит: {$error}
+
 # Status bar message
 exporting-file-data = Експортування даних з {$file_name}...
 
@@ -313,3 +345,21 @@ warning-duplicate-code = Мова з кодом «{$code}» уже існує.
 warning-reserved-names = Введене вами назва зарезервована. Будь ласка, введіть іншу.
 warning-reserved-codes = Введений вами код зарезервований. Будь ласка, введіть інший.
 warning-invalid-code-letters = Код мови повинен містити лише літери ASCII.
+
+## Find and replace dialog
+
+find-replace-title = Знайти та замінити
+find-replace-find-label = Знайти:
+find-replace-replace-label = Замінити на:
+find-replace-regex = Регулярний вираз
+find-replace-regex-tooltip = Шукати текст як регулярний вираз, заміна може посилатися на його групи, напр. \1 чи \g<name>.
+find-replace-match-case = З урахуванням регістру
+find-replace-languages-label = Мови:
+find-replace-preview-button = Переглянути
+find-replace-apply-button = Замінити все
+find-replace-searching = Пошук...
+find-replace-preview = Збігів: {$matches}, перекладів: {$translations}, мов: {$languages}.
+find-replace-no-matches = Немає перекладів для зміни.
+find-replace-invalid = Недійсний регулярний вираз: {$error}
+find-replace-failed = Не вдалося знайти збіги: {$error}
+find-replace-done = Замінено збігів: {$matches} у перекладах: {$translations}.
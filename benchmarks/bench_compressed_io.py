@@ -0,0 +1,77 @@
+"""Time saving and opening the compressed dumps against the plain ones, as on a slow network share.
+
+Without `--share`, the dumps are saved to a local temporary directory and the time of moving them over a share
+of `--bandwidth` MB/s is added to the times measured. With `--share`, they are saved to and opened from there.
+The compression level is the configured `compression.level`.
+
+Usage: python -m benchmarks.bench_compressed_io [--dump DUMP] [--terms 30000] [--languages 30] [--share DIR]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generate_dump import generate_dump
+from utils.dump_io import get_compression_level
+from utils.manager import I2Manager
+
+SUFFIXES = [".txt", ".txt.gz", ".txt.xz", ".txt.bz2", ".json", ".json.gz", ".dat", ".dat.gz"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dump", type=Path, help="dump to open first, a synthetic TXT one is generated if not given")
+    parser.add_argument("--terms", type=int, default=30_000)
+    parser.add_argument("--languages", type=int, default=30)
+    parser.add_argument("--share", type=Path, help="directory on the network share to save the dumps to")
+    parser.add_argument("--bandwidth", type=float, default=10, help="MB/s of the share if it is not given")
+    parser.add_argument("--suffixes", nargs="+", default=SUFFIXES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = args.dump
+        if source is None:
+            source = Path(temp_dir) / "source.txt"
+            generate_dump(source, args.terms, args.languages)
+
+        manager = I2Manager()
+        result = manager.open_dump_file(source, use_cache=False)
+        assert result is True, result
+        reference = manager.build_txt_dump()
+
+        target_dir = args.share or Path(temp_dir)
+        transfer = 0 if args.share else args.bandwidth * 2 ** 20
+        print(
+            f"[BENCH] {len(manager.get_terms())} terms, compression level {get_compression_level()}, "
+            + (f"share {args.share}" if args.share else f"share of {args.bandwidth:g} MB/s simulated")
+        )
+        print(f"[BENCH] {'format':10} {'size':>10} {'save':>8} {'open':>8} {'save on share':>14} {'open on share':>14}")
+
+        for suffix in args.suffixes:
+            path = target_dir / f"bench{suffix}"
+            try:
+                start = time.perf_counter()
+                result = manager.save_dump_file(path)
+                save = time.perf_counter() - start
+                assert result is True, result
+
+                dump = I2Manager()
+                start = time.perf_counter()
+                result = dump.open_dump_file(path, use_cache=False)
+                load = time.perf_counter() - start
+                assert result is True, result
+                assert dump.build_txt_dump() == reference, f"{suffix} does not open to the same terms"
+
+                size = path.stat().st_size
+            finally:
+                path.unlink(missing_ok=True)
+
+            moved = size / transfer if transfer else 0
+            print(
+                f"[BENCH] {suffix:10} {size / 2 ** 20:8.1f}MB {save:7.2f}s {load:7.2f}s "
+                f"{save + moved:13.2f}s {load + moved:13.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Time `escape` and `unescape` against the sequential replacement passes they superseded.
+
+Usage: python -m benchmarks.bench_escape [--strings 5000] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+
+from utils.helpers import escape, unescape
+
+WORDS = ["Hello", "world", "Привіт", "світ", "日本語", "x" * 20]
+
+
+def sequential_escape(s: str):
+    if not s:
+        return ""
+
+    for actual, escaped in {"\\": "\\\\", "\n": "\\n", "\r": "\\r"}.items():
+        s = s.replace(actual, escaped)
+    return s
+
+
+def sequential_unescape(s: str):
+    """Former unescape, reading an escaped backslash followed by `n` as a new line."""
+    if not s:
+        return ""
+
+    for escaped, actual in {"\\r": "\r", "\\n": "\n", "\\\\": "\\"}.items():
+        s = s.replace(escaped, actual)
+    return s
+
+
+def make_strings(count: int, seed: int = 0):
+    """Get the plain strings, the ones with line breaks and backslashes, and the escaped ones of each."""
+    rnd = random.Random(seed)
+    plain = [" ".join(rnd.choices(WORDS, k=8)) for _ in range(count)]
+    mixed = [
+        s + ("\n" if index % 3 == 0 else "") + ("\\" if index % 7 == 0 else "")
+        for index, s in enumerate(plain)
+    ]
+    heavy = [s.replace(" ", "\\n") for s in mixed]
+    return {
+        "plain": plain,
+        "mixed": mixed,
+        "heavy": heavy,
+        "escaped": list(map(escape, mixed)),
+        "escaped heavy": list(map(escape, heavy))
+    }
+
+
+def bench(function, strings: list[str], repeat: int):
+    """:return: best time of one pass over the strings, in milliseconds."""
+    return min(timeit.repeat(lambda: list(map(function, strings)), number=10, repeat=repeat)) * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strings", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    strings = make_strings(args.strings)
+    cases = [
+        ("escape", sequential_escape, escape, ("plain", "mixed", "heavy")),
+        ("unescape", sequential_unescape, unescape, ("plain", "escaped", "escaped heavy"))
+    ]
+
+    print(f"[BENCH] Milliseconds per {args.strings} strings, best of {args.repeat}")
+    for name, old_function, new_function, kinds in cases:
+        for kind in kinds:
+            old = bench(old_function, strings[kind], args.repeat)
+            new = bench(new_function, strings[kind], args.repeat)
+            print(f"[BENCH] {name:8} {kind:13} sequential {old:7.2f}  current {new:7.2f}  x{old / new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
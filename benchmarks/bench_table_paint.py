@@ -0,0 +1,122 @@
+"""Time scrolling, painting and fitting the rows of a large terms table, and the model `data` calls behind them.
+
+Runs without a display when `QT_QPA_PLATFORM=offscreen` is set.
+
+Usage: python -m benchmarks.bench_table_paint [--rows 100000] [--languages 30] [--steps 300]
+"""
+import argparse
+import os
+import sys
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from gui.custom_table import CustomTable, TermFilterModel
+from utils.enums import TermType as Tt
+from utils.manager import manager
+from utils.records import LanguageRecord
+from utils.term_store import TermStore
+
+
+def make_terms(rows: int, languages: int):
+    types = list(Tt)
+    return TermStore(
+        {
+            "name": f"Category/Term_{row}",
+            "type": types[row % len(types)],
+            "desc": "",
+            "translations": [f"Translation {row} in language {column}" for column in range(languages)],
+            "flags": [0] * languages,
+            "languages_touch": []
+        }
+        for row in range(rows)
+    )
+
+
+def count_calls(cls: type, name: str):
+    """Wrap the method of the class with a call counter.
+
+    :return: list of the one call count.
+    """
+    calls = [0]
+    method = getattr(cls, name)
+
+    def counted(*args):
+        calls[0] += 1
+        return method(*args)
+
+    setattr(cls, name, counted)
+    return calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--languages", type=int, default=30)
+    parser.add_argument("--steps", type=int, default=300)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    langs = [LanguageRecord(f"Lang{index}", f"l{index}") for index in range(args.languages)]
+    terms = make_terms(args.rows, args.languages)
+    manager.content = {"terms": terms, "languages": langs, "structure": {}, "metadata": {}}
+
+    # the view reads the cells through the row filter of the search
+    data = TermFilterModel.data
+    calls = count_calls(TermFilterModel, "data")
+
+    view = CustomTable()
+    view.load_table(None, terms, langs)
+    view.resize(1920, 1080)
+    view.show()
+    app.processEvents()
+    # rows are fitted below, not by the timer in between
+    view._resize_timer.stop()
+
+    steps = args.steps
+    vertical, horizontal = view.verticalScrollBar(), view.horizontalScrollBar()
+    print(f"[BENCH] {args.rows} rows x {args.languages} languages, {steps} scroll steps in 1920x1080")
+
+    calls[0] = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        vertical.setValue(step * vertical.maximum() // steps)
+        horizontal.setValue((step * 37) % (horizontal.maximum() + 1))
+        view.viewport().repaint()
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] paint   {elapsed:6.2f}s, {calls[0]} data calls, {elapsed / steps * 1000:.1f} ms per step")
+
+    calls[0] = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        vertical.setValue(step * vertical.maximum() // steps)
+        first = view.rowAt(0)
+        for row in range(first, first + 25):
+            view.resizeRowToContents(row)
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] fit 25 rows {elapsed:6.2f}s, {calls[0]} data calls, {elapsed / steps * 1000:.1f} ms per step")
+
+    model = view.model()
+    indexes = [
+        model.index(row, column)
+        for row in range(0, args.rows, max(args.rows // 100, 1))
+        for column in range(model.columnCount())
+    ]
+    start = time.perf_counter()
+    for _ in range(20):
+        for index in indexes:
+            data(model, index, Qt.ItemDataRole.DisplayRole)
+            data(model, index, Qt.ItemDataRole.FontRole)
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] data()  {elapsed / (40 * len(indexes)) * 1e6:.2f} us per call, display and font roles")
+
+    view.close()
+    # the interpreter finalization may crash in PySide6 after millions of the model calls,
+    # and there is nothing left to clean up
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
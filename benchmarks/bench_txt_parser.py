@@ -0,0 +1,79 @@
+"""Time the TXT dump parser and measure its peak memory, optionally against another checkout of the repository.
+
+Each parse runs in a process of its own, so the peak resident set size is that of the parse alone.
+The dump is generated by `benchmarks.generate_dump` unless one is given.
+
+Usage: python -m benchmarks.bench_txt_parser [--dump DUMP] [--terms 500000] [--baseline CHECKOUT] [--repeat 3]
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.generate_dump import generate_dump
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse(root: str, dump: str):
+    """Parse the dump with the `convert_txt_dump` of the tree, and print the seconds and the peak RSS in MB."""
+    import resource
+    import time
+
+    sys.path.insert(0, root)
+    from utils.manager import I2Manager
+
+    annotation = I2Manager.convert_txt_dump.__annotations__.get("dump_lines")
+    start = time.perf_counter()
+    with open(dump, "r", encoding="utf-8") as f:
+        # parsers before the streaming one take the list of the lines
+        content = I2Manager.convert_txt_dump(f.readlines() if getattr(annotation, "__origin__", None) is list else f)
+    elapsed = time.perf_counter() - start
+
+    assert content["mSource"]["mTerms"]["Array"]
+    print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+
+def run(root: Path, dump: Path, repeat: int):
+    """:return: best seconds and the peak RSS in MB of the parses."""
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_txt_parser", "--child", str(root), str(dump)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        results.append(tuple(map(float, output.split()[-2:])))
+    return min(seconds for seconds, _ in results), max(rss for _, rss in results)
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        parse(*sys.argv[2:4])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dump", type=Path, help="TXT dump to parse, a synthetic one is generated if not given")
+    parser.add_argument("--terms", type=int, default=500_000)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--baseline", type=Path, help="another checkout of the repository to compare with")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dump = args.dump
+        if dump is None:
+            dump = Path(temp_dir) / "dump.txt"
+            generate_dump(dump, args.terms, args.languages)
+        print(f"[BENCH] Parsing {dump} ({dump.stat().st_size / 2 ** 20:.0f} MB), best of {args.repeat}")
+
+        seconds, rss = run(ROOT, dump, args.repeat)
+        print(f"[BENCH] current   {seconds:7.2f}s  {rss:7.0f} MB max RSS")
+        if args.baseline is not None:
+            base_seconds, base_rss = run(args.baseline.resolve(), dump, args.repeat)
+            print(f"[BENCH] baseline  {base_seconds:7.2f}s  {base_rss:7.0f} MB max RSS")
+            print(f"[BENCH] x{base_seconds / seconds:.1f} faster, {base_rss / rss:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Generate a synthetic UABEA TXT dump of the I2 `LanguageSource`, for the benchmarks and the tests.
+
+Usage: python -m benchmarks.generate_dump OUTPUT [--terms 500000] [--languages 10] [--no-descriptions] [--seed 1]
+"""
+import argparse
+import random
+from pathlib import Path
+from typing import TextIO
+
+# translations with the characters escaped in the dumps, and values that look like numbers or keywords
+WORDS = [
+    "alpha", "Beta", "gamma", "x = y", "tab\there", "line\nbreak", "carriage\rreturn", "back\\slash",
+    "back\\nslash", "Привіт", "日本語", "", "  spaced  ", "\"quoted\"", "true", "123", "-5", "1.5"
+]
+
+
+def escape_value(value: str):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def write_dump(f: TextIO, terms: int, languages: int, descriptions: bool = True, seed: int = 1):
+    """Write the synthetic dump.
+
+    :param f: writable text stream, opened with `newline="\\n"`.
+    :param terms: number of the terms.
+    :param languages: number of the languages.
+    :param descriptions: whether the terms have descriptions.
+    :param seed: seed of the random translations, the same one gives the same dump.
+    """
+    rnd = random.Random(seed)
+    f.write(
+        "0 MonoBehaviour Base\n"
+        " 0 PPtr<GameObject> m_GameObject\n"
+        "  0 int m_FileID = 0\n"
+        "  0 SInt64 m_PathID = 0\n"
+        " 1 UInt8 m_Enabled = 1\n"
+        " 0 PPtr<MonoScript> m_Script\n"
+        "  0 int m_FileID = 1\n"
+        "  0 SInt64 m_PathID = 11500000\n"
+        " 1 string m_Name = \"I2Languages\"\n"
+        " 0 LanguageSourceData mSource\n"
+        "  1 UInt8 UserAgreesToHaveItOnTheScene = 0\n"
+        "  1 UInt8 UserAgreesToHaveItInsideThePluginsFolder = 1\n"
+        "  1 UInt8 GoogleLiveSyncIsUptoDate = 1\n"
+        "  0 TermData mTerms\n"
+        f"   1 Array Array ({terms} items)\n"
+        f"    0 int size = {terms}\n"
+    )
+
+    for index in range(terms):
+        lines = [
+            f"    [{index}]\n"
+            "     0 TermData data\n"
+            f"      1 string Term = \"UI/Menu/Term_{index}\"\n"
+            f"      0 int TermType = {rnd.choice((0, 0, 0, 5, 1))}\n"
+        ]
+        if descriptions:
+            lines.append(f"      1 string Description = \"{rnd.choice(('', '', f'desc {index}'))}\"\n")
+
+        lines.append(
+            "      0 string Languages\n"
+            f"       1 Array Array ({languages} items)\n"
+            f"        0 int size = {languages}\n"
+        )
+        for lang_index in range(languages):
+            value = rnd.choice(WORDS) + (f" {index}" if rnd.random() < 0.5 else "")
+            lines.append(f"        [{lang_index}]\n         1 string data = \"{escape_value(value)}\"\n")
+
+        lines.append(
+            "      0 vector Flags\n"
+            f"       1 Array Array ({languages} items)\n"
+            f"        0 int size = {languages}\n"
+        )
+        for lang_index in range(languages):
+            lines.append(f"        [{lang_index}]\n         0 UInt8 data = {rnd.choice((0, 0, 1, 2))}\n")
+
+        touch = rnd.choice(((), (), ("a", "b")))
+        lines.append(
+            "      0 string Languages_Touch\n"
+            f"       1 Array Array ({len(touch)} items)\n"
+            f"        0 int size = {len(touch)}\n"
+        )
+        for touch_index, value in enumerate(touch):
+            lines.append(f"        [{touch_index}]\n         1 string data = \"{value}\"\n")
+        f.writelines(lines)
+
+    f.write(
+        "  1 UInt8 CaseInsensitiveTerms = 0\n"
+        "  0 int OnMissingTranslation = 1\n"
+        "  1 string mTerm_AppName = \"\"\n"
+        "  0 LanguageData mLanguages\n"
+        f"   1 Array Array ({languages} items)\n"
+        f"    0 int size = {languages}\n"
+    )
+    for lang_index in range(languages):
+        f.write(
+            f"    [{lang_index}]\n"
+            "     0 LanguageData data\n"
+            f"      1 string Name = \"Lang{lang_index}\"\n"
+            f"      1 string Code = \"l{lang_index}\"\n"
+            f"      1 UInt8 Flags = {lang_index % 2}\n"
+        )
+
+    f.write(
+        "  1 UInt8 IgnoreDeviceLanguage = 0\n"
+        "  0 int _AllowUnloadingLanguages = 0\n"
+        "  1 string Google_WebServiceURL = \"\"\n"
+        "  1 string Google_SpreadsheetKey = \"\"\n"
+        "  1 string Google_SpreadsheetName = \"\"\n"
+        "  1 string Google_LastUpdatedVersion = \"0\"\n"
+        "  0 int GoogleUpdateFrequency = 3\n"
+        "  0 int GoogleInEditorCheckFrequency = 2\n"
+        "  0 int GoogleUpdateSynchronization = 1\n"
+        "  0 float GoogleUpdateDelay = 0\n"
+        "  0 vector Assets\n"
+        "   1 Array Array (1 items)\n"
+        "    0 int size = 1\n"
+        "    [0]\n"
+        "     0 PPtr<$Object> data\n"
+        "      0 int m_FileID = 0\n"
+        "      0 SInt64 m_PathID = 42\n"
+    )
+
+
+def generate_dump(path: str | Path, terms: int, languages: int, descriptions: bool = True, seed: int = 1):
+    """Write the synthetic dump to a file, see `write_dump`."""
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        write_dump(f, terms, languages, descriptions, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--terms", type=int, default=500_000)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--no-descriptions", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    generate_dump(args.output, args.terms, args.languages, not args.no_descriptions, args.seed)
+    print(f"[BENCH] Generated {args.terms} terms in {args.languages} languages: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
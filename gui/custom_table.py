@@ -1,7 +1,9 @@
-from typing import Any, Sequence
+from bisect import bisect_left, bisect_right
+from enum import Enum
+from typing import Any, Callable, Iterable, Sequence
 
 from PySide6.QtCore import (
-    Qt, QTimer, QAbstractTableModel, QModelIndex, QPersistentModelIndex
+    Qt, QTimer, QAbstractTableModel, QAbstractProxyModel, QModelIndex, QPersistentModelIndex
 )
 from PySide6.QtGui import QFontMetrics, QUndoStack, QUndoCommand
 from PySide6.QtWidgets import (
@@ -14,6 +16,37 @@ from utils.enums import TermType, LanguageDataFlags as Ldf
 from utils.helpers import check_language
 from utils.manager import manager
 
+CELL_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole))
+TEXT_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+CELL_ALIGNMENT = Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft
+FIELD_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+TRANSLATION_FLAGS = FIELD_FLAGS | Qt.ItemFlag.ItemIsEditable
+# display names of the term types, so they are not formatted on every repaint
+TERM_TYPE_TITLES = {term_type: term_type.displayed for term_type in TermType}
+
+
+class ColumnKind(Enum):
+    FIELD = 0
+    TRANSLATION = 1
+
+
+class ColumnDescriptor:
+    """Table column precomputed by `CustomTableModel.update_data`, so the cells are read without looking it up."""
+    __slots__ = ("title", "kind", "key", "flags", "read")
+
+    def __init__(self, title: str, kind: ColumnKind, key: str | int, read: Callable[[int], Any]):
+        """
+        :param title: header title.
+        :param kind: whether the column is a term field or a translation.
+        :param key: term field name or language index.
+        :param read: function reading the displayed cell value by the term row.
+        """
+        self.title = title
+        self.kind = kind
+        self.key = key
+        self.flags = FIELD_FLAGS if kind is ColumnKind.FIELD else TRANSLATION_FLAGS
+        self.read = read
+
 
 class CustomTableModel(QAbstractTableModel):
     def __init__(self, mw, terms, langs):
@@ -49,29 +82,20 @@ class CustomTableModel(QAbstractTableModel):
         return 0
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        # called for every role of every painted cell, so the others are turned down first
+        if role not in CELL_ROLES:
+            if role == TEXT_ALIGNMENT_ROLE and index.isValid():
+                return CELL_ALIGNMENT
             return None
 
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft
+        if not index.isValid():
+            return None
 
         row, column = index.row(), index.column()
         if row >= len(self.terms) or column >= len(self.columns):
             return None
 
-        term = self.terms[row]
-        _, key = self.columns[column]
-
-        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            if key in (column[1] for column in self.base_fields):
-                text = term.get(key, "")
-                if isinstance(text, TermType):
-                    text = text.displayed
-                return text
-
-            return manager.get_translation(row, key)
-
-        return None
+        return self.columns[column].read(row)
 
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole):
         if not index.isValid() or role != Qt.ItemDataRole.EditRole:
@@ -81,13 +105,11 @@ class CustomTableModel(QAbstractTableModel):
         if row >= len(self.terms) or column >= len(self.columns):
             return False
 
-        term = self.terms[row]
-        _, key = self.columns[column]
-
-        if key in (c[1] for c in self.base_fields):
-            old_value = term.get(key, "")
+        descriptor = self.columns[column]
+        if descriptor.kind is ColumnKind.FIELD:
+            old_value = self.terms[row][descriptor.key]
         else:
-            old_value = manager.get_translation(row, key)
+            old_value = descriptor.read(row)
 
         if old_value == value:
             return False
@@ -100,7 +122,7 @@ class CustomTableModel(QAbstractTableModel):
         if role != Qt.ItemDataRole.DisplayRole:
             return None
         if orientation == Qt.Orientation.Horizontal:
-            return self.columns[section][0]
+            return self.columns[section].title
 
         return section + 1
 
@@ -108,43 +130,76 @@ class CustomTableModel(QAbstractTableModel):
         if not index.isValid():
             return Qt.ItemFlag.ItemIsEnabled
 
-        _, key = self.columns[index.column()]
-        if key in (f[1] for f in self.base_fields):
-            return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
-
-        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+        return self.columns[index.column()].flags
 
     def apply_cell(self, row, column, value):
-        term = self.terms[row]
-        _, key = self.columns[column]
+        descriptor = self.columns[column]
 
-        if key in (c[1] for c in self.base_fields):
-            term[key] = value
+        if descriptor.kind is ColumnKind.FIELD:
+            self.terms[row][descriptor.key] = value
         else:
-            manager.set_translation(row, key, value)
+            manager.set_translation(row, descriptor.key, value)
 
         index = self.index(row, column)
         self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
 
+    def apply_column(self, lang_index: int, rows: Sequence[int], values: Sequence[str]):
+        """Set many translations of a language at once, with a single change of the rows between them.
+
+        :param lang_index: index of the language.
+        :param rows: sorted term rows.
+        :param values: translations to set, one per row.
+        """
+        if not rows:
+            return
+
+        manager.set_translations(lang_index, rows, values)
+        column = self.language_column(lang_index)
+        self.dataChanged.emit(
+            self.index(rows[0], column), self.index(rows[-1], column), [Qt.ItemDataRole.DisplayRole]
+        )
+
+    def language_column(self, lang_index: int):
+        """Get the column of the language, as the model has one per language in their order."""
+        return len(self.columns) - len(self.lang_columns) + lang_index
+
     def update_data(self, terms, langs):
         self.beginResetModel()
         self.terms = terms
         self.langs = langs
 
-        all_languages = manager.get_languages_copy()
+        base_columns = []
+        for title, key in self.base_fields:
+            read = terms.cell_reader(key)
+            if key == "type":
+                read = self._read_type_title(read)
+            base_columns.append(ColumnDescriptor(title, ColumnKind.FIELD, key, read))
 
+        # columns follow the language order, so that names or codes shared by several languages do not matter
         self.lang_columns = []
-        for lang in self.langs:
+        for lang_index, lang in enumerate(self.langs):
             name = lang["name"]
             code = lang["code"]
             display_name = f"{name} [{code}]" if code else name
-            self.lang_columns.append((display_name, all_languages.index(lang)))
+            self.lang_columns.append(ColumnDescriptor(
+                display_name, ColumnKind.TRANSLATION, lang_index, terms.cell_reader(lang_index)
+            ))
 
-        self.columns = self.base_fields + self.lang_columns
+        self.columns = base_columns + self.lang_columns
         self.endResetModel()
 
+    @staticmethod
+    def _read_type_title(read_type: Callable[[int], Any]):
+        get_title = TERM_TYPE_TITLES.get
+
+        def read(row: int):
+            term_type = read_type(row)
+            return get_title(term_type, term_type)
+
+        return read
+
     def add_language(self, name: str, code: str, flags: Ldf, copy_lang_index: int | None = None):
-        title, msg = check_language(name, code, flags, manager.get_languages())
+        title, msg = check_language(name, code, flags, manager.get_language_lookup())
         if title and msg:
             message_box(self.mw, title, msg)
             return None, None
@@ -186,6 +241,177 @@ class CustomTableModel(QAbstractTableModel):
             pass
 
 
+class TermFilterModel(QAbstractProxyModel):
+    """Proxy of the `CustomTableModel` showing only some of its rows, e.g. the search results.
+
+    The rows shown are kept as a sorted list of the term rows, so the filter is replaced with a single reset
+    instead of asking about every row the way `QSortFilterProxyModel` does. Cells are read through
+    the column descriptors of the source model, the same as it does.
+    """
+
+    def __init__(self, source: CustomTableModel):
+        super().__init__()
+        # term rows shown, all of them if None
+        self.rows: list[int] | None = None
+        self.source = source
+        self.setSourceModel(source)
+
+        source.dataChanged.connect(self._on_source_data_changed)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._on_source_reset)
+        source.rowsAboutToBeInserted.connect(self._on_source_rows_about_to_be_inserted)
+        source.rowsInserted.connect(self._on_source_rows_inserted)
+
+    def set_rows(self, rows: Sequence[int] | None):
+        """Show only the given term rows.
+
+        :param rows: sorted term rows, all of them if None.
+        """
+        self.beginResetModel()
+        self.rows = None if rows is None else list(rows)
+        self.endResetModel()
+
+    def is_filtered(self):
+        return self.rows is not None
+
+    def term_row(self, row: int):
+        """Get the term row shown in the proxy row."""
+        return row if self.rows is None else self.rows[row]
+
+    def proxy_row(self, term_row: int):
+        """Get the proxy row showing the term row.
+
+        :return: proxy row if the term is shown. Otherwise, -1.
+        """
+        rows = self.rows
+        if rows is None:
+            return term_row
+
+        row = bisect_left(rows, term_row)
+        return row if row < len(rows) and rows[row] == term_row else -1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.rows is None:
+            return self.source.rowCount()
+
+        return len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self.source.columnCount()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex | None = None):
+        # without the index, it is the `QObject.parent` overload
+        if index is None:
+            return super().parent()
+
+        return QModelIndex()
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()):
+        return not parent.isValid() and self.rowCount() > 0
+
+    def mapToSource(self, proxy_index: QModelIndex | QPersistentModelIndex):
+        if not proxy_index.isValid():
+            return QModelIndex()
+
+        return self.source.index(self.term_row(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex | QPersistentModelIndex):
+        if not source_index.isValid():
+            return QModelIndex()
+
+        row = self.proxy_row(source_index.row())
+        if row == -1:
+            return QModelIndex()
+
+        return self.createIndex(row, source_index.column())
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # the same as `CustomTableModel.data`, without mapping the index to the source on every repaint
+        if role not in CELL_ROLES:
+            if role == TEXT_ALIGNMENT_ROLE and index.isValid():
+                return CELL_ALIGNMENT
+            return None
+
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        rows = self.rows
+        if rows is not None:
+            if row >= len(rows):
+                return None
+            row = rows[row]
+
+        source = self.source
+        if row >= len(source.terms) or column >= len(source.columns):
+            return None
+
+        return source.columns[column].read(row)
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole):
+        return self.source.setData(self.mapToSource(index), value, role)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            return self.source.headerData(section, orientation, role)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        # numbers of the terms, not of the rows shown
+        return self.term_row(section) + 1
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsEnabled
+
+        return self.source.columns[index.column()].flags
+
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: Sequence[int]):
+        first, last = top_left.row(), bottom_right.row()
+        rows = self.rows
+        if rows is not None:
+            first, last = bisect_left(rows, first), bisect_right(rows, last) - 1
+            if first > last:
+                return
+
+        self.dataChanged.emit(
+            self.createIndex(first, top_left.column()), self.createIndex(last, bottom_right.column()), roles
+        )
+
+    def _on_source_reset(self):
+        rows = self.rows
+        if rows is not None:
+            # terms removed along with the reset
+            del rows[bisect_left(rows, self.source.rowCount()):]
+
+        self.endResetModel()
+
+    def _on_source_rows_about_to_be_inserted(self, _parent: QModelIndex, first: int, last: int):
+        # inserted terms are shown along with the filtered ones, e.g. to be edited once added
+        row = first if self.rows is None else bisect_left(self.rows, first)
+        self.beginInsertRows(QModelIndex(), row, row + last - first)
+
+    def _on_source_rows_inserted(self, _parent: QModelIndex, first: int, last: int):
+        rows = self.rows
+        if rows is not None:
+            count = last - first + 1
+            row = bisect_left(rows, first)
+            rows[row:] = [first + offset for offset in range(count)] + [term_row + count for term_row in rows[row:]]
+
+        self.endInsertRows()
+
+
 class EditCommand(QUndoCommand):
     def __init__(self, model, row, column, values):
         super().__init__()
@@ -193,12 +419,37 @@ class EditCommand(QUndoCommand):
         self.model = model
         self.column = column
         self.old_value, self.new_value = values
+        self.old_revision = manager.revision
+        self.new_revision = None
 
     def undo(self):
         self.model.apply_cell(self.row, self.column, self.old_value)
+        manager.mark_modified(self.old_revision)
 
     def redo(self):
         self.model.apply_cell(self.row, self.column, self.new_value)
+        self.new_revision = manager.mark_modified(self.new_revision)
+
+
+class ReplaceCommand(QUndoCommand):
+    """Translations replaced over whole language columns, undone as one, see `find_replacements`."""
+
+    def __init__(self, model, replacements):
+        super().__init__()
+        self.model = model
+        self.replacements = replacements
+        self.old_revision = manager.revision
+        self.new_revision = None
+
+    def undo(self):
+        for column in self.replacements:
+            self.model.apply_column(column.lang_index, column.rows, column.old_values)
+        manager.mark_modified(self.old_revision)
+
+    def redo(self):
+        for column in self.replacements:
+            self.model.apply_column(column.lang_index, column.rows, column.new_values)
+        self.new_revision = manager.mark_modified(self.new_revision)
 
 
 class MultiLineDelegate(QStyledItemDelegate):
@@ -236,6 +487,9 @@ class CustomTable(QTableView):
     def __init__(self):
         super().__init__()
         self.table_model = None
+        self.filter_model = None
+        # columns hidden by `set_visible_languages`
+        self._hidden_columns: set[int] = set()
 
         self.default_row_height = 40
         self._rows_to_resize = []
@@ -267,9 +521,11 @@ class CustomTable(QTableView):
         self.setWordWrap(False)
 
     def load_table(self, parent, terms, langs):
+        self._hidden_columns = set()
         self.table_model = CustomTableModel(parent, terms, langs)
-        self.table_model.dataChanged.connect(self._on_data_changed)
-        self.setModel(self.table_model)
+        self.filter_model = TermFilterModel(self.table_model)
+        self.filter_model.dataChanged.connect(self._on_data_changed)
+        self.setModel(self.filter_model)
 
         corner_button = self.findChild(QAbstractButton)
         if corner_button and not corner_button.text():
@@ -285,12 +541,65 @@ class CustomTable(QTableView):
         self.viewport().update()
 
     def update_table(self, terms, langs):
+        # sections are shown again by the model reset
+        self._hidden_columns = set()
         self.table_model.update_data(terms, langs)
 
         QTimer.singleShot(50, self._queue_visible_rows)
         self.adjust_column_widths()
         self.viewport().update()
 
+    def set_visible_languages(self, lang_indexes: Iterable[int] | None):
+        """Show only the columns of the given languages by hiding the header sections of the others.
+
+        The model is kept as it is, so the selection, the scroll position and the row heights stay.
+        Only the sections whose visibility changes are touched.
+
+        :param lang_indexes: indexes of the languages to show, all of them if None.
+        """
+        model = self.table_model
+        if model is None:
+            return
+
+        if lang_indexes is None:
+            hidden = set()
+        else:
+            lang_indexes = set(lang_indexes)
+            hidden = {
+                model.language_column(lang_index)
+                for lang_index in range(len(model.lang_columns))
+                if lang_index not in lang_indexes
+            }
+
+        shown = self._hidden_columns - hidden
+        for column in hidden - self._hidden_columns:
+            self.setColumnHidden(column, True)
+        for column in shown:
+            self.setColumnHidden(column, False)
+        self._hidden_columns = hidden
+
+        # rows may need to grow for the translations shown
+        if shown:
+            self._queue_visible_rows()
+
+    def set_row_filter(self, term_rows: Sequence[int] | None):
+        """Show only the rows of the given terms, see `TermFilterModel`.
+
+        :param term_rows: sorted term indexes, all the terms if None.
+        """
+        if self.filter_model is None or (term_rows is None and not self.filter_model.is_filtered()):
+            return
+
+        self._rows_to_resize.clear()
+        self._rows_to_resize_set.clear()
+        self.filter_model.set_rows(term_rows)
+        QTimer.singleShot(0, self._queue_visible_rows)
+
+    def is_language_visible(self, lang_index: int):
+        """Check whether the column of the language is shown."""
+        model = self.table_model
+        return model is not None and model.language_column(lang_index) not in self._hidden_columns
+
     def adjust_column_widths(self):
         model = self.model()
         advanced_column_width = 150
@@ -361,7 +670,11 @@ class CustomTable(QTableView):
     def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, _roles: Sequence[int]):
         if top_left and bottom_right:
             if self._is_row_range_visible(top_left.row(), bottom_right.row()):
-                self._queue_rows(range(top_left.row(), bottom_right.row() + 1))
+                # only the rows in view are resized, the change may span the whole column, e.g. of a replacement
+                rect = self.viewport().rect()
+                first = max(top_left.row(), self.rowAt(rect.top()))
+                last = min(bottom_right.row(), self.rowAt(rect.bottom()))
+                self._queue_rows(range(first, last + 1))
 
     def undo_edit(self):
         if not self.table_model:
@@ -417,13 +730,13 @@ class CustomTable(QTableView):
                     undo_stack.push(
                         EditCommand(
                             self.table_model,
-                            index.row(),
+                            self.filter_model.term_row(index.row()),
                             index.column(),
                             (old_value, "")
                         )
                     )
                 else:
-                    self.table_model.setData(index, "", Qt.ItemDataRole.EditRole)
+                    self.filter_model.setData(index, "", Qt.ItemDataRole.EditRole)
         finally:
             if undo_stack:
                 undo_stack.endMacro()
@@ -485,10 +798,10 @@ class CustomTable(QTableView):
                     row = start_row + row_offset
                     column = start_column + column_offset
 
-                    if row >= self.table_model.rowCount() or column >= self.table_model.columnCount():
+                    if row >= self.filter_model.rowCount() or column >= self.filter_model.columnCount():
                         continue
 
-                    index = self.table_model.index(row, column)
+                    index = self.filter_model.index(row, column)
                     old_value = index.data()
 
                     if old_value != cell_value:
@@ -507,13 +820,13 @@ class CustomTable(QTableView):
                     undo_stack.push(
                         EditCommand(
                             self.table_model,
-                            index.row(),
+                            self.filter_model.term_row(index.row()),
                             index.column(),
                             (old_value, cell_value)
                         )
                     )
                 else:
-                    self.table_model.setData(index, cell_value)
+                    self.filter_model.setData(index, cell_value)
         finally:
             if undo_stack:
                 undo_stack.endMacro()
@@ -548,13 +861,13 @@ class CustomTable(QTableView):
                     undo_stack.push(
                         EditCommand(
                             self.table_model,
-                            index.row(),
+                            self.filter_model.term_row(index.row()),
                             index.column(),
                             (old_value, "")
                         )
                     )
                 else:
-                    self.table_model.setData(index, "", Qt.ItemDataRole.EditRole)
+                    self.filter_model.setData(index, "", Qt.ItemDataRole.EditRole)
         finally:
             if undo_stack:
                 undo_stack.endMacro()
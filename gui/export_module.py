@@ -5,7 +5,7 @@ from typing import Any
 from PySide6.QtGui import Qt
 from PySide6.QtWidgets import (
     QFileDialog, QVBoxLayout, QDialog, QWidget, QHBoxLayout, QScrollArea, QCheckBox, QLabel,
-    QSpacerItem, QSizePolicy, QDialogButtonBox, QComboBox, QGroupBox, QGridLayout
+    QSpacerItem, QSizePolicy, QDialogButtonBox, QGroupBox, QGridLayout, QLineEdit
 )
 
 from gui.helpers import ConfigurableComboBox, ConfigurableLineEdit, CustomPushButton, message_box
@@ -15,6 +15,7 @@ from utils.enums import (
     LanguageDataFlags as Ldf
 )
 from utils.manager import manager
+from utils.term_query import QueryError, TermQuery
 
 
 class CsvOptions:
@@ -42,13 +43,12 @@ class CsvOptions:
 class ExportModule:
     def __init__(self, main_window):
         self.mw = main_window
-        self.lang_selector = self.mw.lang_selector
 
         result = self._select_languages_to_export()
         if not result:
             return
 
-        selected_languages, csv_options = result
+        selected_languages, csv_options, query = result
 
         ext = csv_options.extension
         if ext == Fe.TSV.value:
@@ -77,12 +77,13 @@ class ExportModule:
             path = Path(path)
             file_name = path.stem
             terms = manager.get_terms()
-            if not terms:
+            term_rows = manager.query_terms(query) if query else None
+            if not terms or term_rows == []:
                 message_box(self.mw, "warning", "warning-no-terms-found")
                 return
 
             self.mw.status_bar_message(("exporting-file-data", {"file_name": file_name}))
-            self.export_selected_languages(path, terms, selected_languages, csv_options)
+            self.export_selected_languages(path, terms, selected_languages, csv_options, term_rows)
         except Exception as e:
             message_box(self.mw, "error", ("error-export-file", {"error": str(e)}))
 
@@ -121,8 +122,9 @@ class ExportModule:
 
         scroll_area.setWidget(QWidget())
 
+        is_visible = self.mw.custom_table.is_language_visible
         widgets = [
-            LanguageCheckBox(idx, lang["name"], lang["code"], lang["flags"], self.lang_selector)
+            LanguageCheckBox(idx, lang["name"], lang["code"], lang["flags"], is_visible(idx))
             for idx, lang in enumerate(languages)
         ]
         checkbox_layout = QVBoxLayout(scroll_area.widget())
@@ -233,6 +235,20 @@ class ExportModule:
         sub_layout.addLayout(right_layout)
         main_layout.addLayout(sub_layout)
 
+        # === Terms Query ===
+        query_layout = QHBoxLayout()
+        query_layout.addWidget(QLabel(ftr("export-terms-label")))
+
+        query_edit = QLineEdit()
+        query_edit.setClearButtonEnabled(True)
+        query_edit.setPlaceholderText(ftr("export-terms-placeholder"))
+        query_edit.setToolTip(ftr("query-mode-tooltip"))
+        # the terms filtered in the table by a query are offered to export
+        if self.mw.query_button.isChecked():
+            query_edit.setText(self.mw.search_bar.text().strip())
+        query_layout.addWidget(query_edit)
+        main_layout.addLayout(query_layout)
+
         # === Dialog Buttons ===
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -259,6 +275,13 @@ class ExportModule:
             is_custom = delimiter_combo.currentData() is None
             custom_valid = not is_custom or bool(custom_delimiter_edit.text().strip())
 
+            query_error = None
+            if query_edit.text().strip():
+                try:
+                    TermQuery(query_edit.text(), manager.get_language_lookup())
+                except QueryError as e:
+                    query_error = str(e)
+
             select_all_button.setDisabled(all_checked)
             deselect_all_button.setDisabled(not any_checked)
 
@@ -267,12 +290,15 @@ class ExportModule:
                 tooltip = ftr("export-button-disabled")
             elif not custom_valid:
                 tooltip = ftr("export-button-no-custom-delimiter")
+            elif query_error is not None:
+                tooltip = ftr("export-button-invalid-query", {"error": query_error})
 
-            export_button.setEnabled(any_checked and custom_valid)
+            export_button.setEnabled(any_checked and custom_valid and query_error is None)
             export_button.setToolTip(tooltip)
 
         custom_delimiter_edit.textChanged.connect(lambda _: update_dialog_buttons())
         delimiter_combo.currentIndexChanged.connect(lambda _: update_dialog_buttons())
+        query_edit.textChanged.connect(lambda _: update_dialog_buttons())
 
         update_dialog_buttons()
 
@@ -302,15 +328,24 @@ class ExportModule:
             escape_char_edit.text().strip() or None
         )
 
-        return selected_languages, csv_options
+        return selected_languages, csv_options, query_edit.text().strip()
 
     def export_selected_languages(
             self,
             file_path: Path,
             terms: list[dict[str, Any]],
             selected_languages: list,
-            csv_options: CsvOptions | None = None
+            csv_options: CsvOptions | None = None,
+            term_rows: list[int] | None = None
     ):
+        """Export the translations of the selected languages to a CSV file.
+
+        :param file_path: path of the file to write.
+        :param terms: store of the terms.
+        :param selected_languages: tuples of the language index, name and code.
+        :param csv_options: options of the CSV format.
+        :param term_rows: sorted indexes of the terms to export, e.g. found by `manager.query_terms`. All if None.
+        """
         if csv_options is None:
             csv_options = CsvOptions()
 
@@ -335,7 +370,8 @@ class ExportModule:
                 writer.writeheader()
 
                 exported_translations = 0
-                for term_idx, term in enumerate(terms):
+                for term_idx in range(len(terms)) if term_rows is None else term_rows:
+                    term = terms[term_idx]
                     try:
                         row_data = {
                             "Key": term["name"],
@@ -378,7 +414,7 @@ class ExportModule:
 
 
 class LanguageCheckBox(QWidget):
-    def __init__(self, index: int, name: str, code: str, flags: Ldf, lang_selector: QComboBox):
+    def __init__(self, index: int, name: str, code: str, flags: Ldf, checked: bool = True):
         super().__init__()
         self.index = index
         self.name = name
@@ -394,12 +430,7 @@ class LanguageCheckBox(QWidget):
         if flags == Ldf.DISABLED:
             self.checkbox.setStyleSheet("QCheckBox { color: #808080; }")
 
-        if lang_selector.currentIndex() == 0:
-            self.checkbox.setChecked(True)
-        elif lang_name == lang_selector.currentText():
-            self.checkbox.setChecked(True)
-        else:
-            self.checkbox.setChecked(False)
+        self.checkbox.setChecked(checked)
 
         layout.addWidget(self.checkbox)
 
@@ -0,0 +1,251 @@
+import re
+
+from PySide6.QtCore import Qt, QThread
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QLabel, QScrollArea, QWidget,
+    QSpacerItem, QSizePolicy, QDialogButtonBox, QApplication
+)
+
+from gui.custom_table import ReplaceCommand
+from gui.export_module import LanguageCheckBox
+from gui.helpers import ConfigurableCheckBox, CustomPushButton, FindReplaceWorker, localize_buttons
+from utils.app_locales import ftr
+from utils.manager import manager
+from utils.text_replace import compile_pattern
+
+
+class FindReplaceDialog(QDialog):
+    """Dialog replacing the text in the translations of the chosen languages, as a single undo step.
+
+    Translations are looked through in a background thread, so the dialog stays responsive on large files,
+    and the ones found are replaced by a `ReplaceCommand` with one change per language column.
+    """
+
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.mw = main_window
+        self.replacements = None
+        # inputs and data revision the replacements were found for, to tell whether they are still valid
+        self.replacements_key = None
+        self.scan_key = None
+        self.scan_thread = None
+        self.scan_worker = None
+        self.replace_when_found = False
+
+        self.setup_ui()
+        self.connect_signals()
+        self.update_buttons()
+
+        self.exec()
+
+    def setup_ui(self):
+        self.setWindowTitle(ftr("find-replace-title"))
+        self.setMinimumSize(550, 450)
+
+        layout = QVBoxLayout(self)
+
+        # --- Texts ---
+        form_layout = QFormLayout()
+        self.find_edit = QLineEdit()
+        self.replace_edit = QLineEdit()
+        form_layout.addRow(ftr("find-replace-find-label"), self.find_edit)
+        form_layout.addRow(ftr("find-replace-replace-label"), self.replace_edit)
+        layout.addLayout(form_layout)
+
+        options_layout = QHBoxLayout()
+        self.regex_check = ConfigurableCheckBox("find-replace-regex", "replace.regex")
+        self.regex_check.setToolTip(ftr("find-replace-regex-tooltip"))
+        self.match_case_check = ConfigurableCheckBox("find-replace-match-case", "replace.match_case")
+        options_layout.addWidget(self.regex_check)
+        options_layout.addWidget(self.match_case_check)
+        options_layout.addStretch()
+        layout.addLayout(options_layout)
+
+        # --- Languages ---
+        layout.addWidget(QLabel(ftr("find-replace-languages-label")))
+
+        scroll_area = QScrollArea()
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(QWidget())
+        layout.addWidget(scroll_area)
+
+        is_visible = self.mw.custom_table.is_language_visible
+        self.language_widgets = [
+            LanguageCheckBox(idx, lang["name"], lang["code"], lang["flags"], is_visible(idx))
+            for idx, lang in enumerate(manager.get_languages())
+        ]
+        checkbox_layout = QVBoxLayout(scroll_area.widget())
+        for widget in self.language_widgets:
+            checkbox_layout.addWidget(widget)
+        checkbox_layout.addItem(QSpacerItem(1, 1, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+
+        select_layout = QHBoxLayout()
+        self.select_all_button = CustomPushButton("select-all-button", 60, 30, 160, 35)
+        self.deselect_all_button = CustomPushButton("deselect-all-button", 60, 30, 160, 35)
+        select_layout.addWidget(self.select_all_button)
+        select_layout.addWidget(self.deselect_all_button)
+        select_layout.addStretch()
+        layout.addLayout(select_layout)
+
+        # --- Preview ---
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+
+        # --- Dialog Buttons ---
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        self.preview_button = button_box.addButton(
+            ftr("find-replace-preview-button"), QDialogButtonBox.ButtonRole.ActionRole
+        )
+        self.replace_button = button_box.addButton(
+            ftr("find-replace-apply-button"), QDialogButtonBox.ButtonRole.ActionRole
+        )
+        button_box.rejected.connect(self.reject)
+        localize_buttons(button_box)
+        layout.addWidget(button_box)
+
+    def connect_signals(self):
+        self.find_edit.textChanged.connect(self.reset_preview)
+        self.replace_edit.textChanged.connect(self.reset_preview)
+        self.regex_check.toggled.connect(self.reset_preview)
+        self.match_case_check.toggled.connect(self.reset_preview)
+        for widget in self.language_widgets:
+            widget.checkbox.toggled.connect(self.reset_preview)
+
+        self.select_all_button.clicked.connect(lambda: self.set_all_languages(True))
+        self.deselect_all_button.clicked.connect(lambda: self.set_all_languages(False))
+        self.preview_button.clicked.connect(self.preview)
+        self.replace_button.clicked.connect(self.replace_all)
+
+    def set_all_languages(self, state: bool):
+        for widget in self.language_widgets:
+            widget.set_checked(state)
+
+    def selected_languages(self):
+        return [widget.index for widget in self.language_widgets if widget.is_checked()]
+
+    def current_key(self):
+        return (
+            self.find_edit.text(),
+            self.replace_edit.text(),
+            self.regex_check.isChecked(),
+            self.match_case_check.isChecked(),
+            tuple(self.selected_languages()),
+            manager.revision
+        )
+
+    def reset_preview(self):
+        self.replacements = None
+        self.replacements_key = None
+        self.replace_when_found = False
+        self.status_label.clear()
+        self.update_buttons()
+
+    def update_buttons(self):
+        can_find = bool(self.find_edit.text()) and bool(self.selected_languages()) and self.scan_thread is None
+        self.preview_button.setEnabled(can_find)
+        self.replace_button.setEnabled(can_find)
+        self.select_all_button.setDisabled(all(widget.is_checked() for widget in self.language_widgets))
+        self.deselect_all_button.setDisabled(not self.selected_languages())
+
+    def preview(self):
+        if self.scan_thread is not None:
+            return
+
+        try:
+            pattern = compile_pattern(
+                self.find_edit.text(), self.regex_check.isChecked(), self.match_case_check.isChecked()
+            )
+        except re.error as e:
+            self.replace_when_found = False
+            self.status_label.setText(ftr("find-replace-invalid", {"error": str(e)}))
+            return
+
+        replacement = self.replace_edit.text()
+        if not self.regex_check.isChecked():
+            # plain text is put as it is, without the group references
+            replacement = replacement.replace("\\", "\\\\")
+
+        self.scan_key = self.current_key()
+        self.status_label.setText(ftr("find-replace-searching"))
+
+        self.scan_thread = QThread()
+        self.scan_worker = FindReplaceWorker(pattern, replacement, self.selected_languages())
+        self.scan_worker.moveToThread(self.scan_thread)
+
+        self.scan_thread.started.connect(self.scan_worker.find)
+        self.scan_worker.finished.connect(self._on_replacements_found)
+        self.scan_worker.failed.connect(self._on_find_failed)
+        self.scan_worker.finished.connect(self.scan_thread.quit)
+        self.scan_worker.failed.connect(self.scan_thread.quit)
+        self.scan_thread.finished.connect(self.scan_worker.deleteLater)
+        self.scan_thread.finished.connect(self.scan_thread.deleteLater)
+        self.scan_thread.finished.connect(self._on_scan_finished)
+        self.scan_thread.start()
+        self.update_buttons()
+
+    def replace_all(self):
+        if self.replacements is not None and self.replacements_key == self.current_key():
+            self.apply_replacements()
+        else:
+            self.replace_when_found = True
+            self.preview()
+
+    def apply_replacements(self):
+        replacements = self.replacements
+        if not replacements:
+            self.status_label.setText(ftr("find-replace-no-matches"))
+            return
+
+        matches = sum(column.matches for column in replacements)
+        translations = sum(len(column) for column in replacements)
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            self.mw.custom_table.table_model.undo_stack.push(
+                ReplaceCommand(self.mw.custom_table.table_model, replacements)
+            )
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.reset_preview()
+        message = ("find-replace-done", {"matches": matches, "translations": translations})
+        self.status_label.setText(ftr(*message))
+        self.mw.status_bar_message(message, 10000)
+
+    def _on_replacements_found(self, replacements: list):
+        # inputs changed while looking are looked for again by the next preview
+        if self.scan_key != self.current_key():
+            return
+
+        self.replacements = replacements
+        self.replacements_key = self.scan_key
+        if not replacements:
+            self.status_label.setText(ftr("find-replace-no-matches"))
+        else:
+            self.status_label.setText(ftr("find-replace-preview", {
+                "matches": sum(column.matches for column in replacements),
+                "translations": sum(len(column) for column in replacements),
+                "languages": len(replacements)
+            }))
+
+    def _on_find_failed(self, message: tuple[str, dict]):
+        self.replace_when_found = False
+        if self.scan_key == self.current_key():
+            self.status_label.setText(ftr(*message))
+
+    def _on_scan_finished(self):
+        self.scan_thread = None
+        self.scan_worker = None
+        self.update_buttons()
+
+        if self.replace_when_found and self.replacements is not None:
+            self.replace_when_found = False
+            self.apply_replacements()
+
+    def done(self, result: int):
+        self.replace_when_found = False
+        if self.scan_thread is not None:
+            self.scan_thread.wait()
+        super().done(result)
@@ -1,3 +1,5 @@
+import re
+from pathlib import Path
 from typing import Any
 
 from PySide6.QtCore import Qt, QObject, Signal, QPropertyAnimation, QEasingCurve
@@ -28,6 +30,87 @@ class FileWorker(QObject):
             raise e from e
 
 
+class ConvertWorker(QObject):
+    converting = Signal(str)
+    converted = Signal(str, object)
+    finished = Signal(int)
+
+    def __init__(self, targets: dict[Path, Path]):
+        """
+        :param targets: paths to the dumps to convert, mapped to the paths to save them to.
+        """
+        super().__init__()
+        self.targets = targets
+
+    def convert(self):
+        converted = 0
+        try:
+            for source_path, target_path in self.targets.items():
+                self.converting.emit(str(source_path))
+                try:
+                    result = manager.transcode_dump_file(source_path, target_path)
+                except Exception as e:
+                    result = str(e)
+
+                if result is True:
+                    converted += 1
+                self.converted.emit(str(source_path), result)
+        finally:
+            # the thread quits only once it is emitted, see `I2ManagerUI.closeEvent`
+            self.finished.emit(converted)
+
+
+class SearchIndexWorker(QObject):
+    finished = Signal()
+
+    def build(self):
+        try:
+            manager.build_search_index()
+        except Exception as e:
+            print(f"[SEARCH] Could not build the search index: {str(e)}")
+        finally:
+            # the thread quits only once it is emitted, see `I2ManagerUI.closeEvent`
+            self.finished.emit()
+
+
+class SearchWorker(QObject):
+    finished = Signal(str, object)
+
+    def __init__(self, query: str):
+        super().__init__()
+        self.query = query
+
+    def search(self):
+        rows = None
+        try:
+            rows = manager.search_terms(self.query)
+        except Exception as e:
+            print(f"[SEARCH] Could not search the terms: {str(e)}")
+        finally:
+            self.finished.emit(self.query, rows)
+
+
+class FindReplaceWorker(QObject):
+    finished = Signal(object)
+    # message of the error, as given to `ftr`
+    failed = Signal(object)
+
+    def __init__(self, pattern: re.Pattern, replacement: str, lang_indexes: list[int]):
+        super().__init__()
+        self.pattern = pattern
+        self.replacement = replacement
+        self.lang_indexes = lang_indexes
+
+    def find(self):
+        try:
+            self.finished.emit(manager.find_replacements(self.pattern, self.replacement, self.lang_indexes))
+        except re.error as e:
+            self.failed.emit(("find-replace-invalid", {"error": str(e)}))
+        except Exception as e:
+            # the thread quits only once either signal is emitted
+            self.failed.emit(("find-replace-failed", {"error": str(e)}))
+
+
 class ConfigurableLineEdit(QLineEdit):
     def __init__(self, cfg_key: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
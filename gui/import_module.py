@@ -42,12 +42,14 @@ class ImportConfig:
 
 
 class ImportCommand(QUndoCommand):
-    def __init__(self, model, changes, stats):
+    def __init__(self, model, changes, stats, old_revision):
         super().__init__()
         self.model = model
         self.changes = changes
         self.stats = stats
         self._applied = True
+        self.old_revision = old_revision
+        self.new_revision = manager.mark_modified()
 
     def undo(self):
         for change in reversed(self.changes):
@@ -73,10 +75,10 @@ class ImportCommand(QUndoCommand):
             elif change_type == "full_replace":
                 manager.get_terms().clear()
                 manager.get_terms().extend(change["old_terms"])
-                manager.get_languages().clear()
-                manager.get_languages().extend(change["old_languages"])
+                manager.set_languages(change["old_languages"])
 
         self._applied = False
+        manager.mark_modified(self.old_revision)
         self.model.beginResetModel()
         self.model.endResetModel()
 
@@ -103,9 +105,10 @@ class ImportCommand(QUndoCommand):
 
                 elif change_type == "full_replace":
                     manager.get_terms().clear()
-                    manager.get_languages().clear()
+                    manager.set_languages([])
 
             self._applied = True
+            manager.mark_modified(self.new_revision)
             self.model.beginResetModel()
             self.model.endResetModel()
 
@@ -350,7 +353,7 @@ class ImportModule:
         mappings = {}
         row = 1
 
-        current_languages = manager.get_languages_copy()
+        current_languages = manager.get_language_lookup()
 
         for csv_lang in csv_languages:
             display_name = csv_lang["original"]
@@ -443,33 +446,15 @@ class ImportModule:
 
         def auto_map_languages():
             manual_map_button.setEnabled(False)
-            langs = manager.get_languages()
+            csv_langs_by_header = {l["original"]: l for l in reversed(csv_languages)}
 
             for csv_lang_header, combo in mappings.items():
-                csv_lang = next(
-                    (l for l in csv_languages if l["original"] == csv_lang_header),
-                    None
-                )
+                csv_lang = csv_langs_by_header.get(csv_lang_header)
                 if not csv_lang:
                     continue
 
-                csv_name_lower = csv_lang["name"].lower()
-                csv_code = csv_lang["code"].lower() if csv_lang["code"] else None
-                best_match_index = 0
-
-                for idx, lang in enumerate(langs):
-                    lang_name = lang["name"].lower()
-                    lang_code = lang["code"].lower() if lang["code"] else None
-
-                    if csv_code and lang_code and csv_code == lang_code:
-                        best_match_index = idx + 2
-                        break
-
-                    if csv_name_lower == lang_name:
-                        best_match_index = idx + 2
-                        break
-
-                combo.setCurrentIndex(best_match_index)
+                lang_index = manager.find_language(csv_lang["name"], csv_lang["code"])
+                combo.setCurrentIndex(lang_index + 2 if lang_index != -1 else 0)
 
         def update_mapping_button():
             any_mapped = any(combo.currentIndex() != 0 for combo in mappings.values())
@@ -527,6 +512,7 @@ class ImportModule:
         model = self.mw.custom_table.table_model
         terms = manager.get_terms()
         languages = manager.get_languages()
+        old_revision = manager.revision
 
         stats = {
             "terms_created": 0,
@@ -554,7 +540,7 @@ class ImportModule:
             })
 
             terms.clear()
-            languages.clear()
+            manager.set_languages([])
             stats["total_changes"] += 1
 
         lang_index_map = {}
@@ -583,11 +569,6 @@ class ImportModule:
             else:
                 lang_index_map[csv_lang_header] = mapping
 
-        term_to_row = {
-            term["name"]: index
-            for index, term in enumerate(terms)
-        }
-
         progress = QProgressDialog(
             ftr("import-progress-label"),
             ftr("cancel-button"),
@@ -613,11 +594,11 @@ class ImportModule:
                 if not term_key:
                     continue
 
-                if term_key in term_to_row:
+                row_index = manager.get_term_index(term_key)
+                if row_index != -1:
                     if config.mode == UpdateMode.ADD_NEW_ONLY:
                         continue
 
-                    row_index = term_to_row[term_key]
                     term = terms[row_index]
 
                     if config.update_term_type and "Type" in row_data:
@@ -686,12 +667,9 @@ class ImportModule:
                         term_type,
                         row_data.get("Desc", ""),
                         [""] * len(languages),
-                        [0] * len(languages),
-                        []
+                        [0] * len(languages)
                     )
 
-                    term_to_row[term_key] = row_index
-
                     changes.append({
                         "type": "term_added",
                         "row": row_index,
@@ -741,7 +719,7 @@ class ImportModule:
             progress.setValue(len(csv_data))
 
         if changes and stats["total_changes"] > 0:
-            import_cmd = ImportCommand(model, changes, stats)
+            import_cmd = ImportCommand(model, changes, stats, old_revision)
             model.undo_stack.push(import_cmd)
         else:
             model.beginResetModel()
@@ -1,5 +1,6 @@
 import json
 import string
+from collections.abc import Mapping
 
 from PySide6.QtCore import (
     Qt, QAbstractListModel, QModelIndex, QPersistentModelIndex
@@ -47,7 +48,7 @@ class LanguageModel(QAbstractListModel):
         self.mw = mw
         if languages:
             self._languages = [
-                Language(**lang) if isinstance(lang, dict) else lang
+                Language(**lang) if isinstance(lang, Mapping) else lang
                 for lang in languages
             ]
 
@@ -72,14 +73,14 @@ class LanguageModel(QAbstractListModel):
         return None
 
     def add_language(self, lang: Language, copy_from: int | None):
-        self.mw.custom_table.model().add_language(lang.name, lang.code, lang.flags, copy_from)
+        self.mw.custom_table.table_model.add_language(lang.name, lang.code, lang.flags, copy_from)
         self.beginInsertRows(QModelIndex(), len(self._languages), len(self._languages))
         self._languages.append(lang)
         self.endInsertRows()
 
     def remove_language(self, index: int):
         if 0 <= index < len(self._languages):
-            self.mw.custom_table.model().remove_language(index)
+            self.mw.custom_table.table_model.remove_language(index)
             self.beginRemoveRows(QModelIndex(), index, index)
             removed = self._languages.pop(index)
             self.endRemoveRows()
@@ -290,10 +291,10 @@ class LanguageManager(QDialog):
 
     def update_languages(self):
         if manager.content:
-            manager.content["languages"] = [
+            manager.set_languages(
                 {"name": lang.name, "code": lang.code, "flags": lang.flags}
                 for lang in self.model.get_languages()
-            ]
+            )
             self.mw.update_lang_selector()
 
     def move_up(self):
@@ -532,7 +533,9 @@ class AddLanguageDialog(QDialog):
                 message_box(self.mw, "warning", ("warning-duplicate-code", {"code": code}))
                 return
 
-        title, msg = check_language(name, code, flags, self.existing_languages)
+        title, msg = check_language(name, code, flags, [
+            {"name": lang.name, "code": lang.code} for lang in self.existing_languages
+        ])
         if title and msg:
             message_box(self.mw, title, msg)
             return
@@ -1,18 +1,22 @@
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QThread
+from PySide6.QtCore import QThread, QTimer
 from PySide6.QtGui import QIcon, QAction, QCloseEvent, QKeySequence, QDropEvent, QDragEnterEvent
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QComboBox, QMenu, QMessageBox, QVBoxLayout,
-    QFileDialog, QLabel, QHBoxLayout, QWidget, QStyleFactory
+    QFileDialog, QInputDialog, QLabel, QHBoxLayout, QWidget, QStyleFactory, QToolButton, QLineEdit
 )
 
 from gui.about_dialog import About
 from gui.custom_table import CustomTable
 from gui.export_module import ExportModule
+from gui.find_replace import FindReplaceDialog
 from gui.helpers import (
+    ConvertWorker,
     FileWorker,
+    SearchIndexWorker,
+    SearchWorker,
     message_box,
     set_window_size
 )
@@ -22,9 +26,14 @@ from gui.updater import UpdateManager
 from setup import TITLE, VERSION
 from utils.app_config import app_cfg
 from utils.app_locales import fluent, ftr
-from utils.enums import FileExtension as Fe
+from utils.dump_io import get_dump_stem
+from utils.enums import CompressionFormat as Cf, FileExtension as Fe
 from utils.helpers import pathfind
 from utils.manager import manager
+from utils.term_query import QueryError
+
+DUMP_EXTENSIONS = [Fe.TXT.value, Fe.JSON.value, Fe.DAT.value]
+COMPRESSED_DUMP_EXTENSIONS = [f"{ext}{cf.value}" for ext in DUMP_EXTENSIONS for cf in Cf]
 
 
 class I2ManagerUI(QMainWindow):
@@ -32,10 +41,26 @@ class I2ManagerUI(QMainWindow):
         super().__init__()
         self.config_actions = None
         self.lang_selector = None
+        self.lang_subset_menu = None
+        # display names of the shown languages, None to show all of them
+        self.visible_languages: set[str] | None = None
         self.custom_table = None
         self.term_count = None
+        self.search_bar = None
+        self.search_timer = None
+        self.query_button = None
         self.temp_thread = None
         self.worker = None
+        self.index_thread = None
+        self.index_worker = None
+        self.index_outdated = False
+        self.search_thread = None
+        self.search_worker = None
+        # whether the search is to be applied once the index is built or the scan of the terms ends
+        self.search_pending = False
+        self.convert_action = None
+        self.convert_thread = None
+        self.convert_worker = None
 
         self.setAcceptDrops(True)
         self.setMinimumSize(900, 600)
@@ -135,6 +160,12 @@ class I2ManagerUI(QMainWindow):
         delete_action.triggered.connect(self._delete_selection)
         delete_action.setShortcut(QKeySequence.StandardKey.Delete)
 
+        find_replace_action = QAction(ftr("find-replace-button"), self)
+        find_replace_action.setIcon(QIcon.fromTheme("edit-find-replace"))
+        find_replace_action.setStatusTip(ftr("find-replace-tooltip"))
+        find_replace_action.triggered.connect(self._open_find_replace)
+        find_replace_action.setShortcut(QKeySequence.StandardKey.Replace)
+
         edit_menu.addActions([
             undo_action,
             redo_action,
@@ -143,6 +174,8 @@ class I2ManagerUI(QMainWindow):
             paste_action,
             delete_action
         ])
+        edit_menu.addSeparator()
+        edit_menu.addAction(find_replace_action)
 
         # ====== View Menu ====== #
         view_menu = menu_bar.addMenu(ftr("view-menu-title"))
@@ -164,6 +197,12 @@ class I2ManagerUI(QMainWindow):
         check_updates_startup.setStatusTip(ftr("check-updates-startup-tooltip"))
         check_updates_startup.triggered.connect(self._toggle_startup_updates)
 
+        lazy_languages = QAction(ftr("lazy-languages-button"), self)
+        lazy_languages.setCheckable(True)
+        lazy_languages.setChecked(manager.loads_languages_lazily())
+        lazy_languages.setStatusTip(ftr("lazy-languages-tooltip"))
+        lazy_languages.triggered.connect(self._toggle_lazy_languages)
+
         view_menu.addAction(refresh_table)
         view_menu.addSeparator()
         view_menu.addMenu(self.setup_theme_menu())
@@ -171,6 +210,8 @@ class I2ManagerUI(QMainWindow):
         view_menu.addSeparator()
         view_menu.addAction(check_updates_now)
         view_menu.addAction(check_updates_startup)
+        view_menu.addSeparator()
+        view_menu.addAction(lazy_languages)
 
         # ====== Tool Menu ====== #
         tool_menu = menu_bar.addMenu(ftr("tools-menu-title"))
@@ -190,11 +231,22 @@ class I2ManagerUI(QMainWindow):
         manage_langs.triggered.connect(lambda: LanguageManager(self))
         manage_langs.setShortcut(QKeySequence("Ctrl+Shift+E"))
 
+        memory_report = QAction(ftr("memory-report-button"), self)
+        memory_report.setStatusTip(ftr("memory-report-tooltip"))
+        memory_report.triggered.connect(self._open_memory_report)
+
+        self.convert_action = convert_dumps = QAction(ftr("convert-dumps-button"), self)
+        convert_dumps.setStatusTip(ftr("convert-dumps-tooltip"))
+        convert_dumps.triggered.connect(self._convert_dumps)
+
         tool_menu.addActions([
             export_translations,
             import_translations,
             manage_langs
         ])
+        tool_menu.addSeparator()
+        tool_menu.addAction(memory_report)
+        tool_menu.addAction(convert_dumps)
 
         # ====== About Action ====== #
         about_action = QAction(ftr("about-app"), self)
@@ -216,7 +268,9 @@ class I2ManagerUI(QMainWindow):
             refresh_table,
             export_translations,
             import_translations,
-            manage_langs
+            manage_langs,
+            memory_report,
+            find_replace_action
         ]
 
     def setup_recent_menu(self):
@@ -315,11 +369,41 @@ class I2ManagerUI(QMainWindow):
 
         self.lang_selector = QComboBox()
         self.lang_selector.setFixedSize(200, 25)
-        self.lang_selector.textActivated.connect(self._update_table)
+        self.lang_selector.setPlaceholderText(ftr("custom-languages"))
+        self.lang_selector.activated.connect(self._select_language)
+
+        lang_subset_button = QToolButton()
+        lang_subset_button.setText(ftr("language-subset-button"))
+        lang_subset_button.setToolTip(ftr("language-subset-tooltip"))
+        lang_subset_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
+        self.lang_subset_menu = QMenu(lang_subset_button)
+        lang_subset_button.setMenu(self.lang_subset_menu)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setFixedSize(250, 25)
+        self.search_bar.setClearButtonEnabled(True)
+        self.search_bar.setPlaceholderText(ftr("search-placeholder"))
+        self.search_bar.setToolTip(ftr("search-tooltip"))
+
+        # the search runs once the typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self._apply_search)
+        self.search_bar.textChanged.connect(self.search_timer.start)
+
+        self.query_button = QToolButton()
+        self.query_button.setText(ftr("query-mode-button"))
+        self.query_button.setToolTip(ftr("query-mode-tooltip"))
+        self.query_button.setCheckable(True)
+        self.query_button.toggled.connect(lambda _: self._apply_search())
 
         self.term_count = QLabel()
 
         controls.addWidget(self.lang_selector)
+        controls.addWidget(lang_subset_button)
+        controls.addWidget(self.search_bar)
+        controls.addWidget(self.query_button)
         controls.addStretch()
         controls.addWidget(self.term_count)
         self.main_layout.addLayout(controls)
@@ -328,7 +412,6 @@ class I2ManagerUI(QMainWindow):
         self.main_layout.addWidget(self.custom_table)
 
     def update_lang_selector(self, is_new_file=False):
-        prev_item = self.lang_selector.currentText()
         self.lang_selector.clear()
 
         languages = manager.get_displayed_languages()
@@ -336,50 +419,216 @@ class I2ManagerUI(QMainWindow):
             self.lang_selector.addItem(ftr("all-languages"))
             self.lang_selector.addItems(languages)
 
-            items = []
-            for i in range(self.lang_selector.count()):
-                items.append(self.lang_selector.itemText(i))
-
-            if prev_item in items:
-                self.lang_selector.setCurrentIndex(items.index(prev_item))
+            # languages removed since are left out, the ones added are shown only along with all of them
+            if is_new_file or self.visible_languages is None:
+                self.visible_languages = None
             else:
-                self.lang_selector.setCurrentIndex(0)
+                self.visible_languages &= set(languages)
+
+            self.update_lang_subset_menu(languages)
+
+        if is_new_file:
+            self.search_bar.blockSignals(True)
+            self.search_bar.clear()
+            self.search_bar.blockSignals(False)
 
         self._update_table(is_new_file)
-        self.term_count.setText(
-            ftr("term-count-label", {"count": manager.term_count()})
-        )
 
     def _update_table(self, new_file=False):
         if not manager.content:
             message_box(self, "warning", "warning-no-file")
             return
 
-        if self.lang_selector.currentIndex() != -1:
-            terms = manager.content.get("terms", [])
+        terms = manager.get_terms()
+        languages = manager.get_languages()
 
-            selected_index = self.lang_selector.currentIndex()
-            selected_text = self.lang_selector.currentText()
+        if new_file or self.custom_table.table_model is None:
+            self.custom_table.load_table(self, terms, languages)
+        else:
+            self.custom_table.update_table(terms, languages)
 
-            if not selected_text:
-                message_box(self, "warning", "warning-no-language-selected")
-                return
+        self._apply_visible_languages()
+        self._apply_search()
+
+    def update_lang_subset_menu(self, languages: list[str]):
+        """Fill the language subset menu with a checkable action per language.
+
+        :param languages: display names of the languages.
+        """
+        self.lang_subset_menu.clear()
+
+        show_all = QAction(ftr("all-languages"), self.lang_subset_menu)
+        show_all.triggered.connect(lambda: self._set_visible_languages(None))
+        self.lang_subset_menu.addAction(show_all)
+        self.lang_subset_menu.addSeparator()
+
+        for name in languages:
+            action = QAction(name, self.lang_subset_menu)
+            action.setCheckable(True)
+            action.toggled.connect(lambda checked, lang=name: self._toggle_visible_language(lang, checked))
+            self.lang_subset_menu.addAction(action)
 
-            all_languages = manager.get_languages()
+        self._sync_language_controls()
+
+    def _select_language(self, index: int):
+        if index == 0:
+            self._set_visible_languages(None)
+        elif index > 0:
+            self._set_visible_languages({self.lang_selector.itemText(index)})
+
+    def _toggle_visible_language(self, name: str, checked: bool):
+        if self.visible_languages is None:
+            visible = set(manager.get_displayed_languages())
+        else:
+            visible = set(self.visible_languages)
+
+        if checked:
+            visible.add(name)
+        else:
+            visible.discard(name)
 
-            if selected_index == 0:
-                lang_subset = all_languages
+        self._set_visible_languages(visible)
+
+    def _set_visible_languages(self, visible: set[str] | None):
+        if visible is not None and visible >= set(manager.get_displayed_languages()):
+            visible = None
+        if visible == self.visible_languages:
+            return
+
+        self.visible_languages = visible
+        self._sync_language_controls()
+        self._apply_visible_languages()
+
+    def _sync_language_controls(self):
+        visible = self.visible_languages
+
+        if visible is None:
+            self.lang_selector.setCurrentIndex(0)
+        elif len(visible) == 1:
+            self.lang_selector.setCurrentIndex(self.lang_selector.findText(next(iter(visible))))
+        else:
+            self.lang_selector.setCurrentIndex(-1)
+
+        for action in self.lang_subset_menu.actions():
+            if action.isCheckable():
+                action.blockSignals(True)
+                action.setChecked(visible is None or action.text() in visible)
+                action.blockSignals(False)
+
+    def _apply_visible_languages(self):
+        if self.custom_table.table_model is None:
+            return
+
+        visible = self.visible_languages
+        self.custom_table.set_visible_languages(None if visible is None else [
+            index for index, name in enumerate(manager.get_displayed_languages()) if name in visible
+        ])
+
+    def _apply_search(self):
+        self.search_timer.stop()
+        self.search_pending = False
+        if self.custom_table.table_model is None:
+            return
+
+        query = self.search_bar.text()
+        if query and self.query_button.isChecked():
+            try:
+                self.custom_table.set_row_filter(manager.query_terms(query))
+            except QueryError as e:
+                # the terms found by the last valid query are kept while it is typed
+                self.status_bar_message(("invalid-query", {"error": str(e)}), 10000)
+                return
+        elif query and manager.has_search_index():
+            self.custom_table.set_row_filter(manager.search_terms(query))
+        elif query:
+            # scanning every cell would hold up the window, the terms found before stay shown meanwhile
+            self.search_pending = True
+            if manager.indexes_search():
+                self._build_search_index()
             else:
-                lang_index = selected_index - 1
-                if 0 <= lang_index < len(all_languages):
-                    lang_subset = [all_languages[lang_index]]
-                else:
-                    lang_subset = []
-
-            if new_file:
-                self.custom_table.load_table(self, terms, lang_subset)
+                self._scan_terms()
+            return
+        else:
+            self.custom_table.set_row_filter(None)
+
+        self._update_term_count()
+
+    def _update_term_count(self):
+        total = manager.term_count()
+        filter_model = self.custom_table.filter_model
+
+        if filter_model is not None and filter_model.is_filtered():
+            self.term_count.setText(
+                ftr("term-count-filtered-label", {"count": filter_model.rowCount(), "total": total})
+            )
+        else:
+            self.term_count.setText(ftr("term-count-label", {"count": total}))
+
+    def _build_search_index(self):
+        if not manager.content or not manager.indexes_search():
+            return
+        if self.index_thread is not None:
+            self.index_outdated = True
+            return
+
+        self.index_outdated = False
+        self.index_thread = QThread()
+        self.index_worker = SearchIndexWorker()
+        self.index_worker.moveToThread(self.index_thread)
+
+        self.index_thread.started.connect(self.index_worker.build)
+        self.index_worker.finished.connect(self.index_thread.quit)
+        self.index_worker.finished.connect(self.index_worker.deleteLater)
+        self.index_thread.finished.connect(self.index_thread.deleteLater)
+        self.index_thread.finished.connect(self._on_search_index_built)
+        self.index_thread.start()
+
+    def _on_search_index_built(self):
+        self.index_thread = None
+        self.index_worker = None
+
+        # the terms were replaced or changed too much during the build
+        if self.index_outdated and not manager.has_search_index():
+            self._build_search_index()
+        elif self.search_pending:
+            if manager.has_search_index():
+                self._apply_search()
             else:
-                self.custom_table.update_table(terms, lang_subset)
+                # the index could not be built, e.g. for the lack of memory
+                self._scan_terms()
+
+    def _scan_terms(self):
+        # one scan at a time, the query typed meanwhile is searched after it
+        if self.search_thread is not None:
+            self.search_pending = True
+            return
+
+        self.search_pending = False
+        self.search_thread = QThread()
+        self.search_worker = SearchWorker(self.search_bar.text())
+        self.search_worker.moveToThread(self.search_thread)
+
+        self.search_thread.started.connect(self.search_worker.search)
+        self.search_worker.finished.connect(self._on_terms_scanned)
+        self.search_worker.finished.connect(self.search_thread.quit)
+        self.search_worker.finished.connect(self.search_worker.deleteLater)
+        self.search_thread.finished.connect(self.search_thread.deleteLater)
+        self.search_thread.finished.connect(self._on_scan_finished)
+        self.search_thread.start()
+
+    def _on_terms_scanned(self, query: str, rows: list[int] | None):
+        if rows is None or self.search_pending or query != self.search_bar.text() or self.query_button.isChecked():
+            return
+
+        self.custom_table.set_row_filter(rows)
+        self._update_term_count()
+
+    def _on_scan_finished(self):
+        self.search_thread = None
+        self.search_worker = None
+
+        if self.search_pending:
+            self._apply_search()
 
     def _undo_edit(self):
         self.custom_table.undo_edit()
@@ -399,6 +648,12 @@ class I2ManagerUI(QMainWindow):
     def _delete_selection(self):
         self.custom_table.delete_selection()
 
+    def _open_find_replace(self):
+        if self.custom_table.table_model is None:
+            return
+
+        FindReplaceDialog(self)
+
     def open_file(self, path: str):
         path = Path(path)
 
@@ -464,9 +719,11 @@ class I2ManagerUI(QMainWindow):
             message_box(self, "warning", "warning-no-file")
             return
 
-        extensions = "{} (*{});; {} (*{})".format(
+        extensions = "{} (*{});; {} (*{});; {} (*{});; {} ({})".format(
             ftr("json-file"), Fe.JSON.value,
-            ftr("text-file"), Fe.TXT.value
+            ftr("text-file"), Fe.TXT.value,
+            ftr("raw-dump-file"), Fe.DAT.value,
+            ftr("compressed-dump-file"), " ".join(f"*{ext}" for ext in COMPRESSED_DUMP_EXTENSIONS)
         )
 
         path, _ = QFileDialog.getSaveFileName(
@@ -499,7 +756,7 @@ class I2ManagerUI(QMainWindow):
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
-            valid_extensions = [Fe.TXT.value, Fe.JSON.value]
+            valid_extensions = DUMP_EXTENSIONS + COMPRESSED_DUMP_EXTENSIONS
             urls = event.mimeData().urls()
 
             for url in urls:
@@ -521,7 +778,7 @@ class I2ManagerUI(QMainWindow):
     def dropEvent(self, event: QDropEvent):
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            valid_extensions = [Fe.TXT.value, Fe.JSON.value]
+            valid_extensions = DUMP_EXTENSIONS + COMPRESSED_DUMP_EXTENSIONS
 
             for url in urls:
                 file_path = url.toLocalFile()
@@ -558,12 +815,20 @@ class I2ManagerUI(QMainWindow):
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
 
+        # the threads cannot be stopped amid the build or the scan, and are not to be destroyed running
+        if self.index_thread is not None:
+            self.index_thread.wait()
+        if self.search_thread is not None:
+            self.search_thread.wait()
+        if self.convert_thread is not None:
+            self.convert_thread.wait()
+
         event.accept()
 
     def _open_file_dialog(self):
         path, _ = QFileDialog.getOpenFileName(
             self, ftr("open-title"), "",
-            f"{ftr('dump-file')} (*{Fe.TXT.value}; *{Fe.JSON.value})"
+            f"{ftr('dump-file')} ({' '.join(f'*{ext}' for ext in DUMP_EXTENSIONS + COMPRESSED_DUMP_EXTENSIONS)})"
         )
 
         if not path:
@@ -579,6 +844,14 @@ class I2ManagerUI(QMainWindow):
             )
             self.update_lang_selector(True)
             self.configure_menu(True)
+            self._build_search_index()
+
+            duplicates = manager.get_duplicate_terms()
+            if duplicates:
+                message_box(self, "warning", ("warning-duplicate-terms", {
+                    "count": len(duplicates),
+                    "terms": ", ".join(duplicates[:10])
+                }))
         else:
             self.status_bar_message()
             message_box(self, "error", result)
@@ -587,6 +860,103 @@ class I2ManagerUI(QMainWindow):
         self.config_actions[1].setEnabled(True)
         self._refresh_ui()
 
+    def _open_memory_report(self):
+        report, total = manager.get_memory_report()
+        if not report:
+            message_box(self, "warning", "warning-no-languages")
+            return
+
+        def to_mb(size: int):
+            return round(size / 1024 / 1024, 2)
+
+        details = "\n".join(
+            ftr("info-memory-report-language-packed" if entry["packed"] else "info-memory-report-language", {
+                "language": entry["language"],
+                "unique": entry["unique"],
+                "cells": entry["cells"],
+                "size": to_mb(entry["size"]),
+                "saved": to_mb(entry["saved"])
+            })
+            for entry in report
+        )
+
+        summary = ftr("info-memory-report", {
+            "cells": total["cells"],
+            "unique": total["unique"],
+            "size": to_mb(total["size"]),
+            "saved": to_mb(total["saved"])
+        })
+        message_box(self, "information", summary, detailed_text=details, localize=False)
+
+    def _convert_dumps(self):
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, ftr("convert-dumps-title"), "",
+            f"{ftr('dump-file')} ({' '.join(f'*{ext}' for ext in DUMP_EXTENSIONS + COMPRESSED_DUMP_EXTENSIONS)})"
+        )
+
+        if not paths:
+            return
+
+        extension, accepted = QInputDialog.getItem(
+            self, ftr("convert-dumps-title"), ftr("convert-dumps-format"),
+            DUMP_EXTENSIONS + COMPRESSED_DUMP_EXTENSIONS, 0, False
+        )
+
+        if not accepted:
+            return
+
+        # converted dumps are put next to their sources, the ones already in the format are skipped
+        targets = {}
+        for path in paths:
+            source_path = Path(path)
+            target_path = source_path.with_name(f"{get_dump_stem(source_path)}{extension}")
+            if target_path != source_path:
+                targets[source_path] = target_path
+
+        existing = [str(target_path) for target_path in targets.values() if target_path.exists()]
+        if existing:
+            reply = message_box(
+                self, "question", ("question-overwrite-files", {"files": ", ".join(existing)}),
+                standard_buttons=(
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+
+        self.convert_thread = QThread()
+        self.convert_worker = ConvertWorker(targets)
+        self.convert_worker.moveToThread(self.convert_thread)
+
+        self.convert_thread.started.connect(self.convert_worker.convert)
+        self.convert_worker.converting.connect(self._on_dump_converting)
+        self.convert_worker.converted.connect(self._on_dump_converted)
+        self.convert_worker.finished.connect(self._on_dumps_converted)
+        self.convert_worker.finished.connect(self.convert_thread.quit)
+        self.convert_worker.finished.connect(self.convert_worker.deleteLater)
+        self.convert_thread.finished.connect(self.convert_thread.deleteLater)
+        self.convert_thread.finished.connect(self._on_convert_finished)
+
+        # one conversion at a time, the dumps are converted in the background
+        self.convert_action.setDisabled(True)
+        self.convert_thread.start()
+
+    def _on_dump_converting(self, file_path: str):
+        self.status_bar_message(("converting-file", {"file_path": file_path}))
+
+    def _on_dump_converted(self, file_path: str, result: Any):
+        if result is not True:
+            message_box(self, "error", result)
+
+    def _on_dumps_converted(self, converted: int):
+        self.status_bar_message(("converted-files", {"count": converted}), 10000)
+
+    def _on_convert_finished(self):
+        self.convert_thread = None
+        self.convert_worker = None
+        self.convert_action.setDisabled(False)
+
     def _open_about_dialog(self):
         about_dialog = About(self)
         about_dialog.show()
@@ -610,6 +980,10 @@ class I2ManagerUI(QMainWindow):
     def _toggle_startup_updates(checked: bool):
         app_cfg.set_config("update.check_updates_on_startup", checked)
 
+    @staticmethod
+    def _toggle_lazy_languages(checked: bool):
+        app_cfg.set_config("load.lazy_languages", checked)
+
     @staticmethod
     def _set_theme_mode(theme: str):
         try:
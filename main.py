@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import traceback
 
@@ -58,5 +59,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # lets the frozen build run the TXT dump parsing worker processes
+    multiprocessing.freeze_support()
     print("[DEBUG] main.py - Running __main__ block...")
     main()
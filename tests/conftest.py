@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generate_dump import generate_dump
+from utils.manager import I2Manager
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def open_dump(path: Path):
+    """Open the dump with a manager of its own, without the snapshot cache."""
+    manager = I2Manager()
+    result = manager.open_dump_file(path, use_cache=False)
+    assert result is True, result
+    return manager
+
+
+@pytest.fixture(scope="session")
+def large_dump(tmp_path_factory):
+    """Synthetic TXT dump of a few render chunks, see `RENDER_CHUNK_SIZE`."""
+    path = tmp_path_factory.mktemp("dumps") / "large.txt"
+    generate_dump(path, terms=3500, languages=3)
+    return path
@@ -0,0 +1,63 @@
+import pytest
+
+from tests.conftest import FIXTURES, open_dump
+from utils.enums import TermType as Tt
+from utils.manager import I2Manager
+
+# the TXT fixtures are written by `benchmarks.generate_dump`, the others are the same language source
+# saved by the manager, with and without the term descriptions
+SOURCES = ["language_source", "language_source_no_desc"]
+
+
+def model(manager: I2Manager):
+    return (
+        list(manager.get_terms().records()),
+        manager.get_languages(),
+        manager.content["metadata"],
+        manager.has_descriptions
+    )
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("suffix", ["dat", "txt", "json"])
+def test_dat_saves_byte_identical(tmp_path, source, suffix):
+    manager = open_dump(FIXTURES / f"{source}.dat")
+    path = tmp_path / f"saved.{suffix}"
+    assert manager.save_dump_file(path) is True
+    assert path.read_bytes() == (FIXTURES / f"{source}.{suffix}").read_bytes()
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("suffix", ["txt", "json"])
+def test_dat_model_matches_text_dumps(source, suffix):
+    manager = open_dump(FIXTURES / f"{source}.dat")
+    assert manager.has_descriptions == (source == "language_source")
+    assert model(manager) == model(open_dump(FIXTURES / f"{source}.{suffix}"))
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("suffix", ["dat", "txt", "json"])
+def test_transcode_from_dat(tmp_path, source, suffix):
+    path = tmp_path / f"converted.{suffix}"
+    assert I2Manager.transcode_dump_file(FIXTURES / f"{source}.dat", path) is True
+    assert path.read_bytes() == (FIXTURES / f"{source}.{suffix}").read_bytes()
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_text_dumps_save_as_dat(tmp_path, source):
+    path = tmp_path / "saved.dat"
+    assert open_dump(FIXTURES / f"{source}.txt").save_dump_file(path) is True
+    assert path.read_bytes() == (FIXTURES / f"{source}.dat").read_bytes()
+
+
+@pytest.mark.parametrize("suffix", ["dat", "txt", "json"])
+def test_added_term_saves(tmp_path, suffix):
+    manager = open_dump(FIXTURES / "language_source.dat")
+    manager.add_term("NEW", Tt.TEXT, "", None, None)
+    path = tmp_path / f"saved.{suffix}"
+    assert manager.save_dump_file(path) is True
+
+    reopened = open_dump(path)
+    term = list(reopened.get_terms().records())[-1]
+    assert term["name"] == "NEW"
+    assert term["type"] is Tt.TEXT
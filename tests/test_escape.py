@@ -0,0 +1,81 @@
+import itertools
+import re
+import sys
+
+import pytest
+
+from utils.helpers import EscapedStr, escape, escape_lazy, parse_raw_value, unescape, unescape_lazy
+
+# characters taking part in the escapes, and one taking no part
+SPECIALS = ["\\", "\n", "\r", "n", "r", "\"", "a"]
+CODE_POINTS = "".join(map(chr, range(sys.maxunicode + 1)))
+ESCAPE_SEQUENCE = re.compile(r"\\(.)", re.DOTALL)
+
+
+def reference_unescape(s: str):
+    """Single pass unescape of the strings given by `escape`, reading each escape sequence once from the left."""
+    return ESCAPE_SEQUENCE.sub(lambda m: {"n": "\n", "r": "\r"}.get(m[1], m[1]), s)
+
+
+@pytest.mark.parametrize("context", ["{}", "\\{}", "{}\\", "\\{}n", "\n{}\r", "\\\\{}\\n"])
+def test_round_trip_all_code_points(context):
+    # the code points are checked in chunks, so that a failure points near the one at fault
+    for start in range(0, len(CODE_POINTS), 0x1000):
+        text = "".join(context.format(c) for c in CODE_POINTS[start:start + 0x1000])
+        escaped = escape(text)
+        assert "\n" not in escaped and "\r" not in escaped
+        assert unescape(escaped) == text, f"code points from U+{start:04X}"
+        assert reference_unescape(escaped) == text, f"code points from U+{start:04X}"
+
+
+@pytest.mark.parametrize("length", range(1, 5))
+def test_round_trip_special_sequences(length):
+    for chars in itertools.product(SPECIALS, repeat=length):
+        text = "".join(chars)
+        assert unescape(escape(text)) == text
+        assert unescape_lazy(escape_lazy(text)) == text
+
+
+@pytest.mark.parametrize("escaped, text", [
+    ("", ""),
+    ("plain text", "plain text"),
+    ("\\\\", "\\"),
+    ("\\n", "\n"),
+    ("\\r\\n", "\r\n"),
+    ("\\\\n", "\\n"),
+    ("\\\\\\n", "\\\n"),
+    ("\\\\\\\\n", "\\\\n"),
+    ("C:\\\\new\\\\render", "C:\\new\\render"),
+    ("say \"hi\"", "say \"hi\""),
+    ("\"\\n\"", "\"\n\""),
+])
+def test_unescape_cases(escaped, text):
+    assert unescape(escaped) == text
+    assert escape(text) == escaped
+
+
+def test_unknown_escapes_are_kept():
+    assert unescape("\\\"") == "\\\""
+    assert unescape("tab\\t") == "tab\\t"
+
+
+def test_quoted_dump_values():
+    # quotes are not escaped in the dumps, only the outer pair is taken off
+    assert parse_raw_value("\"say \"hi\"\"") == "say \"hi\""
+    assert parse_raw_value("\"back\\\\nslash\\n\"") == "back\\nslash\n"
+    assert parse_raw_value("\"\"") == ""
+
+
+def test_lazy_strings():
+    plain = "nothing to escape"
+    assert escape_lazy(plain) is plain
+    assert unescape_lazy(plain) is plain
+
+    escaped = escape_lazy("line\nbreak \\n")
+    assert escaped.__class__ is EscapedStr
+    assert escaped == "line\\nbreak \\\\n"
+    assert escape_lazy(escaped) is escaped
+    assert unescape_lazy(escaped) == "line\nbreak \\n"
+
+    # strings already in the dump form are not unescaped unless they are marked as such
+    assert unescape_lazy("line\\nbreak") == "line\\nbreak"
@@ -0,0 +1,74 @@
+import io
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import utils.manager
+from tests.conftest import open_dump
+
+
+def render(manager, kind: str, workers: int):
+    manager.get_terms().clear_fragments()
+    f = io.StringIO()
+    if kind == "txt":
+        manager.write_txt_dump(f, workers=workers)
+    else:
+        manager.write_json_dump(f, compact=kind == "compact-json", workers=workers)
+    return f.getvalue()
+
+
+class BreakingPool:
+    """Process pool stand-in rendering in this process, broken after a number of chunks."""
+
+    def __init__(self, submits: int, results: int):
+        self.submits = submits
+        self.results = results
+
+    def __call__(self, *_args, **_kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def submit(self, render_chunk, chunk):
+        if self.submits == 0:
+            raise BrokenProcessPool("pool broken on submit")
+        self.submits -= 1
+
+        future = Future()
+        if self.results == 0:
+            future.set_exception(BrokenProcessPool("pool broken while rendering"))
+        else:
+            self.results -= 1
+            future.set_result(render_chunk(chunk))
+        return future
+
+
+@pytest.mark.parametrize("kind", ["txt", "json", "compact-json"])
+def test_parallel_render_matches_serial(large_dump, kind):
+    manager = open_dump(large_dump)
+    assert render(manager, kind, 2) == render(manager, kind, 0)
+
+
+def test_parallel_render_of_edited_terms_matches_serial(large_dump):
+    manager = open_dump(large_dump)
+    render(manager, "txt", 0)
+    for row in (0, 1500, len(manager.get_terms()) - 1):
+        manager.set_translation(row, 1, f"edited {row}")
+
+    f = io.StringIO()
+    manager.write_txt_dump(f, workers=2)
+    assert f.getvalue() == render(manager, "txt", 0)
+
+
+@pytest.mark.parametrize("submits, results", [(2, 2), (3, 1), (0, 0)])
+def test_broken_pool_renders_the_rest_serially(large_dump, monkeypatch, submits, results):
+    manager = open_dump(large_dump)
+    expected = render(manager, "txt", 0)
+
+    monkeypatch.setattr(utils.manager, "ProcessPoolExecutor", BreakingPool(submits, results))
+    assert render(manager, "txt", 2) == expected
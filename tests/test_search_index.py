@@ -0,0 +1,43 @@
+import pytest
+
+from tests.conftest import open_dump
+from utils.search_index import SearchIndex
+
+
+class LanguageRemovingList(list):
+    """Language columns losing the last one once the first is copied, as if it were removed meanwhile."""
+
+    def __init__(self, terms, columns):
+        super().__init__(columns)
+        self.terms = terms
+
+    def __iter__(self):
+        self.terms.remove_language(len(self.terms.translations) - 1)
+        return super().__iter__()
+
+
+@pytest.mark.parametrize("query", ["term_1", "beta", "привіт", "x = y", "line\nbreak", "1.5", "nothing like it"])
+def test_search_matches_scan(large_dump, query):
+    terms = open_dump(large_dump).get_terms()
+    index = SearchIndex(terms)
+    assert not index.is_stale()
+    assert index.search(query) == SearchIndex.scan_terms(terms, query)
+
+
+def test_search_follows_edits(large_dump):
+    manager = open_dump(large_dump)
+    terms = manager.get_terms()
+    index = SearchIndex(terms)
+
+    manager.set_translation(7, 2, "Zzyzx marker")
+    assert index.search("zzyzx") == [7]
+    manager.remove_language(0)
+    assert index.is_stale()
+
+
+def test_language_removed_during_build_leaves_index_stale(large_dump):
+    terms = open_dump(large_dump).get_terms()
+    terms.translations = LanguageRemovingList(terms, terms.translations)
+
+    index = SearchIndex(terms)
+    assert index.is_stale()
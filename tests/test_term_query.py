@@ -0,0 +1,58 @@
+import re
+
+import pytest
+
+from tests.conftest import FIXTURES, open_dump
+from utils.term_query import QueryError, unquote
+
+
+@pytest.fixture(scope="module")
+def manager():
+    manager = open_dump(FIXTURES / "language_source.txt")
+    manager.set_translation(0, 1, "say \"hi\" to C:\\new")
+    manager.set_translation(1, 1, "item 42")
+    manager.set_translation(2, 1, "two\nlines")
+    return manager
+
+
+def matching(manager, lang_index: int, predicate):
+    terms = manager.get_terms()
+    return [row for row in range(len(terms)) if predicate(terms.get_translation(row, lang_index))]
+
+
+@pytest.mark.parametrize("value, text", [
+    ("plain", "plain"),
+    ("\"two words\"", "two words"),
+    ("\"say \\\"hi\\\"\"", "say \"hi\""),
+    ("\"C:\\\\new\"", "C:\\new"),
+    ("\"\\d+\"", "\\d+"),
+    ("\"\\n\\w\"", "\\n\\w"),
+    ("\"\\\\d\"", "\\d"),
+    ("\\d+", "\\d+"),
+])
+def test_unquote(value, text):
+    assert unquote(value) == text
+
+
+@pytest.mark.parametrize("query, pattern", [
+    ("l1~\"\\d+\"", r"\d+"),
+    ("l1~\"^item \\d\"", r"^item \d"),
+    ("l1~\\d+$", r"\d+$"),
+    ("l1~\"two\\nlines\"", r"two\nlines"),
+    ("l1~\"\\\\\\\\n\"", r"\\n"),
+    ("l1~\"\\\"hi\\\"\"", r"\"hi\""),
+])
+def test_regex_values_keep_backslashes(manager, query, pattern):
+    rows = manager.query_terms(query)
+    assert rows == matching(manager, 1, re.compile(pattern).search)
+    assert rows
+
+
+def test_quoted_text_values(manager):
+    assert manager.query_terms("l1=\"say \\\"hi\\\" to C:\\\\new\"") == [0]
+    assert manager.query_terms("l1=\"item 42\" or l1=\"nothing like it\"") == [1]
+
+
+def test_invalid_regex(manager):
+    with pytest.raises(QueryError):
+        manager.query_terms("l1~\"(\"")
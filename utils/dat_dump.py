@@ -0,0 +1,239 @@
+import struct
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+from utils.enums import TermType as Tt
+
+# UABEA raw dumps are the serialized MonoBehaviour data, little-endian and aligned to 4 bytes
+INT32 = struct.Struct("<i")
+FLOAT = struct.Struct("<f")
+# UInt8 fields flagged for alignment, followed by 3 padding bytes
+ALIGNED_UINT8 = struct.Struct("<B3x")
+# m_FileID and m_PathID
+PPTR = struct.Struct("<iq")
+
+
+class DatReader:
+    """Reader of the UABEA raw dump fields, in the order they are serialized.
+
+    Values are unpacked straight from a memory view of the dump data, only the strings are decoded.
+    """
+    __slots__ = ("view", "pos")
+
+    def __init__(self, data: bytes | memoryview, pos: int = 0):
+        """
+        :param data: raw dump data.
+        :param pos: byte offset to start reading from.
+        """
+        self.view = memoryview(data)
+        self.pos = pos
+
+    def at_end(self):
+        return self.pos == len(self.view)
+
+    def read_int(self):
+        value, = INT32.unpack_from(self.view, self.pos)
+        self.pos += 4
+        return value
+
+    def read_float(self):
+        value, = FLOAT.unpack_from(self.view, self.pos)
+        self.pos += 4
+        return value
+
+    def read_uint8(self):
+        value, = ALIGNED_UINT8.unpack_from(self.view, self.pos)
+        self.pos += 4
+        return value
+
+    def read_pptr(self):
+        file_id, path_id = PPTR.unpack_from(self.view, self.pos)
+        self.pos += 12
+        return {"m_FileID": file_id, "m_PathID": path_id}
+
+    def read_string(self):
+        size, = INT32.unpack_from(self.view, self.pos)
+        start = self.pos + 4
+        end = start + size
+        if size < 0 or end > len(self.view):
+            raise ValueError(f"invalid string size {size} at {self.pos}")
+
+        self.pos = (end + 3) & ~3
+        return str(self.view[start:end], "utf-8")
+
+    def read_count(self):
+        count = self.read_int()
+        if count < 0 or count > len(self.view) - self.pos:
+            raise ValueError(f"invalid array size {count} at {self.pos - 4}")
+        return count
+
+    def read_string_array(self):
+        # inlined `read_string`, as the translations are most of the dump
+        view = self.view
+        limit = len(view)
+        unpack_from = INT32.unpack_from
+        count = self.read_count()
+        pos = self.pos
+        values = []
+
+        for _ in range(count):
+            size, = unpack_from(view, pos)
+            start = pos + 4
+            end = start + size
+            if size < 0 or end > limit:
+                raise ValueError(f"invalid string size {size} at {pos}")
+
+            values.append(str(view[start:end], "utf-8"))
+            pos = (end + 3) & ~3
+
+        self.pos = pos
+        return values
+
+    def read_uint8_array(self):
+        count = self.read_count()
+        start = self.pos
+        self.pos = (start + count + 3) & ~3
+        return self.view[start:start + count].tolist()
+
+    def read_array(self, read_item: Callable[[], Any]):
+        return [read_item() for _ in range(self.read_count())]
+
+
+def read_dat_dump(
+        data: bytes | memoryview,
+        has_descriptions: bool = False,
+        item_parsers: dict[str, Callable[[dict], Any]] | None = None
+):
+    """Read the UABEA raw dump of the I2 `LanguageSource` MonoBehaviour.
+
+    :param data: raw dump data.
+    :param has_descriptions: whether the terms have descriptions serialized.
+    :param item_parsers: functions to convert the elements of the named arrays with,
+        e.g. `{"mTerms": parse_term}`, the same as of `build_txt_tree`.
+    :return: UABEA JSON dump content.
+    :raise ValueError: if the data does not match the layout, or it is not read to its end.
+    """
+    item_parsers = item_parsers or {}
+    parse_term = item_parsers.get("mTerms")
+    parse_language = item_parsers.get("mLanguages")
+    reader = DatReader(data)
+
+    def read_term():
+        term = {
+            "Term": reader.read_string(),
+            "TermType": reader.read_int()
+        }
+
+        if has_descriptions:
+            term["Description"] = reader.read_string()
+
+        term["Languages"] = {"Array": reader.read_string_array()}
+        term["Flags"] = {"Array": reader.read_uint8_array()}
+        term["Languages_Touch"] = {"Array": reader.read_string_array()}
+        return parse_term(term) if parse_term is not None else term
+
+    def read_language():
+        language = {
+            "Name": reader.read_string(),
+            "Code": reader.read_string(),
+            "Flags": reader.read_uint8()
+        }
+        return parse_language(language) if parse_language is not None else language
+
+    try:
+        content = {
+            "m_GameObject": reader.read_pptr(),
+            "m_Enabled": reader.read_uint8(),
+            "m_Script": reader.read_pptr(),
+            "m_Name": reader.read_string()
+        }
+
+        content["mSource"] = {
+            "UserAgreesToHaveItOnTheScene": reader.read_uint8(),
+            "UserAgreesToHaveItInsideThePluginsFolder": reader.read_uint8(),
+            "GoogleLiveSyncIsUptoDate": reader.read_uint8(),
+            "mTerms": {"Array": reader.read_array(read_term)},
+            "CaseInsensitiveTerms": reader.read_uint8(),
+            "OnMissingTranslation": reader.read_int(),
+            "mTerm_AppName": reader.read_string(),
+            "mLanguages": {"Array": reader.read_array(read_language)},
+            "IgnoreDeviceLanguage": reader.read_uint8(),
+            "_AllowUnloadingLanguages": reader.read_int(),
+            "Google_WebServiceURL": reader.read_string(),
+            "Google_SpreadsheetKey": reader.read_string(),
+            "Google_SpreadsheetName": reader.read_string(),
+            "Google_LastUpdatedVersion": reader.read_string(),
+            "GoogleUpdateFrequency": reader.read_int(),
+            "GoogleInEditorCheckFrequency": reader.read_int(),
+            "GoogleUpdateSynchronization": reader.read_int(),
+            "GoogleUpdateDelay": reader.read_float(),
+            "Assets": {"Array": reader.read_array(reader.read_pptr)}
+        }
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"invalid raw dump data: {str(e)}") from e
+
+    if not reader.at_end():
+        raise ValueError(f"invalid raw dump data: {len(reader.view) - reader.pos} bytes left unread")
+
+    return content
+
+
+def pack_uint8(value: int):
+    return ALIGNED_UINT8.pack(value)
+
+
+def pack_int(value: int):
+    return INT32.pack(value)
+
+
+def pack_float(value: float):
+    return FLOAT.pack(value)
+
+
+def pack_pptr(pptr: dict):
+    return PPTR.pack(pptr["m_FileID"], pptr["m_PathID"])
+
+
+def pack_string(value: str):
+    data = value.encode("utf-8")
+    return INT32.pack(len(data)) + data + b"\0" * (-len(data) & 3)
+
+
+def _pack_string_array(values: list[str]):
+    parts = [INT32.pack(len(values))]
+    for value in values:
+        data = value.encode("utf-8")
+        parts += (INT32.pack(len(data)), data, b"\0" * (-len(data) & 3))
+    return parts
+
+
+def render_dat_terms(terms: Iterable[dict], has_descriptions: bool = False) -> Iterator[bytes]:
+    """Render the terms as the `mTerms` array items of the UABEA raw dump.
+
+    :param terms: custom term dictionaries, with the translations and touches unescaped
+        as given by `TermStore.records()`.
+    :param has_descriptions: whether to write the term descriptions.
+    :return: generator of raw dump chunks, one per term.
+    """
+    for term in terms:
+        parts = [pack_string(term["name"]), INT32.pack(Tt.get_value(term["type"]))]
+
+        if has_descriptions:
+            parts.append(pack_string(term["desc"]))
+
+        flags = term["flags"]
+        parts += _pack_string_array(term["translations"])
+        parts += (INT32.pack(len(flags)), bytes(flags), b"\0" * (-len(flags) & 3))
+        parts += _pack_string_array(term["languages_touch"])
+
+        yield b"".join(parts)
+
+
+def write_dat_items(f: BinaryIO, items: Iterable[bytes], count: int):
+    """Write the array of the UABEA raw dump.
+
+    :param f: writable binary stream.
+    :param items: packed array items.
+    :param count: number of the items.
+    """
+    f.write(INT32.pack(count))
+    f.writelines(items)
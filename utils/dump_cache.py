@@ -0,0 +1,130 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from utils.app_config import app_cfg
+
+# bump whenever the parsed data layout changes, so stale snapshots are never loaded
+CACHE_VERSION = 4
+HASH_PREFIX_SIZE = 1024 * 1024
+
+
+class DumpCache:
+    """Cache of parsed dumps, stored as pickled snapshots under the app directory.
+
+    Snapshots are keyed by the dump path, size, modification time and a hash of its first megabyte.
+    The least recently used ones are removed once the cache grows past `cache.max_size_mb`.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        :param cache_dir: directory to keep the snapshots in.
+        """
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def is_enabled():
+        return bool(app_cfg.get_config("cache.enabled", True))
+
+    @staticmethod
+    def max_size():
+        return int(app_cfg.get_config("cache.max_size_mb", 1024)) * 1024 * 1024
+
+    def get_snapshot_path(self, path: Path):
+        """Get the snapshot path of the dump in its current state.
+
+        :param path: path to the dump file.
+        :return: path to the snapshot file.
+        """
+        stat = path.stat()
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|".encode("utf-8"))
+
+        with open(path, "rb") as f:
+            key.update(f.read(HASH_PREFIX_SIZE))
+
+        return self.cache_dir / f"{key.hexdigest()}.pickle"
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        """Load the snapshot of the dump.
+
+        :param path: path to the dump file.
+        :return: snapshot data if there is an up-to-date one. Otherwise, None.
+        """
+        if not self.is_enabled():
+            return None
+
+        try:
+            snapshot_path = self.get_snapshot_path(path)
+            if not snapshot_path.is_file():
+                return None
+
+            with open(snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+
+            # keep the recently used snapshots from being evicted
+            os.utime(snapshot_path)
+            return snapshot
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError) as e:
+            print(f"[CACHE] Could not load the snapshot of {path}: {str(e)}")
+            return None
+
+    def store(self, path: Path, snapshot: dict[str, Any]):
+        """Store the snapshot of the dump and evict the least recently used ones over the size limit.
+
+        :param path: path to the dump file.
+        :param snapshot: picklable data to store.
+        """
+        if not self.is_enabled():
+            return
+
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            snapshot_path = self.get_snapshot_path(path)
+            temp_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+
+            with open(temp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=5)
+            os.replace(temp_path, snapshot_path)
+
+            self.evict(keep=snapshot_path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"[CACHE] Could not store the snapshot of {path}: {str(e)}")
+        finally:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+    def evict(self, keep: Path | None = None):
+        """Remove the least recently used snapshots until the cache fits its size limit.
+
+        :param keep: snapshot to never remove, e.g. the one just stored.
+        """
+        snapshots = []
+        for snapshot_path in self.cache_dir.glob("*.pickle"):
+            try:
+                stat = snapshot_path.stat()
+            except OSError:
+                continue
+            snapshots.append((stat.st_mtime, stat.st_size, snapshot_path))
+
+        total_size = sum(size for _, size, _ in snapshots)
+        limit = self.max_size()
+
+        for _, size, snapshot_path in sorted(snapshots, key=lambda x: x[0]):
+            if total_size <= limit:
+                break
+            if snapshot_path == keep:
+                continue
+            snapshot_path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self):
+        """Remove all the snapshots."""
+        for snapshot_path in self.cache_dir.glob("*.pickle"):
+            snapshot_path.unlink(missing_ok=True)
+
+
+dump_cache = DumpCache(app_cfg.app_dir / "cache")
@@ -0,0 +1,71 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO
+
+from utils.app_config import app_cfg
+from utils.enums import CompressionFormat as Cf, FileExtension as Fe
+
+# raised on the corrupted or truncated compressed data, besides `OSError`
+DECOMPRESSION_ERRORS = (EOFError, lzma.LZMAError)
+
+
+def get_compression_level():
+    """Get the configured compression level of the saved dumps, `compression.level` clamped to 1-9."""
+    return min(max(int(app_cfg.get_config("compression.level", 6)), 1), 9)
+
+
+def parse_dump_suffix(path: Path):
+    """Parse the dump format and the compression format from the file suffixes, e.g. `.txt.gz`.
+
+    :param path: path to the dump file.
+    :return: `(file extension, compression format)` tuple, compression format is None for plain files.
+    :raise KeyError: if the suffix is not of a known format.
+    """
+    compression = None
+    if path.suffix.lstrip(".").upper() in Cf.__members__:
+        compression = Cf.parse(path.suffix)
+        path = path.with_suffix("")
+
+    return Fe.parse(path.suffix), compression
+
+
+def get_dump_stem(path: Path):
+    """Get the file name without the dump and the compression suffixes.
+
+    :param path: path to the dump file.
+    :return: file name stem.
+    """
+    if path.suffix.lstrip(".").upper() in Cf.__members__:
+        path = path.with_suffix("")
+    return path.stem
+
+
+def open_dump(path: Path, mode: str, compression: Cf | None = None, level: int | None = None) -> IO:
+    """Open the dump file, streaming through the decompressor or the compressor if it is compressed.
+
+    :param path: path to the file.
+    :param mode: `open` mode, `r`, `w`, `rb` or `wb`. Text modes use UTF-8.
+    :param compression: compression format of the file, None for plain files.
+    :param level: compression level to write with, the configured one if None.
+    :return: file object.
+    """
+    binary = "b" in mode
+    encoding = None if binary else "utf-8"
+
+    if compression is None:
+        return open(path, mode, encoding=encoding)
+
+    mode = mode if binary else f"{mode.rstrip('t')}t"
+    if mode.startswith("r"):
+        kwargs = {}
+    else:
+        level = get_compression_level() if level is None else level
+        kwargs = {"preset": level} if compression is Cf.XZ else {"compresslevel": level}
+
+    if compression is Cf.GZ:
+        return gzip.open(path, mode, encoding=encoding, **kwargs)
+    if compression is Cf.XZ:
+        return lzma.open(path, mode, encoding=encoding, **kwargs)
+    return bz2.open(path, mode, encoding=encoding, **kwargs)
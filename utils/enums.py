@@ -41,6 +41,18 @@ class FileExtension(Enum):
     TSV = ".tsv"
     TXT = ".txt"
     JSON = ".json"
+    DAT = ".dat"
+
+    @classmethod
+    def parse(cls, s: str):
+        return cls[s.lstrip(".").upper()]
+
+
+@unique
+class CompressionFormat(Enum):
+    GZ = ".gz"
+    XZ = ".xz"
+    BZ2 = ".bz2"
 
     @classmethod
     def parse(cls, s: str):
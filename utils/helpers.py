@@ -19,7 +19,46 @@ def pathfind(relative: str):
     return str(base / relative)
 
 
-def check_language(name: str, code: str | None, flags: "Ldf", langs: list[dict]):
+class LanguageIndex:
+    """Index of the languages by their lowercased codes and names."""
+
+    def __init__(self, languages: typing.Iterable[dict] = ()):
+        """
+        :param languages: language dictionaries, indexed by their position.
+        """
+        self.codes: dict[str, int] = {}
+        self.names: dict[str, int] = {}
+        for index, lang in enumerate(languages):
+            self.add(index, lang)
+
+    def add(self, index: int, lang: dict):
+        """Add a language to the index, earlier entries are kept for the duplicates.
+
+        :param index: index of the language.
+        :param lang: language dictionary.
+        """
+        code = lang.get("code")
+        if code:
+            self.codes.setdefault(code.lower(), index)
+        self.names.setdefault(lang["name"].lower(), index)
+
+    def find(self, name: str | None = None, code: str | None = None):
+        """Find the language by its code or, if none has it, by its name. Both are case-insensitive.
+
+        :param name: language name.
+        :param code: language code.
+        :return: index of the language if found. Otherwise, -1.
+        """
+        if code:
+            index = self.codes.get(code.lower())
+            if index is not None:
+                return index
+        if name:
+            return self.names.get(name.lower(), -1)
+        return -1
+
+
+def check_language(name: str, code: str | None, flags: "Ldf", langs: "list[dict] | LanguageIndex"):
     restricted_fields = {"key", "type", "desc"}
 
     if not name or flags is None:
@@ -33,11 +72,11 @@ def check_language(name: str, code: str | None, flags: "Ldf", langs: list[dict])
 
     lang_display = f"{name} [{code}]" if code else name
 
-    for lang in langs:
-        name_match = lang["name"].lower() == name.lower()
-        code_match = code and lang.get("code", "").lower() == code.lower()
-        if name_match or code_match:
-            return "warning", ("warning-language-exists", {"language": lang_display})
+    if not isinstance(langs, LanguageIndex):
+        langs = LanguageIndex(langs)
+
+    if name.lower() in langs.names or (code and code.lower() in langs.codes):
+        return "warning", ("warning-language-exists", {"language": lang_display})
 
     return None, None
 
@@ -64,32 +103,63 @@ def escape(s: str):
     if not s:
         return ""
 
-    replacements = {
-        "\\": "\\\\",  # backslash
-        "\n": "\\n",  # new line
-        "\r": "\\r",  # carriage return
-    }
+    # most strings have nothing to escape
+    if "\\" not in s and "\n" not in s and "\r" not in s:
+        return s
+
+    # backslashes go first, so the ones added after are never escaped twice
+    return s.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
 
-    for actual, escaped in replacements.items():
-        s = s.replace(actual, escaped)
 
-    return s
+def _unescape_part(s: str):
+    if "\\" not in s:
+        return s
+
+    return s.replace("\\n", "\n").replace("\\r", "\r")
 
 
 def unescape(s: str):
     if not s:
         return ""
 
-    replacements = {
-        "\\r": "\r",  # carriage return
-        "\\n": "\n",  # new line
-        "\\\\": "\\"  # backslash
-    }
+    if "\\" not in s:
+        return s
+
+    if "\\\\" not in s:
+        return _unescape_part(s)
+
+    # split off the escaped backslashes first, so `\\n` stays a backslash followed by `n`
+    return "\\".join(map(_unescape_part, s.split("\\\\")))
+
+
+class EscapedStr(str):
+    """String in its escaped dump form, unescaped only once it is read with `unescape_lazy`.
+
+    Strings with nothing to escape are the same in both forms, so they are never wrapped.
+    """
+    __slots__ = ()
+
+
+def escape_lazy(s: str):
+    """Get the string in its escaped dump form.
+
+    :param s: unescaped string or an `EscapedStr`, which is returned as is.
+    :return: `EscapedStr` if escaping changes the string. Otherwise, the string itself.
+    """
+    if s.__class__ is EscapedStr:
+        return s
+
+    escaped = escape(s)
+    return s if escaped == s else EscapedStr(escaped)
+
 
-    for escaped, actual in replacements.items():
-        s = s.replace(escaped, actual)
+def unescape_lazy(s: str):
+    """Get the string back from its escaped dump form.
 
-    return s
+    :param s: string given by `escape_lazy` or parsed with lazy strings.
+    :return: unescaped string.
+    """
+    return unescape(s) if s.__class__ is EscapedStr else s
 
 
 def parse_raw_value(value: str):
@@ -0,0 +1,220 @@
+import json
+from itertools import islice
+from typing import Any, Callable, Iterator, TextIO
+
+JSON_BATCH_SIZE = 256
+JSON_READ_SIZE = 1024 * 1024
+JSON_WHITESPACE = " \t\n\r"
+
+
+class JsonFragment(str):
+    """Value already encoded as JSON by `encode_json_fragment`, written as it is by `iter_json_chunks`."""
+    __slots__ = ()
+
+
+def encode_json_fragment(value: Any, indent: int | None = 2):
+    """Encode the value as JSON at the top level, to be put in place of it by `iter_json_chunks`.
+
+    :param value: value to encode.
+    :param indent: indentation level of the JSON, None for the compact output.
+    :return: encoded value.
+    """
+    separators = (",", ":") if indent is None else (",", ": ")
+    return JsonFragment(json.dumps(value, ensure_ascii=False, indent=indent, separators=separators))
+
+
+def _is_streamed(value: Any):
+    if isinstance(value, (Iterator, JsonFragment)):
+        return True
+    if isinstance(value, dict):
+        return any(_is_streamed(item) for item in value.values())
+    return False
+
+
+def iter_json_chunks(value: Any, indent: int | None = 2, level: int = 0) -> Iterator[str]:
+    """Incrementally encode the value as JSON.
+
+    Iterators are encoded as arrays in batches of `JSON_BATCH_SIZE` items, dictionaries containing them
+    member by member. `JsonFragment` values are put as they are, only indented to their level.
+    Everything else is encoded in one go. The joined output is identical to
+    `json.dumps(value, ensure_ascii=False, indent=indent)` with the iterators given as lists
+    and the fragments decoded, except that no indent means the most compact separators.
+
+    :param value: value to encode.
+    :param indent: indentation level of the JSON, None for the compact output.
+    :param level: nesting level of the value.
+    :return: generator of JSON chunks.
+    """
+    if indent is None:
+        separators = (",", ":")
+        outer = inner = ""
+    else:
+        separators = (",", ": ")
+        outer = "\n" + " " * (indent * level)
+        inner = outer + " " * indent
+
+    if isinstance(value, JsonFragment):
+        # encoded strings never contain new lines, so only the indentation ones are replaced
+        yield value.replace("\n", outer) if level and indent is not None else value
+        return
+
+    if not _is_streamed(value):
+        text = json.dumps(value, ensure_ascii=False, indent=indent, separators=separators)
+        # encoded strings never contain new lines, so only the indentation ones are replaced
+        yield text.replace("\n", outer) if level and indent is not None else text
+        return
+
+    if isinstance(value, dict):
+        delimiter = "{"
+        for key, item in value.items():
+            yield delimiter + inner + json.dumps(key, ensure_ascii=False) + separators[1]
+            yield from iter_json_chunks(item, indent, level + 1)
+            delimiter = separators[0]
+        yield "{}" if delimiter == "{" else outer + "}"
+        return
+
+    # one encoder call per item is noticeably slower than per batch
+    delimiter = "["
+    items = iter(value)
+    while batch := list(islice(items, JSON_BATCH_SIZE)):
+        if any(_is_streamed(item) for item in batch):
+            for item in batch:
+                yield delimiter + inner
+                yield from iter_json_chunks(item, indent, level + 1)
+                delimiter = separators[0]
+            continue
+
+        # strip the brackets off the encoded batch to join it with the previous ones
+        text = "".join(iter_json_chunks(batch, indent, level))
+        yield delimiter + text[1:-len(outer) - 1]
+        delimiter = separators[0]
+    yield "[]" if delimiter == "[" else outer + "]"
+
+
+class _JsonReader:
+    """Reader of the JSON values from a text stream, keeping only the unread part of it in memory."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self, size: int = JSON_READ_SIZE):
+        """Drop the read part of the buffer and read more of the stream.
+
+        :param size: number of characters to read at least.
+        :return: False if the stream is read to its end, True otherwise.
+        """
+        if self.eof:
+            return False
+
+        chunk = self.f.read(max(size, JSON_READ_SIZE))
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return not self.eof
+
+    def peek(self):
+        """Skip the whitespace and get the next character, empty string at the end of the stream."""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            self.pos = pos
+
+            if pos < length:
+                return buffer[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self):
+        """Decode the next value as a whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # the value may continue past the buffer, read more and try again
+                if not self.fill(len(self.buffer)):
+                    raise
+                continue
+
+            # a number at the end of the buffer may continue past it
+            if end == len(self.buffer) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+
+def load_json_dump(f: TextIO, item_parsers: dict[str, Callable[[dict], Any]] | None = None):
+    """Incrementally parse the UABEA JSON dump from a text stream.
+
+    Only the objects on the way to the named arrays are parsed member by member,
+    everything else is decoded in one go as it is read.
+
+    :param f: readable text stream, e.g. an opened file.
+    :param item_parsers: functions to convert the elements of the named arrays with,
+        e.g. `{"mTerms": parse_term}`, the same as of `build_txt_tree`.
+        Each element is converted as soon as it is read, so the whole array is never kept in its JSON form.
+    :return: UABEA JSON dump content.
+    :raise json.JSONDecodeError: if the stream is not valid JSON.
+    """
+    item_parsers = item_parsers or {}
+    reader = _JsonReader(f)
+
+    def parse_object(name: str):
+        result = {}
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+            return result
+
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            char = reader.peek()
+            if char == "{":
+                result[key] = parse_object(key)
+            elif char == "[" and key == "Array" and name in item_parsers:
+                result[key] = parse_array(item_parsers[name])
+            else:
+                result[key] = reader.value()
+
+            char = reader.peek()
+            reader.pos += 1
+            if char == "}":
+                return result
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+    def parse_array(parser: Callable[[dict], Any]):
+        result = []
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+            return result
+
+        while True:
+            result.append(parser(reader.value()))
+
+            char = reader.peek()
+            reader.pos += 1
+            if char == "]":
+                return result
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+    content = parse_object("")
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
+    return content
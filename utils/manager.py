@@ -1,9 +1,29 @@
-import json
+import io
+import multiprocessing
+import os
 import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
 from copy import deepcopy
+from functools import partial
+from itertools import chain, count, islice
 from pathlib import Path
-from typing import Any
-
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping, Sequence, TextIO
+
+from utils.dat_dump import (
+    read_dat_dump,
+    render_dat_terms,
+    write_dat_items,
+    pack_float,
+    pack_int,
+    pack_pptr,
+    pack_string,
+    pack_uint8
+)
+from utils.dump_cache import dump_cache
+from utils.dump_io import DECOMPRESSION_ERRORS, get_dump_stem, open_dump, parse_dump_suffix
 from utils.enums import (
     FileExtension as Fe,
     TermType as Tt,
@@ -13,40 +33,99 @@ from utils.enums import (
     MissingTranslationAction as Mta,
     AllowUnloadLanguages as Aul
 )
+from utils.app_config import app_cfg
+from utils.json_dump import encode_json_fragment, iter_json_chunks, load_json_dump
 from utils.helpers import (
     escape,
-    parse_raw_value,
-    InvalidExtensionError
+    InvalidExtensionError,
+    LanguageIndex
 )
+from utils.records import LanguageRecord, TermRecord
+from utils.search_index import SearchIndex
+from utils.term_query import TermQuery
+from utils.term_store import TermSpool, TermStore
+from utils.text_replace import find_replacements
+from utils.txt_dump import (
+    iter_txt_dump,
+    build_txt_tree,
+    render_txt_term_fragments,
+    render_txt_fragments_chunk,
+    split_txt_terms,
+    parse_txt_terms_range
+)
+
+# smaller TXT dumps are parsed faster than the worker processes start
+PARALLEL_PARSE_MIN_SIZE = 32 * 1024 * 1024
+# the same for the terms rendered on save
+PARALLEL_RENDER_MIN_TERMS = 20000
+RENDER_CHUNK_SIZE = 1000
 
 
 class I2Manager:
     def __init__(self):
         self.file_name: str = ""
         self.file_path: Path = Path()
-        self.backup: dict[str, Any] = {}
         self.content: dict[str, Any] = {}
         self.has_descriptions: bool = False
+        self._language_index: LanguageIndex | None = None
+        self.search_index: SearchIndex | None = None
+
+        # every change gets a new revision, undone changes restore the one they started from
+        self._revisions = count(1)
+        self.revision: int = 0
+        self.saved_revision: int = 0
 
     def is_modified(self):
         """Check whether the data is modified or not.
 
         :return: True if modified, False otherwise.
         """
-        return self.content != self.backup
+        return self.revision != self.saved_revision
+
+    def mark_modified(self, revision: int | None = None):
+        """Move the data to another revision.
 
-    def make_backup(self):
-        """Make the backup of the data."""
-        self.backup = deepcopy(self.content)
+        :param revision: revision to restore, e.g. by undoing a change. A new one is made if None.
+        :return: current revision.
+        """
+        self.revision = next(self._revisions) if revision is None else revision
+        return self.revision
 
-    def get_terms(self):
-        """Get the terms' dictionaries list."""
-        return self.content.get("terms", [])
+    def mark_saved(self):
+        """Mark the current revision of the data as the saved one."""
+        self.saved_revision = self.revision
+
+    def get_terms(self) -> TermStore:
+        """Get the terms' store."""
+        terms = self.content.get("terms")
+        return TermStore() if terms is None else terms
 
     def term_count(self):
         """Get the number of terms."""
         return len(self.get_terms())
 
+    def get_term_index(self, name: str):
+        """Get the index of the term given its name.
+
+        Names are compared case-insensitively if the dump has `CaseInsensitiveTerms` set.
+        """
+        return self.get_terms().find(name)
+
+    def get_duplicate_terms(self):
+        """Get a list of the term names used by more than one term."""
+        return self.get_terms().duplicate_names()
+
+    def get_memory_report(self):
+        """Get the memory taken by the translations.
+
+        :return: `TermStore.memory_report` tuple, with the `language` name added to the per-language dictionaries.
+        """
+        languages = self.get_languages()
+        report, total = self.get_terms().memory_report()
+        for index, entry in enumerate(report):
+            entry["language"] = languages[index]["name"] if index < len(languages) else str(index)
+        return report, total
+
     def update_file_info(self, file_path: Path | str):
         """Update stored file path and name from the given path.
 
@@ -56,22 +135,46 @@ class I2Manager:
             file_path = Path(file_path)
 
         self.file_path = file_path
-        self.file_name = file_path.stem
+        self.file_name = get_dump_stem(file_path)
 
     def get_languages(self):
-        """Get the languages' dictionaries list."""
+        """Get the languages' records list."""
         return self.content.get("languages", [])
 
     def get_languages_copy(self):
-        """Get the copy of languages' dictionaries list."""
+        """Get the copy of languages' records list."""
         return deepcopy(self.content.get("languages", []))
 
+    def set_languages(self, languages: Iterable[Mapping]):
+        """Replace the languages' records in place.
+
+        :param languages: new language records or dictionaries.
+        """
+        languages = [LanguageRecord.from_mapping(lang) for lang in languages]
+        current = self.content.setdefault("languages", [])
+        if languages != current:
+            current[:] = languages
+            self._language_index = None
+            self.mark_modified()
+
+    def get_language_lookup(self):
+        """Get the index of the languages by their lowercased codes and names, built on demand."""
+        if self._language_index is None:
+            self._language_index = LanguageIndex(self.get_languages())
+        return self._language_index
+
     def get_language_index(self, code: str):
-        """Get the index of the language given its code."""
-        for idx, lang in enumerate(self.get_languages()):
-            if lang["code"] == code:
-                return idx
-        return -1
+        """Get the index of the language given its code, case-insensitively."""
+        return self.get_language_lookup().find(code=code) if code else -1
+
+    def find_language(self, name: str | None = None, code: str | None = None):
+        """Find the language by its code or, if none has it, by its name. Both are case-insensitive.
+
+        :param name: language name.
+        :param code: language code.
+        :return: index of the language if found. Otherwise, -1.
+        """
+        return self.get_language_lookup().find(name, code)
 
     def get_displayed_languages(self):
         """Get a list of display names of the languages. E.g. `English [en]`."""
@@ -86,23 +189,15 @@ class I2Manager:
         :param from_index: source language index.
         :param to_index: target language index.
         """
-        terms = self.get_terms()
         languages = self.get_languages()
 
-        for term in terms:
-            translations = term["translations"]
-            flags = term["flags"]
-
-            if 0 <= from_index < len(translations):
-                translation = translations.pop(from_index)
-                translations.insert(to_index, translation)
-
-            if 0 <= from_index < len(flags):
-                flag = flags.pop(from_index)
-                flags.insert(to_index, flag)
+        self.get_terms().move_language(from_index, to_index)
 
         if 0 <= from_index < len(languages):
             languages.insert(to_index, languages.pop(from_index))
+            self._language_index = None
+
+        self.mark_modified()
 
     def add_term(self, *term_info):
         """Add a term to the `terms` list.
@@ -113,17 +208,18 @@ class I2Manager:
             new_term = term_info
         else:
             num_langs = len(self.get_languages())
-            new_term = {
-            "name": term_info[0],
-            "type": term_info[1].displayed,
-            "desc": term_info[2],
-            "translations": term_info[3] if term_info[3] else [term_info[0]] * num_langs,
-            "flags": term_info[4] if term_info[4] else [0] * num_langs
-            }
+            new_term = TermRecord(
+                term_info[0],
+                Tt(Tt.get_value(term_info[1])),
+                term_info[2],
+                term_info[3] if term_info[3] else [term_info[0]] * num_langs,
+                term_info[4] if term_info[4] else [0] * num_langs
+            )
 
         terms = self.get_terms()
         terms.append(new_term)
-        return len(terms) - 1, new_term
+        self.mark_modified()
+        return len(terms) - 1, terms[-1]
 
     def add_translation(self, term_index: int, lang_index: int, translation: Any, flags: int):
         """Add the translation and its flag for a given term and language.
@@ -144,9 +240,8 @@ class I2Manager:
         """
         terms = self.get_terms()
         if lang_index is not None and 0 <= term_index < len(terms):
-            translations = terms[term_index]["translations"]
-            if 0 <= lang_index < len(translations):
-                return translations[lang_index]
+            if 0 <= lang_index < terms.language_count():
+                return terms.get_translation(term_index, lang_index)
         return ""
 
     def set_translation(self, term_index: int, lang_index: int, value: str):
@@ -158,14 +253,37 @@ class I2Manager:
         """
         terms = self.get_terms()
 
-        if 0 <= term_index < len(terms):
-            translations = terms[term_index]["translations"]
-            if 0 <= lang_index < len(translations):
-                translations[lang_index] = value
-            else:
-                while len(translations) <= lang_index:
-                    translations.append("")
-                translations[lang_index] = value
+        if 0 <= term_index < len(terms) and lang_index >= 0:
+            terms.ensure_languages(lang_index + 1)
+            terms.set_translation(term_index, lang_index, value)
+            self.mark_modified()
+
+    def set_translations(self, lang_index: int, term_indexes: Sequence[int], values: Sequence[str]):
+        """Set the translations of many terms for a given language, as a single change.
+
+        :param lang_index: index of the language in the `languages` list.
+        :param term_indexes: indexes of the terms in the `terms` list.
+        :param values: string values to set, one per term.
+        """
+        terms = self.get_terms()
+
+        if lang_index >= 0 and term_indexes:
+            terms.ensure_languages(lang_index + 1)
+            terms.set_translations(lang_index, term_indexes, values)
+            self.mark_modified()
+
+    def find_replacements(self, pattern: re.Pattern, replacement: str, lang_indexes: Iterable[int]):
+        """Find the translations changed by replacing the matches of the pattern, see `find_replacements`.
+
+        The terms are only read, so it may run in a background thread while they are not edited.
+
+        :param pattern: compiled pattern to find.
+        :param replacement: replacement template, with the group references as of `re.sub`.
+        :param lang_indexes: indexes of the languages to look in.
+        :return: list of the `ColumnReplacement` of the changed columns.
+        :raise re.error: if the replacement template is invalid.
+        """
+        return find_replacements(self.get_terms(), pattern, replacement, lang_indexes)
 
     def get_translation_flag(self, term_index: int, lang_index: int):
         """Get the flag from a given term and language.
@@ -176,9 +294,9 @@ class I2Manager:
         """
         terms = self.get_terms()
         if 0 <= term_index < len(terms):
-            flags = terms[term_index]["flags"]
-            if 0 <= lang_index < len(flags):
-                return flags[lang_index]
+            columns = terms.flags
+            if 0 <= lang_index < len(columns):
+                return columns[lang_index][term_index]
         return -1
 
     def set_translation_flag(self, term_index: int, lang_index: int, value: int):
@@ -189,14 +307,10 @@ class I2Manager:
         :param value: integer value to set.
         """
         terms = self.get_terms()
-        if 0 <= term_index < len(terms):
-            flags = terms[term_index]["flags"]
-            if 0 <= lang_index < len(flags):
-                flags[lang_index] = value
-            else:
-                while len(flags) <= lang_index:
-                    flags.append(0)
-                flags[lang_index] = value
+        if 0 <= term_index < len(terms) and lang_index >= 0:
+            terms.ensure_languages(lang_index + 1)
+            terms.set_flag(term_index, lang_index, value)
+            self.mark_modified()
 
     def add_language(self, *lang_info):
         """Add a language to the `languages` list.
@@ -204,22 +318,20 @@ class I2Manager:
         :param lang_info: language info to add. Can be either dict of values or passed arguments.
         """
         if isinstance(lang_info, dict):
-            new_language = lang_info
+            new_language = LanguageRecord.from_mapping(lang_info)
         else:
-            new_language = {
-                "name": lang_info[0],
-                "code": lang_info[1],
-                "flags": lang_info[2]
-            }
+            new_language = LanguageRecord(lang_info[0], lang_info[1], lang_info[2])
 
         languages = manager.get_languages()
         languages.append(new_language)
 
-        new_language_index = languages.index(new_language)
+        new_language_index = len(languages) - 1
+        self.get_terms().insert_language(new_language_index, lang_info[3])
 
-        for idx, term in enumerate(self.get_terms()):
-            new_translation = self.get_translation(idx, lang_info[3])
-            self.add_translation(idx, new_language_index, new_translation, 0)
+        if self._language_index is not None:
+            self._language_index.add(new_language_index, new_language)
+
+        self.mark_modified()
 
         return new_language_index, new_language
 
@@ -233,77 +345,185 @@ class I2Manager:
             return
 
         languages.pop(lang_index)
+        self.get_terms().remove_language(lang_index)
+        self._language_index = None
+        self.mark_modified()
 
-        for term in self.get_terms():
-            translations = term["translations"]
-            flags = term["flags"]
-
-            if 0 <= lang_index < len(translations):
-                translations.pop(lang_index)
-
-            if 0 <= lang_index < len(flags):
-                flags.pop(lang_index)
-
-    def open_dump_file(self, path: str | Path):
+    def open_dump_file(self, path: str | Path, use_cache: bool = True):
         """Open and process the UABEA dump file.
 
+        Unchanged dumps are loaded from their parsed snapshots if there are ones.
+        Dumps with a compression suffix, e.g. `.txt.gz`, are decompressed while they are read.
+
         :param path: path to the file.
+        :param use_cache: whether to use the snapshot cache.
         :return: string value of the exception if raised, True otherwise.
         """
         try:
             if isinstance(path, str):
                 path = Path(path)
 
-            with open(path, "r", encoding="utf-8") as f:
-                suffix = Fe.parse(path.suffix)
-                if suffix is Fe.TXT:
-                    content = self.convert_txt_dump(f.readlines())
-                elif suffix is Fe.JSON:
-                    content = json.loads(f.read())
-                else:
-                    return "error-invalid-extension"
-
-            terms = content.get("mSource", {}).get("mTerms", {}).get("Array", [])
-            langs = content.get("mSource", {}).get("mLanguages", {}).get("Array", [])
-
-            if not terms or not langs:
+            suffix, compression = parse_dump_suffix(path)
+            snapshot = dump_cache.load(path) if use_cache else None
+            # snapshots keep the columns the way they were loaded
+            if snapshot is not None and snapshot.get("lazy_languages", False) != self.loads_languages_lazily():
+                snapshot = None
+
+            if snapshot is not None:
+                output_content = snapshot["content"]
+                self.has_descriptions = snapshot["has_descriptions"]
+            elif (
+                    suffix is Fe.TXT
+                    and compression is None
+                    and (os.cpu_count() or 1) > 1
+                    and path.stat().st_size >= PARALLEL_PARSE_MIN_SIZE
+            ):
+                output_content = self.parse_txt_dump_parallel(path)
+            else:
+                output_content = self.parse_dump_file(path)
+
+            if not output_content["terms"] or not output_content["languages"]:
                 return "error-no-terms-language"
 
-            output_content = self.parse_json_dump(content)
+            if use_cache and snapshot is None:
+                dump_cache.store(path, {
+                    "content": output_content,
+                    "has_descriptions": self.has_descriptions,
+                    "lazy_languages": output_content["terms"].lazy_languages
+                })
 
             self.content = output_content
+            self._language_index = None
+            self.search_index = None
             self.update_file_info(path)
-            self.make_backup()
+            self.mark_modified()
+            self.mark_saved()
             return True
-        except (OSError, KeyError, MemoryError, PermissionError) as e:
+        except (OSError, KeyError, ValueError, MemoryError, PermissionError, *DECOMPRESSION_ERRORS) as e:
             return str(e)
+        except InvalidExtensionError:
+            return "error-invalid-extension"
+
+    @staticmethod
+    def indexes_search():
+        """Check whether the opened terms are indexed for the search, as set by `search.build_index`."""
+        return bool(app_cfg.get_config("search.build_index", True))
+
+    def has_search_index(self):
+        """Check whether the search index is built for the opened terms and is up to date with them."""
+        index = self.search_index
+        return index is not None and index.terms is self.content.get("terms") and not index.is_stale()
+
+    def build_search_index(self):
+        """Build the search index of the opened terms, see `SearchIndex`.
+
+        It takes a few seconds for millions of cells, so it is meant to be built in a background thread.
+        The terms edited meanwhile are searched directly, the index is dropped if the terms are replaced.
+
+        :return: built index.
+        """
+        terms = self.get_terms()
+        index = SearchIndex(terms)
+
+        if self.content.get("terms") is terms:
+            self.search_index = index
+        return index
+
+    def search_terms(self, query: str):
+        """Find the terms with the query in their name, description or any translation, case-insensitively.
+
+        The search index is used if it is up to date, see `has_search_index`. Otherwise, all the terms are scanned.
+
+        :param query: text to look for.
+        :return: sorted list of the term indexes.
+        """
+        if self.has_search_index():
+            return self.search_index.search(query)
+        return SearchIndex.scan_terms(self.get_terms(), query)
+
+    def query_terms(self, query: str):
+        """Find the terms matching the structured query, see `TermQuery` for its syntax.
+
+        :param query: query text, e.g. `key:UI/* fr:empty`.
+        :return: sorted list of the term indexes.
+        :raise QueryError: if the query is invalid.
+        """
+        return TermQuery(query, self.get_language_lookup()).select(self.get_terms())
+
+    @staticmethod
+    def loads_languages_lazily():
+        """Check whether the dumps are opened with packed language columns, as set by `load.lazy_languages`.
+
+        Only the languages edited are unpacked then, see `TermStore.load_language`,
+        in exchange for decoding the other ones every time they are read.
+        """
+        return bool(app_cfg.get_config("load.lazy_languages", False))
+
+    def new_term_store(self):
+        """Create an empty store to parse the terms into, with the language columns packed if configured."""
+        return TermStore(lazy_languages=self.loads_languages_lazily())
 
-    def save_dump_file(self, file_path: str | Path):
+    def parse_dump_file(self, path: Path, terms: TermStore | TermSpool | None = None):
+        """Parse the UABEA dump file in one process, according to its suffixes.
+
+        :param path: path to the file.
+        :param terms: empty store to add the terms to, `new_term_store` if None.
+        :return: custom data dictionary.
+        :raise InvalidExtensionError: if the file is not of a dump format.
+        """
+        suffix, compression = parse_dump_suffix(path)
+        if suffix is Fe.DAT:
+            with open_dump(path, "rb", compression) as f:
+                return self.parse_dat_dump(f.read(), terms)
+
+        if suffix not in (Fe.TXT, Fe.JSON):
+            raise InvalidExtensionError
+
+        with open_dump(path, "r", compression) as f:
+            if suffix is Fe.TXT:
+                return self.parse_txt_dump(f, terms)
+            return self.parse_json_dump_stream(f, terms)
+
+    def save_dump_file(self, file_path: str | Path, compact_json: bool = False):
         """Build and save the UABEA dump file to specified path.
 
+        Dumps with a compression suffix, e.g. `.txt.gz`, are compressed while they are written,
+        at the `compression.level` configured.
+
         :param file_path: path to the file to save.
+        :param compact_json: whether to save JSON dumps without the indentation and the whitespace.
         :return: string value of the exception if raised, True otherwise.
         """
         try:
             if isinstance(file_path, str):
                 file_path = Path(file_path)
 
-            suffix = Fe.parse(file_path.suffix)
+            suffix, compression = parse_dump_suffix(file_path)
+            mode = "w"
             if suffix is Fe.TXT:
-                output = self.build_txt_dump()
+                write_dump = self.write_txt_dump
             elif suffix is Fe.JSON:
-                output = self.build_json_dump()
+                write_dump = partial(self.write_json_dump, compact=compact_json)
+            elif suffix is Fe.DAT:
+                write_dump = self.write_dat_dump
+                mode = "wb"
             else:
                 raise InvalidExtensionError
 
-            with open(file_path, "w+", encoding="utf-8") as f:
-                f.write(output)
+            # write next to the target first, so a failed save never leaves a truncated dump behind
+            temp_path = file_path.with_name(f"{file_path.name}.tmp")
+            try:
+                with open_dump(temp_path, mode, compression) as f:
+                    write_dump(f)
+                os.replace(temp_path, file_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
 
-            self.make_backup()
+            self.mark_saved()
             return True
         except (FileNotFoundError, PermissionError) as e:
             return "error-file-access", {"error": str(e)}
-        except TypeError as e:
+        except (TypeError, KeyError, ValueError, struct.error) as e:
             return "error-invalid-data", {"error": str(e)}
         except OSError as e:
             return "error-save-failed", {"error": str(e)}
@@ -311,206 +531,479 @@ class I2Manager:
             return "error-invalid-extension"
 
     @staticmethod
-    def convert_txt_dump(dump_lines: list[str]):
+    def transcode_dump_file(source_path: str | Path, target_path: str | Path, compact_json: bool = False):
+        """Convert the UABEA dump file into another format without building the data model.
+
+        The terms are converted one at a time and passed through a `TermSpool`, as some formats need
+        their count and the fields after them before the terms are written. Raw dumps are read whole.
+        The formats are selected by the suffixes, the same as by `open_dump_file` and `save_dump_file`.
+
+        :param source_path: path to the dump file to convert.
+        :param target_path: path to save the converted dump to.
+        :param compact_json: whether to save JSON dumps without the indentation and the whitespace.
+        :return: True if converted, the error of reading or `save_dump_file` otherwise.
+        """
+        # a manager of its own, so the opened dump is left as it is
+        transcoder = I2Manager()
+        try:
+            with TermSpool() as terms:
+                content = transcoder.parse_dump_file(Path(source_path), terms)
+                if not terms or not content["languages"]:
+                    return "error-no-terms-language"
+
+                transcoder.content = content
+                return transcoder.save_dump_file(target_path, compact_json)
+        except (OSError, KeyError, ValueError, MemoryError, *DECOMPRESSION_ERRORS) as e:
+            return str(e)
+        except InvalidExtensionError:
+            return "error-invalid-extension"
+
+    @staticmethod
+    def convert_txt_dump(dump_lines: Iterable[str]):
         """Convert the UABEA TXT dump into JSON one.
 
-        :param dump_lines: list of string lines.
+        :param dump_lines: iterable of string lines. An opened file is read lazily.
         :return: UABEA JSON dump content.
         """
-        root = {}
-        stack = [(-1, root)]
+        return build_txt_tree(iter_txt_dump(dump_lines))
 
-        i = 0
-        while i < len(dump_lines):
-            raw = dump_lines[i].rstrip()
-            i += 1
+    def build_txt_dump(self):
+        """Build the UABEA TXT dump file.
 
-            if not raw.strip() or raw.startswith("0 MonoBehaviour Base"):
-                continue
+        :return: UABEA TXT dump data.
+        """
+        output = io.StringIO()
+        self.write_txt_dump(output)
+        return output.getvalue()
 
-            indent = len(raw) - len(raw.lstrip(' '))
-            line = raw.strip()
+    @staticmethod
+    def keeps_fragments():
+        """Check whether the serialized terms are kept between the saves, as set by `cache.save_fragments`.
 
-            # find parent by indentation
-            while stack and stack[-1][0] >= indent:
-                stack.pop()
+        Only the terms changed since the last save are rendered again then, in exchange for keeping
+        the rendered terms of the last saved format in memory.
+        """
+        return bool(app_cfg.get_config("cache.save_fragments", True))
 
-            parent = stack[-1][1]
+    @staticmethod
+    def get_render_workers(term_count: int):
+        """Get the number of worker processes to render the terms in on save, as set by `save.parallel_workers`.
 
-            # skip array indices and size lines
-            if re.match(r'\[\d+]', line):
-                continue
-            if "int size" in line:
-                continue
+        :param term_count: number of the terms to render.
+        :return: number of the workers, 0 to render the terms in this process.
+        """
+        workers = int(app_cfg.get_config("save.parallel_workers", 0))
+        return workers if workers > 1 and term_count >= PARALLEL_RENDER_MIN_TERMS else 0
 
-            # array container
-            if "Array Array" in line:
-                arr = []
-                if isinstance(parent, dict):
-                    parent["Array"] = arr
-                stack.append((indent, arr))
-                continue
+    @staticmethod
+    def render_parallel(render_chunk: Callable[[list[dict]], list], records: Iterable[dict], workers: int) -> Iterator:
+        """Render the terms in chunks in worker processes, giving the results in order.
 
-            # parse value
-            if "=" in line:
-                left, right = line.split("=", 1)
-                right = right.strip()
-                left = left.strip()
+        A couple of chunks per worker are rendered ahead at most, so only those are kept in memory.
+        Chunks are rendered in this process if the workers cannot be started or stop working.
 
-                name = left.split()[-1]
-                value = parse_raw_value(right)
+        :param render_chunk: picklable function rendering a list of custom term dictionaries
+            into one fragment per term, e.g. `render_txt_fragments_chunk`.
+        :param records: custom term dictionaries.
+        :param workers: number of worker processes.
+        :return: generator of the fragments, one per term.
+        """
+        records = iter(records)
+        chunks = iter(lambda: list(islice(records, RENDER_CHUNK_SIZE)), [])
+        pending: deque[tuple[list[dict], Any]] = deque()
+        # chunk taken from the records but not submitted yet, as a broken pool fails to take it too
+        unsubmitted = None
 
-                if isinstance(parent, list):
-                    parent.append(value)
-                else:
-                    parent[name] = value
-                continue
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                for chunk in chain(chunks, [None]):
+                    if chunk is not None:
+                        unsubmitted = chunk
+                        pending.append((chunk, pool.submit(render_chunk, chunk)))
+                        unsubmitted = None
+                        if len(pending) < workers * 2:
+                            continue
+
+                    # flush all at the end
+                    while pending and (chunk is None or len(pending) >= workers * 2):
+                        # taken off only once rendered, so a broken pool leaves it for the fallback
+                        yield from pending[0][1].result()
+                        pending.popleft()
+        except BrokenProcessPool as e:
+            print(f"[RENDER] Rendering the rest of the terms in one process: {str(e)}")
+            left = [chunk for chunk, _ in pending]
+            if unsubmitted is not None:
+                left.append(unsubmitted)
+            for chunk in chain(left, chunks):
+                yield from render_chunk(chunk)
+
+    def write_txt_dump(self, f: TextIO, workers: int | None = None):
+        """Write the UABEA TXT dump to a text stream, term by term.
+
+        :param f: writable text stream.
+        :param workers: number of worker processes to render the terms in,
+            `get_render_workers` if None, 0 or 1 to render them in this process.
+            The output is the same either way.
+        """
+        content = self.content
+        structure = content["structure"]
+        metadata = content["metadata"]
+        terms = content["terms"]
+        languages = content["languages"]
+
+        game_object = structure["m_GameObject"]
+        script = structure["m_Script"]
+
+        f.write(
+            "0 MonoBehaviour Base\n"
+            " 0 PPtr<GameObject> m_GameObject\n"
+            f"  0 int m_FileID = {game_object['m_FileID']}\n"
+            f"  0 SInt64 m_PathID = {game_object['m_PathID']}\n"
+            f" 1 UInt8 m_Enabled = {int(structure['m_Enabled'])}\n"
+            " 0 PPtr<MonoScript> m_Script\n"
+            f"  0 int m_FileID = {script['m_FileID']}\n"
+            f"  0 SInt64 m_PathID = {script['m_PathID']}\n"
+            f" 1 string m_Name = \"{escape(structure['m_Name'])}\"\n"
+            " 0 LanguageSourceData mSource\n"
+            f"  1 UInt8 UserAgreesToHaveItOnTheScene = {int(metadata['UserAgreesToHaveItOnTheScene'])}\n"
+            f"  1 UInt8 UserAgreesToHaveItInsideThePluginsFolder = {int(metadata['UserAgreesToHaveItInsideThePluginsFolder'])}\n"
+            f"  1 UInt8 GoogleLiveSyncIsUptoDate = {int(metadata['GoogleLiveSyncIsUptoDate'])}\n"
+            "  0 TermData mTerms\n"
+            f"   1 Array Array ({len(terms)} items)\n"
+            f"    0 int size = {len(terms)}\n"
+        )
+
+        has_descriptions = self.has_descriptions
+        keeps_fragments = isinstance(terms, TermStore) and self.keeps_fragments()
+        key = ("txt", has_descriptions)
+
+        if workers is None:
+            workers = self.get_render_workers(terms.count_dirty(key) if keeps_fragments else len(terms))
+        if workers > 1:
+            render_chunk = partial(render_txt_fragments_chunk, has_descriptions=has_descriptions)
+            render = partial(self.render_parallel, render_chunk, workers=workers)
+        else:
+            render = partial(render_txt_term_fragments, has_descriptions=has_descriptions)
 
-            # object start (vector, PPtr etc)
-            parts = line.split()
-            name = parts[-1]
+        if keeps_fragments:
+            fragments = terms.fragments(key, render, escaped=True)
+        else:
+            fragments = render(terms.records(escaped=True))
+
+        # index lines are added as the terms are written in order, so the fragments never depend on them
+        f.writelines(f"    [{index}]\n{fragment}" for index, fragment in enumerate(fragments))
+
+        f.write(
+            f"  1 UInt8 CaseInsensitiveTerms = {int(metadata['CaseInsensitiveTerms'])}\n"
+            f"  0 int OnMissingTranslation = {Mta[metadata['OnMissingTranslation']]}\n"
+            f"  1 string mTerm_AppName = \"{escape(metadata['mTerm_AppName'])}\"\n"
+            "  0 LanguageData mLanguages\n"
+            f"   1 Array Array ({len(languages)} items)\n"
+            f"    0 int size = {len(languages)}\n"
+        )
+
+        for l_index, lang in enumerate(languages):
+            f.write(
+                f"    [{l_index}]\n"
+                "     0 LanguageData data\n"
+                f"      1 string Name = \"{escape(lang['name'])}\"\n"
+                f"      1 string Code = \"{escape(lang['code'])}\"\n"
+                f"      1 UInt8 Flags = {Ldf[lang['flags']]}\n"
+            )
 
-            obj = {}
+        assets = metadata["Assets"]["Array"]
+        f.write(
+            f"  1 UInt8 IgnoreDeviceLanguage = {int(metadata['IgnoreDeviceLanguage'])}\n"
+            f"  0 int _AllowUnloadingLanguages = {Aul[metadata['_AllowUnloadingLanguages']]}\n"
+            f"  1 string Google_WebServiceURL = \"{escape(metadata['Google_WebServiceURL'])}\"\n"
+            f"  1 string Google_SpreadsheetKey = \"{escape(metadata['Google_SpreadsheetKey'])}\"\n"
+            f"  1 string Google_SpreadsheetName = \"{escape(metadata['Google_SpreadsheetName'])}\"\n"
+            f"  1 string Google_LastUpdatedVersion = \"{escape(metadata['Google_LastUpdatedVersion'])}\"\n"
+            f"  0 int GoogleUpdateFrequency = {Guf[metadata['GoogleUpdateFrequency']]}\n"
+            f"  0 int GoogleInEditorCheckFrequency = {Guf[metadata['GoogleInEditorCheckFrequency']]}\n"
+            f"  0 int GoogleUpdateSynchronization = {Gus[metadata['GoogleUpdateSynchronization']]}\n"
+            f"  0 float GoogleUpdateDelay = {int(metadata['GoogleUpdateDelay'])}\n"
+            "  0 vector Assets\n"
+            f"   1 Array Array ({len(assets)} items)\n"
+            f"    0 int size = {len(assets)}\n"
+        )
+
+        for a_index, asset in enumerate(assets):
+            f.write(
+                f"    [{a_index}]\n"
+                "     0 PPtr<$Object> data\n"
+                f"      0 int m_FileID = {asset['m_FileID']}\n"
+                f"      0 SInt64 m_PathID = {asset['m_PathID']}\n"
+            )
 
-            if isinstance(parent, list):
-                parent.append(obj)
-            else:
-                parent[name] = obj
+    def write_dat_dump(self, f: BinaryIO):
+        """Write the UABEA raw dump to a binary stream, term by term.
 
-            stack.append((indent, obj))
+        The fields are serialized in the same order as they are written by `write_txt_dump`.
 
-        return root
+        :param f: writable binary stream.
+        """
+        content = self.content
+        structure = content["structure"]
+        metadata = content["metadata"]
+        terms = content["terms"]
+        languages = content["languages"]
+
+        f.write(b"".join((
+            pack_pptr(structure["m_GameObject"]),
+            pack_uint8(int(structure["m_Enabled"])),
+            pack_pptr(structure["m_Script"]),
+            pack_string(structure["m_Name"]),
+            pack_uint8(int(metadata["UserAgreesToHaveItOnTheScene"])),
+            pack_uint8(int(metadata["UserAgreesToHaveItInsideThePluginsFolder"])),
+            pack_uint8(int(metadata["GoogleLiveSyncIsUptoDate"]))
+        )))
+
+        if isinstance(terms, TermStore) and self.keeps_fragments():
+            has_descriptions = self.has_descriptions
+            fragments = terms.fragments(
+                ("dat", has_descriptions),
+                lambda records: render_dat_terms(records, has_descriptions)
+            )
+        else:
+            fragments = render_dat_terms(terms.records(), self.has_descriptions)
+        write_dat_items(f, fragments, len(terms))
+
+        f.write(b"".join((
+            pack_uint8(int(metadata["CaseInsensitiveTerms"])),
+            pack_int(Mta[metadata["OnMissingTranslation"]]),
+            pack_string(metadata["mTerm_AppName"])
+        )))
+
+        write_dat_items(f, (
+            pack_string(lang["name"]) + pack_string(lang["code"]) + pack_uint8(Ldf[lang["flags"]])
+            for lang in languages
+        ), len(languages))
+
+        assets = metadata["Assets"]["Array"]
+        f.write(b"".join((
+            pack_uint8(int(metadata["IgnoreDeviceLanguage"])),
+            pack_int(Aul[metadata["_AllowUnloadingLanguages"]]),
+            pack_string(metadata["Google_WebServiceURL"]),
+            pack_string(metadata["Google_SpreadsheetKey"]),
+            pack_string(metadata["Google_SpreadsheetName"]),
+            pack_string(metadata["Google_LastUpdatedVersion"]),
+            pack_int(Guf[metadata["GoogleUpdateFrequency"]]),
+            pack_int(Guf[metadata["GoogleInEditorCheckFrequency"]]),
+            pack_int(Gus[metadata["GoogleUpdateSynchronization"]]),
+            pack_float(metadata["GoogleUpdateDelay"])
+        )))
+
+        write_dat_items(f, map(pack_pptr, assets), len(assets))
 
-    def build_txt_dump(self):
-        """Build the UABEA TXT dump file.
+    @staticmethod
+    def parse_term(term: dict):
+        """Parse UABEA term dictionary into a term record.
 
-        :return: UABEA TXT dump data.
+        :param term: UABEA term dictionary.
+        :return: `TermRecord` of the term.
+        """
+        translations = term["Languages"]["Array"] if term["Languages"] else []
+        flags = term["Flags"]["Array"] if term["Flags"] else []
+
+        if len(translations) != len(flags):
+            count = min(len(translations), len(flags))
+            translations, flags = translations[:count], flags[:count]
+
+        return TermRecord(
+            term["Term"],
+            Tt(term["TermType"]),
+            term.get("Description", ""),
+            translations,
+            flags,
+            term["Languages_Touch"]["Array"]
+        )
+
+    @staticmethod
+    def parse_language(language: dict):
+        """Parse UABEA language dictionary into a language record.
+
+        :param language: UABEA language dictionary.
+        :return: `LanguageRecord` of the language.
         """
-        output = []
+        return LanguageRecord(language["Name"], language["Code"], Ldf(language["Flags"]))
+
+    def parse_txt_dump(self, dump_lines: Iterable[str], terms: TermStore | TermSpool | None = None):
+        """Parse UABEA TXT dump lines straight into a custom dictionary.
+
+        Terms and languages are converted as soon as they are read,
+        so the UABEA representation of them is never kept in full.
+        Translations are kept escaped until they are read, see `EscapedStr`.
+
+        :param dump_lines: iterable of string lines. An opened file is read lazily.
+        :param terms: empty store to add the terms to, `new_term_store` if None.
+        :return: custom data dictionary.
+        """
+        terms = self.new_term_store() if terms is None else terms
+        dump_content = build_txt_tree(
+            iter_txt_dump(dump_lines, lazy_strings=True),
+            {
+                "mTerms": lambda term: terms.append(self.parse_term(term), escaped=True),
+                "mLanguages": self.parse_language
+            }
+        )
+
+        m_source = dump_content.get("mSource", {})
+        languages = m_source.get("mLanguages", {}).get("Array", [])
+
+        terms.ensure_languages(len(languages))
+        self.has_descriptions = terms.has_descriptions()
+        return self._parse_dump_content(dump_content, terms, languages)
+
+    def parse_txt_dump_parallel(self, path: Path, workers: int | None = None):
+        """Parse UABEA TXT dump file, splitting its terms between worker processes.
+
+        Falls back to `parse_txt_dump` if the dump has no terms or the workers cannot be started.
+
+        :param path: path to the file.
+        :param workers: number of worker processes, CPU count if None.
+        :return: custom data dictionary.
+        """
+        workers = workers or os.cpu_count() or 1
+        # a few parts per worker even out the ones with longer translations
+        split = split_txt_terms(path, workers * 4)
+
         try:
-            content = self.content
-
-            structure = content["structure"]
-            output.append("0 MonoBehaviour Base")
-
-            game_object = structure["m_GameObject"]
-            output.append(" 0 PPtr<GameObject> m_GameObject")
-            output.append(f"  0 int m_FileID = {game_object['m_FileID']}")
-            output.append(f"  0 SInt64 m_PathID = {game_object['m_PathID']}")
-
-            output.append(f" 1 UInt8 m_Enabled = {int(structure['m_Enabled'])}")
-
-            script = structure["m_Script"]
-            output.append(" 0 PPtr<MonoScript> m_Script")
-            output.append(f"  0 int m_FileID = {script['m_FileID']}")
-            output.append(f"  0 SInt64 m_PathID = {script['m_PathID']}")
-
-            output.append(f" 1 string m_Name = \"{structure['m_Name']}\"")
-
-            metadata = content["metadata"]
-            output.append(" 0 LanguageSourceData mSource")
-            output.append(f"  1 UInt8 UserAgreesToHaveItOnTheScene = {int(metadata['UserAgreesToHaveItOnTheScene'])}")
-            output.append(f"  1 UInt8 UserAgreesToHaveItInsideThePluginsFolder = {int(metadata['UserAgreesToHaveItInsideThePluginsFolder'])}")
-            output.append(f"  1 UInt8 GoogleLiveSyncIsUptoDate = {int(metadata['GoogleLiveSyncIsUptoDate'])}")
-
-            output.append("  0 TermData mTerms")
-
-            terms = content["terms"]
-            languages = content["languages"]
-
-            output.append(f"   1 Array Array ({len(terms)} items)")
-            output.append(f"    0 int size = {len(terms)}")
-
-            for i, term in enumerate(terms):
-                output.append(f"    [{i}]")
-                output.append("     0 TermData data")
-                output.append(f"      1 string Term = \"{term['name']}\"")
-                output.append(f"      0 int TermType = {Tt[term['type']]}")
-                if self.has_descriptions:
-                    output.append(f"      1 string Description = \"{term['desc']}\"")
-
-                translations = term["translations"]
-                output.append("      0 string Languages")
-                output.append(f"       1 Array Array ({len(translations)} items)")
-                output.append(f"        0 int size = {len(translations)}")
-
-                for t_index, translation in enumerate(translations):
-                    translation = escape(translation)
-                    output.append(f"        [{t_index}]")
-                    output.append(f"         1 string data = \"{translation}\"")
-
-                flags = term["flags"]
-                output.append("      0 vector Flags")
-                output.append(f"       1 Array Array ({len(flags)} items)")
-                output.append(f"        0 int size = {len(flags)}")
-
-                for f_index, flag in enumerate(flags):
-                    output.append(f"        [{f_index}]")
-                    output.append(f"         0 UInt8 data = {flag}")
-
-                languages_touch = term["languages_touch"]
-                output.append("      0 string Languages_Touch")
-                output.append(f"       1 Array Array ({len(languages_touch)} items)")
-                output.append(f"        0 int size = {len(languages_touch)}")
-
-                for touch_idx, touch in enumerate(languages_touch):
-                    output.append(f"        [{touch_idx}]")
-                    output.append(f"         1 string data = \"{touch}\"")
-
-            output.append(f"  1 UInt8 CaseInsensitiveTerms = {int(metadata['CaseInsensitiveTerms'])}")
-            output.append(f"  0 int OnMissingTranslation = {Mta[metadata['OnMissingTranslation']]}")
-            output.append(f"  1 string mTerm_AppName = \"{metadata['mTerm_AppName']}\"")
-
-            output.append("  0 LanguageData mLanguages")
-            output.append(f"   1 Array Array ({len(languages)} items)")
-            output.append(f"    0 int size = {len(languages)}")
-
-            for l_index, lang in enumerate(languages):
-                output.append(f"    [{l_index}]")
-                output.append("     0 LanguageData data")
-                output.append(f"      1 string Name = \"{lang['name']}\"")
-                output.append(f"      1 string Code = \"{lang['code']}\"")
-                output.append(f"      1 UInt8 Flags = {Ldf[lang['flags']]}")
-
-            output.append(f"  1 UInt8 IgnoreDeviceLanguage = {int(metadata['IgnoreDeviceLanguage'])}")
-            output.append(f"  0 int _AllowUnloadingLanguages = {Aul[metadata['_AllowUnloadingLanguages']]}")
-            output.append(f"  1 string Google_WebServiceURL = \"{metadata['Google_WebServiceURL']}\"")
-            output.append(f"  1 string Google_SpreadsheetKey = \"{metadata['Google_SpreadsheetKey']}\"")
-            output.append(f"  1 string Google_SpreadsheetName = \"{metadata['Google_SpreadsheetName']}\"")
-            output.append(f"  1 string Google_LastUpdatedVersion = \"{metadata['Google_LastUpdatedVersion']}\"")
-            output.append(f"  0 int GoogleUpdateFrequency = {Guf[metadata['GoogleUpdateFrequency']]}")
-            output.append(f"  0 int GoogleInEditorCheckFrequency = {Guf[metadata['GoogleInEditorCheckFrequency']]}")
-            output.append(f"  0 int GoogleUpdateSynchronization = {Gus[metadata['GoogleUpdateSynchronization']]}")
-            output.append(f"  0 float GoogleUpdateDelay = {int(metadata['GoogleUpdateDelay'])}")
-
-            assets = metadata["Assets"]["Array"]
-            output.append("  0 vector Assets")
-            output.append(f"   1 Array Array ({len(assets)} items)")
-            output.append(f"    0 int size = {len(assets)}")
-
-            if assets:
-                for a_index, asset in enumerate(assets):
-                    output.append(f"    [{a_index}]")
-                    output.append("     0 PPtr<$Object> data")
-                    output.append(f"      0 int m_FileID = {asset['m_FileID']}")
-                    output.append(f"      0 SInt64 m_PathID = {asset['m_PathID']}")
-
-        except Exception as e:
-            raise e from e
-
-        return str("\n".join(output) + "\n")
+            if split is None:
+                raise BrokenProcessPool("no terms to split")
+
+            declaration_start, ranges = split
+            terms = self.new_term_store()
+            terms_end = None
+
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                futures = [
+                    pool.submit(parse_txt_terms_range, path, start, end, self.parse_term, terms.lazy_languages)
+                    for start, end in ranges
+                ]
+
+                for idx, future in enumerate(futures):
+                    part, terms_end = future.result()
+                    futures[idx] = None
+                    terms.extend(part)
+                    if terms_end is not None:
+                        break
+        except BrokenProcessPool as e:
+            print(f"[PARSER] Parsing {path.name} in one process: {str(e)}")
+            with open(path, "r", encoding="utf-8") as f:
+                return self.parse_txt_dump(f)
+
+        with open(path, "rb") as f:
+            rest = f.read(declaration_start)
+            if terms_end is not None:
+                f.seek(terms_end)
+                rest += f.read()
+
+        dump_content = build_txt_tree(
+            iter_txt_dump(io.StringIO(rest.decode("utf-8"), newline=None)),
+            {"mLanguages": self.parse_language}
+        )
+
+        m_source = dump_content.get("mSource", {})
+        languages = m_source.get("mLanguages", {}).get("Array", [])
+
+        terms.ensure_languages(len(languages))
+        self.has_descriptions = terms.has_descriptions()
+        return self._parse_dump_content(dump_content, terms, languages)
+
+    def parse_json_dump_stream(self, f: TextIO, terms: TermStore | TermSpool | None = None):
+        """Parse UABEA JSON dump from a text stream into a custom dictionary.
+
+        The dump is read incrementally and the terms are converted as soon as they are read,
+        so neither the whole JSON text nor the UABEA representation of the terms is kept in memory.
+
+        :param f: readable text stream, e.g. an opened file.
+        :param terms: empty store to add the terms to, `new_term_store` if None.
+        :return: custom data dictionary.
+        """
+        terms = self.new_term_store() if terms is None else terms
+        dump_content = load_json_dump(f, {
+            "mTerms": lambda term: terms.append(self.parse_term(term)),
+            "mLanguages": self.parse_language
+        })
+
+        m_source = dump_content.get("mSource", {})
+        languages = m_source.get("mLanguages", {}).get("Array", [])
+
+        terms.ensure_languages(len(languages))
+        self.has_descriptions = terms.has_descriptions()
+        return self._parse_dump_content(dump_content, terms, languages)
 
     def parse_json_dump(self, dump_content: dict):
         """Parse UABEA JSON dump content into a custom dictionary.
 
+        Parsed terms are released from `dump_content` one by one to keep the peak memory low.
+
         :param dump_content: UABEA JSON dump content.
         :return: custom data dictionary.
         """
+        m_source = dump_content.get("mSource", {})
+        dump_terms = m_source.get("mTerms", {}).get("Array", [])
+        dump_languages = m_source.get("mLanguages", {}).get("Array", [])
+
+        terms = self.new_term_store()
+        terms.ensure_languages(len(dump_languages))
+        for idx, term in enumerate(dump_terms):
+            terms.append(self.parse_term(term))
+            dump_terms[idx] = None
+
+        dump_terms.clear()
+
+        self.has_descriptions = terms.has_descriptions()
+        languages = [self.parse_language(lang) for lang in dump_languages]
+        return self._parse_dump_content(dump_content, terms, languages)
+
+    def parse_dat_dump(self, data: bytes | memoryview, terms: TermStore | TermSpool | None = None):
+        """Parse UABEA raw dump data into a custom dictionary.
+
+        Whether the terms have descriptions is not stored in the data,
+        so the dump is read with them only if it does not fit the layout without them.
+
+        :param data: raw dump data.
+        :param terms: empty store to add the terms to, `new_term_store` if None.
+        :return: custom data dictionary.
+        :raise ValueError: if the data fits neither of the layouts.
+        """
+        terms = self.new_term_store() if terms is None else terms
+        for has_descriptions in (False, True):
+            terms.clear()
+            try:
+                dump_content = read_dat_dump(data, has_descriptions, {
+                    "mTerms": lambda term: terms.append(self.parse_term(term)),
+                    "mLanguages": self.parse_language
+                })
+                break
+            except ValueError:
+                if has_descriptions:
+                    raise
+
+        languages = dump_content["mSource"]["mLanguages"]["Array"]
+
+        terms.ensure_languages(len(languages))
+        self.has_descriptions = has_descriptions
+        return self._parse_dump_content(dump_content, terms, languages)
+
+    @staticmethod
+    def _parse_dump_content(dump_content: dict, terms: TermStore, languages: list[LanguageRecord]):
+        """Assemble the custom data dictionary from UABEA dump content and parsed terms and languages.
+
+        :param dump_content: UABEA dump content.
+        :param terms: parsed terms.
+        :param languages: parsed languages.
+        :return: custom data dictionary.
+        """
         result = {
             "structure": {},
             "metadata": {},
-            "terms": [],
-            "languages": []
+            "terms": terms,
+            "languages": languages
         }
 
         parse_metadata = {
@@ -539,141 +1032,153 @@ class I2Manager:
             if name != "mSource":
                 result["structure"][name] = items
 
-        for name, items in dump_content["mSource"].items():
+        for name, items in dump_content.get("mSource", {}).items():
             if name in parse_metadata:
                 result["metadata"][name] = parse_metadata[name](items)
 
-        for lang_dict in dump_content["mSource"]["mLanguages"]["Array"]:
-            result["languages"].append({
-                "name": lang_dict["Name"],
-                "code": lang_dict["Code"],
-                "flags": Ldf(lang_dict["Flags"])
-            })
-
-        self.has_descriptions = any(term.get("Description", None) for term in dump_content["mSource"]["mTerms"]["Array"])
-
-        for term in dump_content["mSource"]["mTerms"]["Array"]:
-            term_data = (
-                term["Term"],
-                Tt(term["TermType"]),
-                term.get("Description", ""),
-                term["Languages_Touch"]["Array"]
-            )
+        terms.case_insensitive = result["metadata"].get("CaseInsensitiveTerms", False)
+        return result
 
-            flags = []
-            translations = []
+    def build_json_dump(self, compact: bool = False):
+        """Build the UABEA JSON dump.
 
-            if term["Languages"] and term["Flags"]:
-                t_languages = term["Languages"]["Array"]
-                t_flags = term["Flags"]["Array"]
+        :param compact: whether to leave out the indentation and the whitespace.
+        :return: JSON formatted string.
+        """
+        output = io.StringIO()
+        self.write_json_dump(output, compact)
+        return output.getvalue()
 
-                for idx, (tr, fl) in enumerate(zip(t_languages, t_flags)):
-                    if idx < len(t_languages) and idx < len(t_flags):
-                        translations.append(tr)
-                        flags.append(fl)
+    @staticmethod
+    def build_json_term(t_dict: Mapping, has_descriptions: bool = False):
+        """Build UABEA term dictionary from a custom term dictionary.
 
-            result["terms"].append({
-                "name": term_data[0],
-                "type": term_data[1],
-                "desc": term_data[2],
-                "translations": translations,
-                "flags": flags,
-                "languages_touch": term_data[3]
-            })
+        :param t_dict: custom term dictionary.
+        :param has_descriptions: whether to include the term description.
+        :return: UABEA term dictionary.
+        """
+        term = {
+            "Term": t_dict["name"],
+            "TermType": Tt[t_dict["type"]]
+        }
 
-        return result
+        if has_descriptions:
+            term["Description"] = t_dict["desc"]
 
-    def build_json_dump(self):
-        """Build the UABEA JSON dump.
+        term |= {
+            "Languages": {"Array": t_dict["translations"]},
+            "Flags": {"Array": t_dict["flags"]},
+            "Languages_Touch": {"Array": t_dict["languages_touch"]}
+        }
+
+        return term
+
+    @staticmethod
+    def render_json_fragments_chunk(terms: list[dict], indent: int | None = 2, has_descriptions: bool = False):
+        """Encode a chunk of the terms as the `mTerms` array items of the UABEA JSON dump, e.g. in a worker process.
+
+        :param terms: custom term dictionaries.
+        :param indent: indentation level of the JSON, None for the compact output.
+        :param has_descriptions: whether to include the term descriptions.
+        :return: list of `JsonFragment`, one per term.
+        """
+        return [encode_json_fragment(I2Manager.build_json_term(t_dict, has_descriptions), indent) for t_dict in terms]
+
+    def write_json_dump(self, f: TextIO, compact: bool = False, workers: int | None = None):
+        """Write the UABEA JSON dump to a text stream, term by term.
 
         Includes `insert_metadata` function to be able to put specified metadata entries easier.
-        As well as `build_term` and `build_language` functions.
+        As well as `build_language` function.
 
-        :return: JSON formatted string.
+        :param f: writable text stream.
+        :param compact: whether to leave out the indentation and the whitespace.
+        :param workers: number of worker processes to encode the terms in,
+            `get_render_workers` if None, 0 or 1 to encode them in this process.
+            The output is the same either way.
         """
         output = {}
-        try:
-            def insert_metadata(parsing_metadata, target):
-                metadata = self.content.get("metadata", [])
-                for name, type_ in parsing_metadata:
-                    if name in metadata:
-                        if issubclass(type_, (Aul, Guf, Gus, Mta)):
-                            target[name] = type_[metadata[name]]
-                        else:
-                            target[name] = type_(metadata[name])
-
-            def build_term(t_dict):
-                term = {
-                    "Term": t_dict["name"],
-                    "TermType": Tt[t_dict["type"]]
-                }
-
-                if self.has_descriptions:
-                    term["Description"] = t_dict["desc"]
-
-                term |= {
-                    "Languages": {"Array": t_dict["translations"]},
-                    "Flags": {"Array": t_dict["flags"]},
-                    "Languages_Touch": {"Array": t_dict["languages_touch"]}
-                }
-
-                return term
-
-            def build_language(l_dict):
-                return {
-                    "Name": l_dict["name"],
-                    "Code": l_dict["code"],
-                    "Flags": Ldf[l_dict["flags"]]
-                }
-
-            build_metadata = [
-                ("UserAgreesToHaveItOnTheScene", int),
-                ("UserAgreesToHaveItInsideThePluginsFolder", int),
-                ("GoogleLiveSyncIsUptoDate", int),
-
-                ("CaseInsensitiveTerms", int),
-                ("OnMissingTranslation", Mta),
-                ("mTerm_AppName", str),
-
-                ("IgnoreDeviceLanguage", int),
-                ("_AllowUnloadingLanguages", Aul),
-                ("Google_WebServiceURL", str),
-                ("Google_SpreadsheetKey", str),
-                ("Google_SpreadsheetName", str),
-                ("Google_LastUpdatedVersion", str),
-                ("GoogleUpdateFrequency", Guf),
-                ("GoogleInEditorCheckFrequency", Guf),
-                ("GoogleUpdateSynchronization", Gus),
-                ("GoogleUpdateDelay", float),
-                ("Assets", dict)
-            ]
-
-            for key, value in self.content.get("structure", {}).items():
-                output[key] = value
-
-            m_source = output.setdefault("mSource", {})
-
-            insert_metadata(build_metadata[:3], m_source)
-
-            m_source["mTerms"] = {"Array": []}
-            for term_dict in self.content.get("terms", []):
-                m_source["mTerms"]["Array"].append(
-                    build_term(term_dict)
-                )
-
-            insert_metadata(build_metadata[3:6], m_source)
-
-            m_source["mLanguages"] = {"Array": []}
-            for lang_dict in self.content.get("languages", []):
-                m_source["mLanguages"]["Array"].append(
-                    build_language(lang_dict)
-                )
-
-            insert_metadata(build_metadata[6:], m_source)
-        except Exception as e:
-            return str(e)
 
-        return json.dumps(output, ensure_ascii=False, indent=2)
+        def insert_metadata(parsing_metadata, target):
+            metadata = self.content.get("metadata", [])
+            for name, type_ in parsing_metadata:
+                if name in metadata:
+                    if issubclass(type_, (Aul, Guf, Gus, Mta)):
+                        target[name] = type_[metadata[name]]
+                    else:
+                        target[name] = type_(metadata[name])
+
+        def build_language(l_dict):
+            return {
+                "Name": l_dict["name"],
+                "Code": l_dict["code"],
+                "Flags": Ldf[l_dict["flags"]]
+            }
+
+        build_metadata = [
+            ("UserAgreesToHaveItOnTheScene", int),
+            ("UserAgreesToHaveItInsideThePluginsFolder", int),
+            ("GoogleLiveSyncIsUptoDate", int),
+
+            ("CaseInsensitiveTerms", int),
+            ("OnMissingTranslation", Mta),
+            ("mTerm_AppName", str),
+
+            ("IgnoreDeviceLanguage", int),
+            ("_AllowUnloadingLanguages", Aul),
+            ("Google_WebServiceURL", str),
+            ("Google_SpreadsheetKey", str),
+            ("Google_SpreadsheetName", str),
+            ("Google_LastUpdatedVersion", str),
+            ("GoogleUpdateFrequency", Guf),
+            ("GoogleInEditorCheckFrequency", Guf),
+            ("GoogleUpdateSynchronization", Gus),
+            ("GoogleUpdateDelay", float),
+            ("Assets", dict)
+        ]
+
+        for key, value in self.content.get("structure", {}).items():
+            output[key] = value
+
+        m_source = output.setdefault("mSource", {})
+
+        insert_metadata(build_metadata[:3], m_source)
+
+        # terms are built and encoded one at a time while writing
+        terms = self.get_terms()
+        has_descriptions = self.has_descriptions
+        keeps_fragments = isinstance(terms, TermStore) and self.keeps_fragments()
+        indent = None if compact else 2
+        key = ("json", indent, has_descriptions)
+
+        if workers is None:
+            workers = self.get_render_workers(terms.count_dirty(key) if keeps_fragments else len(terms))
+        render_chunk = partial(self.render_json_fragments_chunk, indent=indent, has_descriptions=has_descriptions)
+
+        if workers > 1:
+            render = partial(self.render_parallel, render_chunk, workers=workers)
+        elif keeps_fragments:
+            def render(records):
+                return (encode_json_fragment(self.build_json_term(t_dict, has_descriptions), indent) for t_dict in records)
+        else:
+            render = None
+
+        if keeps_fragments:
+            m_source["mTerms"] = {"Array": terms.fragments(key, render)}
+        elif render is not None:
+            m_source["mTerms"] = {"Array": render(terms.records())}
+        else:
+            m_source["mTerms"] = {"Array": map(partial(self.build_json_term, has_descriptions=has_descriptions), terms.records())}
+
+        insert_metadata(build_metadata[3:6], m_source)
+
+        m_source["mLanguages"] = {"Array": [
+            build_language(lang_dict)
+            for lang_dict in self.content.get("languages", [])
+        ]}
+
+        insert_metadata(build_metadata[6:], m_source)
+
+        f.writelines(iter_json_chunks(output, None if compact else 2))
 
 
 manager = I2Manager()
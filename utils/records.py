@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+from typing import Any
+
+from utils.enums import LanguageDataFlags as Ldf, TermType as Tt
+
+
+class Record(Mapping):
+    """Base of the slotted record types, used in place of the custom dictionaries.
+
+    Fields are attributes named after the dictionary keys. The dictionary-style access,
+    e.g. `record["name"]`, `record.get("desc", "")` or `dict(record)`, keeps working,
+    and records compare equal to the dictionaries with the same items.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def copy(self):
+        """Get a shallow copy of the record."""
+        return type(self)(*(getattr(self, key) for key in self.__slots__))
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping):
+        """Create the record from a custom dictionary, missing keys get their default values.
+
+        :param mapping: custom dictionary or another record.
+        :return: record of the class.
+        """
+        if mapping.__class__ is cls:
+            return mapping
+        return cls(**{key: mapping[key] for key in cls.__slots__ if key in mapping})
+
+
+class TermRecord(Record):
+    """Term record, with the fields of the custom term dictionary."""
+    __slots__ = ("name", "type", "desc", "translations", "flags", "languages_touch")
+
+    def __init__(
+            self,
+            name: str = "",
+            type: Tt | str | None = None,
+            desc: str = "",
+            translations: list[str] | None = None,
+            flags: list[int] | None = None,
+            languages_touch: list[str] | None = None
+    ):
+        self.name = name
+        self.type = type
+        self.desc = desc
+        self.translations = translations if translations is not None else []
+        self.flags = flags if flags is not None else []
+        self.languages_touch = languages_touch if languages_touch is not None else []
+
+
+class LanguageRecord(Record):
+    """Language record, with the fields of the custom language dictionary."""
+    __slots__ = ("name", "code", "flags")
+
+    def __init__(self, name: str = "", code: str = "", flags: Ldf | int = Ldf.ENABLED):
+        self.name = name
+        self.code = code
+        self.flags = flags
@@ -0,0 +1,255 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain, compress, count, islice
+from operator import add
+from typing import Iterable
+
+from utils.helpers import unescape_lazy
+from utils.term_store import TermStore
+
+# rows of a column per block of the word index, smaller blocks leave less text to scan and take more memory
+BLOCK_ROWS = 512
+# rows changed since the index was built are searched directly, past this many it is worth building again
+MAX_EDITED_ROWS = 5000
+# query words found in more words of the index are not used to pick the blocks, as they are in most of them
+MAX_WORD_MATCHES = 20000
+SEPARATOR = "\0"
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def fold_column(values: Iterable[str], cell_count: int):
+    """Join the column cells, casefolded, into one text to search.
+
+    :param values: displayed cell values.
+    :param cell_count: number of the cells.
+    :return: tuple of the text and an array of the end offset of each cell in it, i.e. of the separator after it.
+    """
+    values = list(values)
+    text = SEPARATOR.join(values).casefold()
+    if text.count(SEPARATOR) != max(cell_count - 1, 0):
+        # cells holding the separator themselves
+        text = SEPARATOR.join(value.replace(SEPARATOR, " ") for value in values).casefold()
+
+    # cells are casefolded along with the text, as it may change their lengths
+    ends = array("q", map(add, accumulate(map(len, text.split(SEPARATOR))), count()))
+    return text, ends
+
+
+class SearchIndex:
+    """Index of the term names, descriptions and translations, for the case-insensitive substring search.
+
+    The displayed text of each column is kept casefolded in one string, and the words of each block of
+    `BLOCK_ROWS` rows are indexed, so a query is looked for only in the blocks having all of its words
+    within their own ones, e.g. `sword` only where `sword` or `swords` are.
+
+    The index follows the edits of the store by the rows changed since it was built, which are searched
+    directly, see `TermStore.track_edits`. Once the rows or the language columns shift, or too many rows
+    are changed, it is stale and should be built again, see `is_stale`.
+    """
+
+    def __init__(self, terms: TermStore):
+        """Build the index of the terms, it takes a few seconds for millions of cells.
+
+        :param terms: store of the terms to index.
+        """
+        self.terms = terms
+        # taken first, so the rows changed during the build are searched directly too
+        self.edited_rows = terms.track_edits()
+        self.layout_revision = terms.layout_revision
+        self.row_count = len(terms)
+        # the columns are taken up front and each one is copied before it is indexed, so the terms or
+        # the languages changed during the build leave the index stale instead of breaking it
+        columns = [terms.names, terms.descs, *terms.translations]
+        self.column_count = len(columns)
+        self.blocks_per_column = -(-self.row_count // BLOCK_ROWS)
+
+        self.texts: list[str] = []
+        self.ends: list[array] = []
+        # word -> ids of the blocks having it, `column * blocks_per_column + row // BLOCK_ROWS`
+        self.postings: dict[str, array] = {}
+
+        for column, values in enumerate(columns):
+            values = values[:self.row_count] if values.__class__ is list else list(islice(values, self.row_count))
+            if len(values) < self.row_count or terms.layout_revision != self.layout_revision:
+                # the rest is not worth indexing, the index is built again anyway
+                self.layout_revision = None
+                self.column_count = column
+                break
+
+            if column >= 2:
+                values = map(unescape_lazy, values)
+            text, ends = fold_column(values, self.row_count)
+            self.texts.append(text)
+            self.ends.append(ends)
+            self._index_words(column)
+
+        # all the words in one string, each one after a separator, to look the partial ones up with a single scan
+        self.words = list(self.postings)
+        self.vocabulary = SEPARATOR + SEPARATOR.join(self.words) + SEPARATOR
+        self.word_starts = array("q", accumulate((len(word) + 1 for word in self.words[:-1]), initial=1))
+
+    @staticmethod
+    def column_values(terms: TermStore, column: int):
+        """Get the displayed cell values of a searched column.
+
+        :param terms: store of the terms.
+        :param column: 0 for the names, 1 for the descriptions, the language index + 2 for the translations.
+        :return: iterable of the cell values.
+        """
+        if column == 0:
+            return terms.names
+        if column == 1:
+            return terms.descs
+        return map(unescape_lazy, terms.translations[column - 2])
+
+    @staticmethod
+    def row_texts(terms: TermStore, row: int):
+        """Get the casefolded texts of the searched cells of a row."""
+        texts = [terms.names[row].casefold(), terms.descs[row].casefold()]
+        texts += (unescape_lazy(column[row]).casefold() for column in terms.translations)
+        return texts
+
+    def _index_words(self, column: int):
+        text, ends = self.texts[column], self.ends[column]
+        postings = self.postings
+        find_words = WORD_PATTERN.findall
+        block_id = column * self.blocks_per_column
+        start = 0
+
+        for first_row in range(0, self.row_count, BLOCK_ROWS):
+            stop = ends[min(first_row + BLOCK_ROWS, self.row_count) - 1]
+            for word in set(find_words(text, start, stop)):
+                blocks = postings.get(word)
+                if blocks is None:
+                    postings[word] = array("I", (block_id,))
+                else:
+                    blocks.append(block_id)
+            start = stop + 1
+            block_id += 1
+
+    def is_stale(self):
+        """Check whether the index no longer matches the store closely enough to be used."""
+        return (
+            self.terms.layout_revision != self.layout_revision
+            or len(self.edited_rows) > MAX_EDITED_ROWS
+        )
+
+    def _candidate_blocks(self, query: str):
+        """Get the ids of the blocks that may have the query, None if it does not narrow them down."""
+        total = self.column_count * self.blocks_per_column
+        find = self.vocabulary.find
+        word_starts = self.word_starts
+        candidates = None
+
+        for match in WORD_PATTERN.finditer(query):
+            # words of the query are whole ones, except for its ends, which may be within a word
+            word = match.group()
+            starts_word = match.start() > 0
+            ends_word = match.end() < len(query)
+
+            if starts_word and ends_word:
+                blocks = set(self.postings.get(word, ()))
+            else:
+                pattern = f"{SEPARATOR if starts_word else ''}{word}{SEPARATOR if ends_word else ''}"
+                blocks = set()
+                matches = 0
+                position = find(pattern)
+                while position != -1:
+                    matches += 1
+                    if matches > MAX_WORD_MATCHES or len(blocks) == total:
+                        blocks = None
+                        break
+                    index = bisect_right(word_starts, position + starts_word) - 1
+                    blocks.update(self.postings[self.words[index]])
+                    # on from the separator after the word, so each word is counted once
+                    position = find(pattern, word_starts[index] + len(self.words[index]))
+
+            if blocks is None:
+                continue
+            candidates = blocks if candidates is None else candidates & blocks
+            if not candidates:
+                break
+
+        return candidates
+
+    def search(self, query: str):
+        """Find the terms with the query in their name, description or any translation, case-insensitively.
+
+        :param query: text to look for.
+        :return: sorted list of the term rows.
+        """
+        query = query.casefold()
+        terms = self.terms
+        found = bytearray(len(terms))
+
+        if SEPARATOR not in query and self.row_count:
+            candidates = self._candidate_blocks(query)
+            if candidates is None:
+                ranges = [(column, 0, self.row_count) for column in range(self.column_count)]
+            else:
+                ranges = []
+                for block_id in sorted(candidates):
+                    column, block = divmod(block_id, self.blocks_per_column)
+                    first_row = block * BLOCK_ROWS
+                    last_row = min(first_row + BLOCK_ROWS, self.row_count)
+                    if ranges and ranges[-1][0] == column and ranges[-1][2] == first_row:
+                        ranges[-1] = (column, ranges[-1][1], last_row)
+                    else:
+                        ranges.append((column, first_row, last_row))
+
+            for column, first_row, last_row in ranges:
+                self._scan(column, query, first_row, last_row, found)
+
+        # rows changed or added since the build are searched as they are now
+        for row in chain(self.edited_rows, range(self.row_count, len(terms))):
+            if row < len(found):
+                found[row] = any(query in text for text in self.row_texts(terms, row))
+
+        return list(compress(count(), found))
+
+    def _scan(self, column: int, query: str, first_row: int, last_row: int, found: bytearray):
+        text, ends = self.texts[column], self.ends[column]
+        find = text.find
+        stop = ends[last_row - 1]
+
+        # the rows found in the other columns already are skipped
+        row = found.find(0, first_row, last_row)
+        while row != -1:
+            position = find(query, ends[row - 1] + 1 if row else 0, stop)
+            if position == -1:
+                break
+            row = bisect_left(ends, position, row, last_row)
+            found[row] = 1
+            row = found.find(0, row + 1, last_row)
+
+    @staticmethod
+    def scan_terms(terms: TermStore, query: str):
+        """Find the terms with the query the same as `search` does, without an index, e.g. while it is built.
+
+        :param terms: store of the terms.
+        :param query: text to look for.
+        :return: sorted list of the term rows.
+        """
+        query = query.casefold()
+        found = bytearray(len(terms))
+        if SEPARATOR in query:
+            return []
+
+        for column in range(2 + terms.language_count()):
+            text, ends = fold_column(SearchIndex.column_values(terms, column), len(terms))
+            find = text.find
+            position = find(query)
+            while position != -1:
+                row = bisect_left(ends, position)
+                found[row] = 1
+                position = find(query, ends[row] + 1)
+
+        return list(compress(count(), found))
+
+    def memory_size(self):
+        """Get the approximate memory taken by the index, in bytes."""
+        size = sum(len(text) for text in self.texts)
+        size += sum(len(ends) * ends.itemsize for ends in self.ends)
+        size += sum(len(blocks) * blocks.itemsize for blocks in self.postings.values())
+        return size + len(self.vocabulary)
@@ -0,0 +1,347 @@
+import operator
+import re
+from fnmatch import translate
+from itertools import compress, count, repeat
+from typing import Callable, Iterable
+
+from utils.enums import TermType as Tt
+from utils.helpers import LanguageIndex, unescape_lazy
+from utils.term_store import TermStore
+
+TOKEN_PATTERN = re.compile(r'\s*(?:(?P<paren>[()])|(?P<atom>(?:"(?:[^"\\]|\\.)*"|[^\s()"])+))')
+CONDITION_PATTERN = re.compile(r'''
+    (?P<field>"(?:[^"\\]|\\.)*"|[^\s"=!~:<>.]+)
+    (?:\.(?P<attribute>len|flag))?
+    (?P<operator>!=|<=|>=|[=<>~:])
+    (?P<value>"(?:[^"\\]|\\.)*"|[^\s"]*)
+''', re.VERBOSE | re.IGNORECASE)
+# only the quotes and the backslashes are escaped in the quoted values, e.g. `\d` of a regular expression is kept
+QUOTED_ESCAPE_PATTERN = re.compile(r'\\(["\\])')
+COMPARISONS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+# fields that are not languages, a language named the same is addressed by its code
+TERM_FIELDS = ("key", "type", "desc")
+EMPTY_VALUE = "empty"
+
+# a condition gives the mask of the rows it holds for, one byte per row, see `to_mask`
+Condition = Callable[[TermStore], int]
+
+
+class QueryError(ValueError):
+    """Error in the query text."""
+
+
+def to_mask(values: Iterable) -> int:
+    """Pack the truth values of the rows into an integer, one byte of 0 or 1 per row.
+
+    The masks of the conditions are then combined with the integer bitwise operators in one go.
+    """
+    return int.from_bytes(bytes(map(bool, values)), "little")
+
+
+def all_rows_mask(rows: int) -> int:
+    """Get the mask of all the rows, to negate the others with."""
+    return int.from_bytes(b"\1" * rows, "little")
+
+
+def unquote(value: str):
+    if len(value) >= 2 and value[0] == value[-1] == "\"":
+        return QUOTED_ESCAPE_PATTERN.sub(r"\1", value[1:-1])
+    return value
+
+
+class TermQuery:
+    """Structured filter of the terms, compiled from a query text into column predicates.
+
+    Conditions are separated by spaces, all of them have to hold unless joined by `or`,
+    `not` negates the one after it, and parentheses group them:
+
+    - `key:UI/*` - term key matching the glob, `*`, `?` and `[...]` as in file names.
+    - `type:sprite` - term type.
+    - `fr:empty` - empty translation, `fr:*menu*` - translation matching the glob.
+    - `fr=Menu`, `fr!=Menu` - translation equal or not to the text, `fr=@key` to the term key,
+      `fr=@en` to another translation.
+    - `fr~^Menu` - translation matching the regular expression anywhere.
+    - `fr.len>40` - translation length, compared with `=`, `!=`, `<`, `<=`, `>` or `>=`.
+    - `fr.flag=1` - translation flag, compared the same way.
+
+    Languages are given by their codes or names, both case-insensitive, `desc` stands for the description
+    and works the same way. Values with spaces or parentheses are put in double quotes, e.g. `fr="Menu principal"`,
+    where `\\"` and `\\\\` stand for a quote and a backslash, and other backslashes are kept, e.g. `fr~"\\d+ items"`.
+
+    Every condition is evaluated over its whole column at once, so a query reads each column it refers
+    to in one pass, and the results of the conditions are combined as integer masks, see `to_mask`.
+    """
+
+    def __init__(self, text: str, languages: LanguageIndex):
+        """
+        :param text: query text.
+        :param languages: index of the languages to look the ones of the query up in.
+        :raise QueryError: if the query is invalid, e.g. of an unknown language or a bad regular expression.
+        """
+        self.text = text
+        self.languages = languages
+        self._tokens = self._tokenize(text)
+        self._position = 0
+
+        if not self._tokens:
+            raise QueryError("the query is empty")
+        self._condition = self._parse_or()
+        if self._position < len(self._tokens):
+            raise QueryError(f"unexpected '{self._tokens[self._position][1]}'")
+
+    def select(self, terms: TermStore):
+        """Find the terms matching the query.
+
+        :param terms: store of the terms.
+        :return: sorted list of the term rows.
+        """
+        rows = len(terms)
+        if not rows:
+            return []
+
+        mask = self._condition(terms)
+        return list(compress(count(), mask.to_bytes(rows, "little")))
+
+    @staticmethod
+    def _tokenize(text: str):
+        tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = TOKEN_PATTERN.match(text, position)
+            if match is None:
+                raise QueryError(f"unclosed quote at {position + 1}")
+            position = match.end()
+            tokens.append(("paren", match["paren"]) if match["paren"] else ("atom", match["atom"]))
+        return tokens
+
+    def _peek(self):
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None, None
+
+    def _is_keyword(self, keyword: str):
+        kind, value = self._peek()
+        return kind == "atom" and value.lower() == keyword
+
+    def _parse_or(self) -> Condition:
+        conditions = [self._parse_and()]
+        while self._is_keyword("or"):
+            self._position += 1
+            conditions.append(self._parse_and())
+
+        if len(conditions) == 1:
+            return conditions[0]
+
+        def evaluate(terms: TermStore):
+            mask = 0
+            for condition in conditions:
+                mask |= condition(terms)
+            return mask
+
+        return evaluate
+
+    def _parse_and(self) -> Condition:
+        conditions = [self._parse_not()]
+        while True:
+            kind, value = self._peek()
+            if kind is None or value == ")" or self._is_keyword("or"):
+                break
+            if self._is_keyword("and"):
+                self._position += 1
+            conditions.append(self._parse_not())
+
+        if len(conditions) == 1:
+            return conditions[0]
+
+        def evaluate(terms: TermStore):
+            mask = conditions[0](terms)
+            for condition in conditions[1:]:
+                if not mask:
+                    break
+                mask &= condition(terms)
+            return mask
+
+        return evaluate
+
+    def _parse_not(self) -> Condition:
+        if self._is_keyword("not"):
+            self._position += 1
+            condition = self._parse_not()
+
+            def evaluate(terms: TermStore):
+                return condition(terms) ^ all_rows_mask(len(terms))
+
+            return evaluate
+
+        kind, value = self._peek()
+        if kind is None:
+            raise QueryError("the query ends with an operator")
+
+        self._position += 1
+        if value == "(":
+            condition = self._parse_or()
+            if self._peek()[1] != ")":
+                raise QueryError("unclosed parenthesis")
+            self._position += 1
+            return condition
+        if value == ")":
+            raise QueryError("unexpected ')'")
+
+        return self._parse_condition(value)
+
+    def _find_language(self, name: str):
+        index = self.languages.find(name, name)
+        if index == -1:
+            raise QueryError(f"unknown language '{name}'")
+        return index
+
+    def _parse_condition(self, text: str) -> Condition:
+        match = CONDITION_PATTERN.fullmatch(text)
+        if match is None:
+            raise QueryError(f"invalid condition '{text}'")
+
+        field = unquote(match["field"])
+        attribute = (match["attribute"] or "").lower()
+        operator_ = match["operator"]
+        value = unquote(match["value"])
+        field_key = field.lower() if match["field"][0] != "\"" else None
+
+        if field_key == "type":
+            return self._type_condition(operator_, value)
+
+        if field_key == "key":
+            if attribute == "flag":
+                raise QueryError("only the translations have flags")
+            read = self._read_names
+        elif field_key == "desc":
+            if attribute == "flag":
+                raise QueryError("only the translations have flags")
+            read = self._read_descs
+        else:
+            lang_index = self._find_language(field)
+            if attribute == "flag":
+                return self._flag_condition(lang_index, operator_, value)
+            read = self._translation_reader(lang_index)
+
+        if attribute == "len":
+            return self._length_condition(read, operator_, value)
+        return self._text_condition(read, operator_, value, field_key == "key")
+
+    def _type_condition(self, operator_: str, value: str) -> Condition:
+        if operator_ not in (":", "=", "!="):
+            raise QueryError(f"types are compared with ':', '=' or '!=', not '{operator_}'")
+
+        term_type = Tt[value]
+        if term_type is None:
+            raise QueryError(f"unknown term type '{value}'")
+
+        # types are kept as `TermType` members, or as their titles for the terms added in the app
+        accepted = frozenset((term_type, term_type.displayed, term_type.name))
+        negate = operator_ == "!="
+
+        def evaluate(terms: TermStore):
+            mask = to_mask(map(accepted.__contains__, terms.types))
+            return mask ^ all_rows_mask(len(terms)) if negate else mask
+
+        return evaluate
+
+    def _flag_condition(self, lang_index: int, operator_: str, value: str) -> Condition:
+        compare = self._comparison(operator_)
+        try:
+            flag = int(value)
+        except ValueError:
+            raise QueryError(f"flags are compared with numbers, not '{value}'") from None
+
+        def evaluate(terms: TermStore):
+            if lang_index >= len(terms.flags):
+                return to_mask(map(compare, repeat(0, len(terms)), repeat(flag)))
+            return to_mask(map(compare, terms.flags[lang_index], repeat(flag)))
+
+        return evaluate
+
+    def _length_condition(self, read: Callable[[TermStore], Iterable[str]], operator_: str, value: str) -> Condition:
+        compare = self._comparison(operator_)
+        try:
+            length = int(value)
+        except ValueError:
+            raise QueryError(f"lengths are compared with numbers, not '{value}'") from None
+
+        def evaluate(terms: TermStore):
+            return to_mask(map(compare, map(len, read(terms)), repeat(length)))
+
+        return evaluate
+
+    def _text_condition(
+            self,
+            read: Callable[[TermStore], Iterable[str]],
+            operator_: str,
+            value: str,
+            is_key: bool
+    ) -> Condition:
+        if operator_ == ":" and value.lower() == EMPTY_VALUE:
+            return lambda terms: to_mask(map(operator.not_, read(terms)))
+
+        if operator_ == ":":
+            pattern = re.compile(translate(value))
+            # keys are compared the way the dump does, see `TermStore.case_insensitive`
+            key_pattern = re.compile(translate(value), re.IGNORECASE) if is_key else pattern
+
+            def evaluate(terms: TermStore):
+                match = key_pattern.match if terms.case_insensitive else pattern.match
+                return to_mask(map(match, read(terms)))
+
+            return evaluate
+
+        if operator_ == "~":
+            try:
+                pattern = re.compile(value)
+            except re.error as e:
+                raise QueryError(f"invalid regular expression '{value}': {str(e)}") from None
+            return lambda terms: to_mask(map(pattern.search, read(terms)))
+
+        if operator_ not in ("=", "!="):
+            raise QueryError(f"texts are compared with ':', '=', '!=' or '~', not '{operator_}'")
+
+        compare = operator.eq if operator_ == "=" else operator.ne
+        if value.startswith("@"):
+            other = value[1:]
+            if other.lower() == "key":
+                read_other = self._read_names
+            elif other.lower() == "desc":
+                read_other = self._read_descs
+            else:
+                read_other = self._translation_reader(self._find_language(other))
+            return lambda terms: to_mask(map(compare, read(terms), read_other(terms)))
+
+        return lambda terms: to_mask(map(compare, read(terms), repeat(value)))
+
+    def _comparison(self, operator_: str):
+        compare = COMPARISONS.get(operator_)
+        if compare is None:
+            raise QueryError(f"numbers are compared with '=', '!=', '<', '<=', '>' or '>=', not '{operator_}'")
+        return compare
+
+    @staticmethod
+    def _read_names(terms: TermStore):
+        return terms.names
+
+    @staticmethod
+    def _read_descs(terms: TermStore):
+        return terms.descs
+
+    @staticmethod
+    def _translation_reader(lang_index: int):
+        def read(terms: TermStore):
+            if lang_index >= terms.language_count():
+                return repeat("", len(terms))
+            return map(unescape_lazy, terms.translations[lang_index])
+
+        return read
@@ -0,0 +1,1025 @@
+import marshal
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import repeat
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+from utils.enums import TermType as Tt
+from utils.helpers import EscapedStr, escape, escape_lazy, unescape_lazy
+from utils.records import TermRecord
+
+TERM_KEYS = TermRecord.__slots__
+# longer strings rarely repeat across terms, pooling all of them would take more memory than it saves
+INTERN_MAX_LENGTH = 64
+
+
+class TermView(Mapping):
+    """Dictionary-like view of a single term row of the `TermStore`.
+
+    The view addresses the row by its position, so it should not be kept across row insertions or removals.
+    Translations and touches are read and set unescaped.
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "TermStore", row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key: str):
+        store, row = self._store, self._row
+        if key == "name":
+            return store.names[row]
+        if key == "type":
+            return store.types[row]
+        if key == "desc":
+            return store.descs[row]
+        if key == "translations":
+            return [unescape_lazy(column[row]) for column in store.translations]
+        if key == "flags":
+            return [column[row] for column in store.flags]
+        if key == "languages_touch":
+            return [unescape_lazy(touch) for touch in store.touches[row]]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        store, row = self._store, self._row
+        store.mark_dirty(row)
+        if key == "name":
+            store.rename(row, value)
+        elif key == "type":
+            store.types[row] = value
+        elif key == "desc":
+            store.descs[row] = value
+        elif key == "translations":
+            store.ensure_languages(len(value))
+            translations = store.intern_row(map(escape_lazy, value))
+            for index, translation in enumerate(_pad(translations, len(store.translations), "")):
+                column = store.translations[index]
+                if column.__class__ is PackedColumn:
+                    if column[row] == translation:
+                        continue
+                    column = store.load_language(index)
+                column[row] = translation
+        elif key == "flags":
+            store.ensure_languages(len(value))
+            for column, flag in zip(store.flags, _pad(value, len(store.flags), 0)):
+                column[row] = flag
+        elif key == "languages_touch":
+            store.touches[row] = store.intern_touch(map(escape_lazy, value))
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(TERM_KEYS)
+
+    def __len__(self):
+        return len(TERM_KEYS)
+
+    def __repr__(self):
+        return f"TermView({self.copy()!r})"
+
+    def copy(self):
+        """Get the term as a `TermRecord`, detached from the store."""
+        return TermRecord(*(self[key] for key in TERM_KEYS))
+
+
+def _pad(values: Iterable, count: int, fill: Any):
+    values = list(values)
+    return values + [fill] * (count - len(values))
+
+
+class PackedColumn(Sequence):
+    """Language column of the escaped translations packed into one UTF-8 buffer.
+
+    Cells are kept as the byte slices of the buffer, indexed by their end offsets, so a column
+    takes little more memory than its text and never holds a string object per cell.
+    Reading a cell decodes its slice, the same as it is stored in a plain column, see `TermStore`.
+    Rows are inserted and removed in place, cells are edited in plain columns, see `TermStore.load_language`.
+    """
+    __slots__ = ("data", "ends")
+
+    def __init__(self, values: Iterable[str] = ()):
+        """
+        :param values: escaped translation strings.
+        """
+        self.data = bytearray()
+        self.ends = array("q")
+        self.extend(values)
+
+    def __len__(self):
+        return len(self.ends)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self[row] for row in range(len(self.ends))[index]]
+
+        ends = self.ends
+        if index < 0:
+            index += len(ends)
+        end = ends[index]
+        value = self.data[ends[index - 1] if index else 0:end].decode("utf-8")
+        return EscapedStr(value) if "\\" in value else value
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.data
+        start = 0
+        for end in self.ends:
+            value = data[start:end].decode("utf-8")
+            yield EscapedStr(value) if "\\" in value else value
+            start = end
+
+    def __eq__(self, other: object):
+        if isinstance(other, PackedColumn):
+            return self.ends == other.ends and self.data == other.data
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(map(str.__eq__, self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __iadd__(self, values: Iterable[str]):
+        self.extend(values)
+        return self
+
+    def __delitem__(self, index: int):
+        ends = self.ends
+        if index < 0:
+            index += len(ends)
+        start = ends[index - 1] if index else 0
+        size = ends[index] - start
+
+        del self.data[start:start + size]
+        del ends[index]
+        if size:
+            ends[index:] = array("q", [end - size for end in ends[index:]])
+
+    def __repr__(self):
+        return f"PackedColumn({len(self)} cells, {len(self.data)} bytes)"
+
+    def append(self, value: str):
+        self.data += value.encode("utf-8")
+        self.ends.append(len(self.data))
+
+    def insert(self, index: int, value: str):
+        ends = self.ends
+        count = len(ends)
+        if index < 0:
+            index = max(index + count, 0)
+        index = min(index, count)
+
+        encoded = value.encode("utf-8")
+        start = ends[index - 1] if index else 0
+        self.data[start:start] = encoded
+        ends.insert(index, start)
+        ends[index:] = array("q", [end + len(encoded) for end in ends[index:]])
+
+    def extend(self, values: Iterable[str]):
+        if isinstance(values, PackedColumn):
+            offset = len(self.data)
+            self.data += values.data
+            self.ends.extend(array("q", [end + offset for end in values.ends]) if offset else values.ends)
+            return
+
+        data, ends = self.data, self.ends
+        for value in values:
+            data += value.encode("utf-8")
+            ends.append(len(data))
+
+    def copy(self):
+        column = PackedColumn()
+        column.data = self.data[:]
+        column.ends = self.ends[:]
+        return column
+
+    def size(self):
+        """Get the memory taken by the buffer and the offsets, in bytes."""
+        return len(self.data) + len(self.ends) * self.ends.itemsize
+
+
+class TermStore(Sequence):
+    """Columnar storage of the terms.
+
+    Names, types, descriptions and touches are kept in parallel lists, translations in one list
+    and flags in one `bytearray` per language, so adding, removing and moving a language touches
+    a single column instead of every term. Rows are exposed as `TermView` objects and
+    accept `TermRecord` objects or custom term dictionaries, so the store can be used in place of a list of them.
+
+    Term names are indexed once looked up and the index is kept up to date by the row operations.
+
+    Translations and touches are stored in their escaped dump form, so the ones never read are
+    not unescaped and the ones never edited are written back to TXT dumps as they are.
+    They are unescaped by the views, `records` and `get_translation`.
+
+    Repeated translations are stored once: short strings are pooled across the store, long ones
+    are shared within their term, e.g. the source text copied to the untranslated languages.
+    Touch arrays are pooled as tuples, as most terms have the same ones.
+
+    Once the terms are written out, the serialized fragment of each of them is kept along with the row,
+    see `fragments`. Every change to a row drops its fragment, changes to the language columns drop all of them.
+
+    With `lazy_languages` set, the language columns are filled as `PackedColumn` objects instead,
+    and only the ones edited are turned into plain columns, see `load_language`.
+    Cells of the packed ones are decoded as they are read, e.g. to be displayed, exported or saved.
+
+    Data kept by row and column positions elsewhere, e.g. the search index, follows the store by
+    `layout_revision`, which changes whenever the rows or the language columns shift, and by the rows
+    changed since `track_edits`.
+    """
+
+    def __init__(
+            self,
+            terms: Iterable[Mapping] = (),
+            language_count: int = 0,
+            case_insensitive: bool = False,
+            lazy_languages: bool = False
+    ):
+        """
+        :param terms: custom term dictionaries.
+        :param language_count: minimal number of language columns.
+        :param case_insensitive: whether term names differing only in case are the same term.
+        :param lazy_languages: whether to add the language columns packed, see `PackedColumn`.
+        """
+        self.lazy_languages = lazy_languages
+        self._case_insensitive = case_insensitive
+        # name key -> row of its first occurrence, None until the first lookup
+        self._name_index: dict[str, int] | None = None
+        self._duplicates: set[str] = set()
+        self._strings: dict[str, str] = {}
+        self._touches: dict[tuple, tuple] = {}
+        # serialized term per row, None for the rows changed since, see `fragments`
+        self._fragments: list[str | bytes | None] | None = None
+        self._fragments_key: Hashable = None
+        # rows changed since `track_edits`, None until it is called
+        self._edited_rows: set[int] | None = None
+        self.layout_revision = 0
+
+        self.names: list[str] = []
+        self.types: list[Any] = []
+        self.descs: list[str] = []
+        self.touches: list[tuple[str, ...]] = []
+        self.translations: list[list[str] | PackedColumn] = []
+        self.flags: list[bytearray] = []
+        self.ensure_languages(language_count)
+        self.extend(terms)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [TermView(self, row) for row in range(len(self.names))[index]]
+        return TermView(self, self._row(index))
+
+    def __iter__(self) -> Iterator[TermView]:
+        for row in range(len(self.names)):
+            yield TermView(self, row)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_name_index"] = None
+        state["_duplicates"] = set()
+        state["_fragments"] = None
+        state["_fragments_key"] = None
+        state["_edited_rows"] = None
+        return state
+
+    def __eq__(self, other: object):
+        if not isinstance(other, TermStore):
+            return NotImplemented
+        return (
+            self.names == other.names
+            and self.types == other.types
+            and self.descs == other.descs
+            and self.touches == other.touches
+            and self.translations == other.translations
+            and self.flags == other.flags
+        )
+
+    def __repr__(self):
+        return f"TermStore({len(self)} terms, {self.language_count()} languages)"
+
+    def _row(self, index: int):
+        count = len(self.names)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("term index out of range")
+        return index
+
+    @property
+    def case_insensitive(self):
+        """Whether term names differing only in case are the same term, as `CaseInsensitiveTerms` in I2."""
+        return self._case_insensitive
+
+    @case_insensitive.setter
+    def case_insensitive(self, value: bool):
+        if value != self._case_insensitive:
+            self._case_insensitive = value
+            self._name_index = None
+
+    def name_key(self, name: str):
+        """Get the index key of the term name.
+
+        :param name: term name.
+        :return: case folded name if the terms are case-insensitive, name as is otherwise.
+        """
+        return name.casefold() if self._case_insensitive else name
+
+    def _build_name_index(self):
+        index = {}
+        duplicates = set()
+        for row, name in enumerate(self.names):
+            key = self.name_key(name)
+            if key in index:
+                duplicates.add(key)
+            else:
+                index[key] = row
+
+        self._name_index = index
+        self._duplicates = duplicates
+        return index
+
+    def _index_row(self, row: int, name: str):
+        index = self._name_index
+        key = self.name_key(name)
+        first = index.get(key)
+        if first is None:
+            index[key] = row
+            return
+
+        self._duplicates.add(key)
+        if row < first:
+            index[key] = row
+
+    def _unindex_row(self, row: int, name: str):
+        key = self.name_key(name)
+        if key in self._duplicates:
+            # another row has the same key, look for it once the row is gone
+            self._name_index = None
+        elif self._name_index.get(key) == row:
+            del self._name_index[key]
+
+    def _shift_index(self, start: int, offset: int):
+        index = self._name_index
+        for key, row in index.items():
+            if row >= start:
+                index[key] = row + offset
+
+    def find(self, name: str):
+        """Find the term row by its name.
+
+        :param name: term name, compared case-insensitively if `case_insensitive` is set.
+        :return: row of the first term with the name if exists. Otherwise, -1.
+        """
+        index = self._name_index
+        if index is None:
+            index = self._build_name_index()
+        return index.get(self.name_key(name), -1)
+
+    def duplicate_names(self):
+        """Get the names used by more than one term.
+
+        :return: list of the duplicated names, as written in their first occurrence.
+        """
+        if self._name_index is None:
+            self._build_name_index()
+        return [self.names[self._name_index[key]] for key in self._duplicates]
+
+    def rename(self, row: int, name: str):
+        """Rename the term.
+
+        :param row: term row.
+        :param name: new term name.
+        """
+        row = self._row(row)
+        self.mark_dirty(row)
+        if self._name_index is not None:
+            self._unindex_row(row, self.names[row])
+        self.names[row] = name
+        if self._name_index is not None:
+            self._index_row(row, name)
+
+    def language_count(self):
+        """Get the number of language columns."""
+        return len(self.translations)
+
+    def ensure_languages(self, count: int):
+        """Add empty language columns until there are at least `count` of them.
+
+        :param count: required number of language columns.
+        """
+        rows = len(self.names)
+        if len(self.translations) < count:
+            self.clear_fragments()
+            self.layout_revision += 1
+        while len(self.translations) < count:
+            self.translations.append(PackedColumn(repeat("", rows)) if self.lazy_languages else [""] * rows)
+            self.flags.append(bytearray(rows))
+
+    def is_language_loaded(self, index: int):
+        """Check whether the language column is a plain one, i.e. not packed or turned into a plain one already.
+
+        :param index: index of the language column.
+        """
+        return self.translations[index].__class__ is not PackedColumn
+
+    def load_language(self, index: int):
+        """Turn the packed language column into a plain one, to edit its cells.
+
+        :param index: index of the language column.
+        :return: plain language column.
+        """
+        column = self.translations[index]
+        if column.__class__ is PackedColumn:
+            pooled = self._strings.setdefault
+            column = self.translations[index] = [
+                pooled(value, value) if len(value) <= INTERN_MAX_LENGTH else value
+                for value in column
+            ]
+        return column
+
+    def has_descriptions(self):
+        """Check whether any of the terms has a description."""
+        return any(self.descs)
+
+    def intern(self, value: str, row: int | None = None):
+        """Get the stored copy of the translation string, so repeated ones are kept in memory once.
+
+        :param value: escaped translation string.
+        :param row: term row whose translations to look for a long string in, as those are not pooled.
+        :return: equal string already stored if there is one. Otherwise, the string itself.
+        """
+        if len(value) <= INTERN_MAX_LENGTH:
+            return self._strings.setdefault(value, value)
+
+        if row is not None:
+            for column in self.translations:
+                if column[row] == value:
+                    return column[row]
+        return value
+
+    def intern_row(self, values: Iterable[str]):
+        """Get the stored copies of the translation strings of a term.
+
+        :param values: escaped translation strings.
+        :return: list of the strings, equal long ones shared within it.
+        """
+        pooled = self._strings.setdefault
+        shared = {}.setdefault
+        return [
+            pooled(value, value) if len(value) <= INTERN_MAX_LENGTH else shared(value, value)
+            for value in values
+        ]
+
+    def intern_touch(self, values: Iterable[str]):
+        """Get the stored copy of the touch array.
+
+        :param values: escaped touch strings.
+        :return: tuple of the strings, shared by the terms with the same touches.
+        """
+        touch = tuple(self.intern_row(values))
+        return self._touches.setdefault(touch, touch)
+
+    def memory_report(self):
+        """Count the translation strings and the memory they take.
+
+        :return: `(languages, total)` tuple of the dictionaries with the number of `cells`, `unique`
+            string objects, `size` of them in bytes and `saved` bytes that the repeated strings would take
+            if each cell had its own copy. `languages` has one dictionary per language column,
+            with `packed` set for the packed ones, whose `size` is the one of their buffer.
+            `total` counts the strings shared between the languages once.
+        """
+        def count(cells: int, unique: dict, cells_size: int):
+            size = sum(map(sys.getsizeof, unique.values()))
+            return {"cells": cells, "unique": len(unique), "size": size, "saved": cells_size - size}
+
+        languages = []
+        all_unique = {}
+        all_cells = all_size = packed_size = 0
+
+        for column in self.translations:
+            if column.__class__ is PackedColumn:
+                # no string objects are kept, so none are shared either
+                size = column.size()
+                languages.append({"cells": len(column), "unique": 0, "size": size, "saved": 0, "packed": True})
+                all_cells += len(column)
+                packed_size += size
+                continue
+
+            unique = {id(value): value for value in column}
+            cells_size = sum(map(sys.getsizeof, column))
+            languages.append(count(len(column), unique, cells_size) | {"packed": False})
+
+            all_unique |= unique
+            all_cells += len(column)
+            all_size += cells_size
+
+        total = count(all_cells, all_unique, all_size)
+        total["size"] += packed_size
+        return languages, total
+
+    def cell_reader(self, key: str | int) -> Callable[[int], Any]:
+        """Get a function reading the cells of a term field or a language column by the term row,
+        for reading many of them without looking the field up each time, e.g. to display them.
+
+        Rows are not checked, the function reads the store as it changes.
+
+        :param key: term field name, `name`, `type` or `desc`, or language column index.
+        :return: function of the row, giving the translations unescaped.
+            Language columns out of range read as empty strings.
+        :raise KeyError: if the key is neither a term field nor a language column index.
+        """
+        if key == "name":
+            return self.names.__getitem__
+        if key == "type":
+            return self.types.__getitem__
+        if key == "desc":
+            return self.descs.__getitem__
+        if not isinstance(key, int):
+            raise KeyError(key)
+
+        translations = self.translations
+
+        def read_translation(row: int):
+            if 0 <= key < len(translations):
+                return unescape_lazy(translations[key][row])
+            return ""
+
+        return read_translation
+
+    def get_translation(self, row: int, column: int):
+        """Get the unescaped translation.
+
+        :param row: term row.
+        :param column: language column.
+        :return: translation string.
+        """
+        return unescape_lazy(self.translations[column][row])
+
+    def set_translation(self, row: int, column: int, value: str):
+        """Set the translation.
+
+        :param row: term row.
+        :param column: language column.
+        :param value: unescaped translation string.
+        """
+        self.mark_dirty(row)
+        value = self.intern(escape_lazy(value), row)
+        self.load_language(column)[row] = value
+
+    def set_translations(self, column: int, rows: Iterable[int], values: Iterable[str]):
+        """Set many translations of a language column at once, e.g. replaced in bulk.
+
+        :param column: language column.
+        :param rows: term rows.
+        :param values: unescaped translation strings, one per row.
+        """
+        cells = self.load_language(column)
+        intern = self.intern
+        mark_dirty = self.mark_dirty
+        for row, value in zip(rows, values):
+            mark_dirty(row)
+            cells[row] = intern(escape_lazy(value), row)
+
+    def set_flag(self, row: int, column: int, value: int):
+        """Set the translation flag.
+
+        :param row: term row.
+        :param column: language column.
+        :param value: flag value.
+        """
+        self.mark_dirty(row)
+        self.flags[column][row] = value
+
+    def mark_dirty(self, row: int):
+        """Drop the serialized fragment of the term, for it to be rendered again on the next save.
+
+        :param row: term row.
+        """
+        if self._fragments is not None:
+            self._fragments[row] = None
+        if self._edited_rows is not None:
+            self._edited_rows.add(row)
+
+    def track_edits(self):
+        """Start collecting the rows changed from now on, replacing the ones collected before.
+
+        Rows are collected until the `layout_revision` changes, their positions are stale after that.
+
+        :return: set of the changed rows, filled as they change.
+        """
+        self._edited_rows = set()
+        return self._edited_rows
+
+    def clear_fragments(self):
+        """Drop the serialized fragments of all the terms."""
+        self._fragments = None
+        self._fragments_key = None
+
+    def record(self, row: int, escaped: bool = False):
+        """Get the term as a custom term dictionary, the same as given by `records`.
+
+        :param row: term row.
+        :param escaped: whether to give the translations and touches in their escaped form.
+        :return: custom term dictionary.
+        """
+        translations = [column[row] for column in self.translations]
+        touch = self.touches[row]
+        if not escaped:
+            translations = [unescape_lazy(translation) for translation in translations]
+            touch = [unescape_lazy(value) for value in touch]
+
+        return {
+            "name": self.names[row],
+            "type": self.types[row],
+            "desc": self.descs[row],
+            "translations": translations,
+            "flags": [column[row] for column in self.flags],
+            "languages_touch": list(touch)
+        }
+
+    def fragments(
+            self,
+            key: Hashable,
+            render: Callable[[Iterable[dict]], Iterator[str | bytes]],
+            escaped: bool = False
+    ) -> Iterator[str | bytes]:
+        """Iterate over the serialized terms, rendering only the ones changed since the last call with the key.
+
+        The fragments are kept for a single key at a time, a call with another one renders all the terms again.
+
+        :param key: identifier of the serialization, e.g. the format and its options.
+        :param render: function rendering the custom term dictionaries into one fragment per term.
+            It should not depend on the term position, as the fragments are kept when the rows move.
+            It is called once per call, with the terms to render.
+        :param escaped: whether to give the translations and touches to `render` in their escaped form.
+        :return: generator of the fragments, one per term.
+        """
+        cache = self._fragments
+        if cache is None or self._fragments_key != key:
+            cache = self._fragments = [None] * len(self.names)
+            self._fragments_key = key
+            for row, fragment in enumerate(render(self.records(escaped))):
+                cache[row] = fragment
+                yield fragment
+            return
+
+        dirty = [row for row, fragment in enumerate(cache) if fragment is None]
+        if dirty:
+            for row, fragment in zip(dirty, render(self.record(row, escaped) for row in dirty)):
+                cache[row] = fragment
+
+        yield from cache
+
+    def count_dirty(self, key: Hashable):
+        """Count the terms `fragments` would render for the key.
+
+        :param key: identifier of the serialization.
+        :return: number of the terms without a kept fragment.
+        """
+        if self._fragments is None or self._fragments_key != key:
+            return len(self.names)
+        return self._fragments.count(None)
+
+    def records(self, escaped: bool = False) -> Iterator[dict]:
+        """Iterate over the terms as custom term dictionaries, built column-wise.
+
+        :param escaped: whether to give the translations and touches in their escaped form
+            instead of unescaping them, for writing them back to a TXT dump.
+        :return: generator of custom term dictionaries.
+        """
+        rows = len(self.names)
+        translations = zip(*self.translations) if self.translations else repeat((), rows)
+        flags = zip(*self.flags) if self.flags else repeat((), rows)
+
+        for name, type_, desc, touch, translation, flag in zip(
+                self.names, self.types, self.descs, self.touches, translations, flags
+        ):
+            # most rows have nothing to unescape, looking for them by type is much faster than a call per value
+            if not escaped:
+                if EscapedStr in map(type, translation):
+                    translation = map(unescape_lazy, translation)
+                if EscapedStr in map(type, touch):
+                    touch = map(unescape_lazy, touch)
+
+            yield {
+                "name": name,
+                "type": type_,
+                "desc": desc,
+                "translations": list(translation),
+                "flags": list(flag),
+                "languages_touch": list(touch)
+            }
+
+    def insert(self, index: int, term: Mapping, escaped: bool = False):
+        """Insert a term before the given row.
+
+        Translations and flags missing for some languages are filled with empty values,
+        extra ones add language columns.
+
+        :param index: row index, clamped like `list.insert`.
+        :param term: `TermRecord` or custom term dictionary.
+        :param escaped: whether the translations and touches are in their escaped form already,
+            e.g. parsed with lazy strings.
+        """
+        count = len(self.names)
+        if index < 0:
+            index = max(index + count, 0)
+        index = min(index, count)
+
+        term = TermRecord.from_mapping(term)
+        translations = term.translations or ()
+        flags = term.flags or ()
+        touches = term.languages_touch or ()
+        if not escaped:
+            translations = [escape_lazy(translation) for translation in translations]
+            touches = [escape_lazy(touch) for touch in touches]
+        if not self.lazy_languages:
+            translations = self.intern_row(translations)
+        touches = self.intern_touch(touches)
+        self.ensure_languages(max(len(translations), len(flags)))
+
+        name = term.name
+        if self._name_index is not None:
+            if index < count:
+                self._shift_index(index, 1)
+            self._index_row(index, name)
+
+        if self._fragments is not None:
+            self._fragments.insert(index, None)
+        if index < count:
+            self.layout_revision += 1
+        self.names.insert(index, name)
+        self.types.insert(index, term.type)
+        self.descs.insert(index, term.desc)
+        self.touches.insert(index, touches)
+
+        for column, translation in zip(self.translations, _pad(translations, len(self.translations), "")):
+            column.insert(index, translation)
+        for column, flag in zip(self.flags, _pad(flags, len(self.flags), 0)):
+            column.insert(index, flag)
+
+    def append(self, term: Mapping, escaped: bool = False):
+        """Add a term after the last row.
+
+        :param term: `TermRecord` or custom term dictionary.
+        :param escaped: whether the translations and touches are in their escaped form already.
+        """
+        if term.__class__ is not TermRecord:
+            term = TermRecord.from_mapping(term)
+        translations = term.translations or ()
+        flags = term.flags or ()
+        columns = len(self.translations)
+        if len(translations) != columns or len(flags) != columns:
+            self.insert(len(self.names), term, escaped)
+            return
+
+        touches = term.languages_touch or ()
+        if not escaped:
+            translations = [escape_lazy(translation) for translation in translations]
+            touches = [escape_lazy(touch) for touch in touches]
+        if not self.lazy_languages:
+            # packed columns keep no string objects to share
+            translations = self.intern_row(translations)
+        touches = self.intern_touch(touches)
+
+        name = term.name
+        if self._name_index is not None:
+            self._index_row(len(self.names), name)
+
+        if self._fragments is not None:
+            self._fragments.append(None)
+        self.names.append(name)
+        self.types.append(term.type)
+        self.descs.append(term.desc)
+        self.touches.append(touches)
+
+        for column, translation in zip(self.translations, translations):
+            column.append(translation)
+        for column, flag in zip(self.flags, flags):
+            column.append(flag)
+
+    def extend(self, terms: "Iterable[Mapping] | TermStore"):
+        """Add the terms after the last row.
+
+        :param terms: custom term dictionaries or another store, which is appended column by column.
+        """
+        if not isinstance(terms, TermStore):
+            for term in terms:
+                self.append(term)
+            return
+
+        start, rows = len(self.names), len(terms.names)
+        self.ensure_languages(terms.language_count())
+
+        if self._name_index is not None:
+            for row, name in enumerate(terms.names, start):
+                self._index_row(row, name)
+
+        if self._fragments is not None:
+            self._fragments += [None] * rows
+        self.names += terms.names
+        self.types += terms.types
+        self.descs += terms.descs
+        touches = self._touches
+        self.touches += [touches.setdefault(touch, touch) for touch in terms.touches]
+
+        # strings pooled by the other store are pooled again, so the ones in both are stored once
+        strings = self._strings
+        for index, column in enumerate(self.translations):
+            if index < len(terms.translations) and column.__class__ is PackedColumn:
+                column.extend(terms.translations[index])
+            elif index < len(terms.translations):
+                column += [
+                    strings.setdefault(value, value) if len(value) <= INTERN_MAX_LENGTH else value
+                    for value in terms.translations[index]
+                ]
+            else:
+                column += [""] * rows
+        for index, column in enumerate(self.flags):
+            column += terms.flags[index] if index < len(terms.flags) else bytearray(rows)
+
+    def pop(self, index: int = -1):
+        """Remove a term row.
+
+        :param index: row index.
+        :return: `TermRecord` of the removed term.
+        """
+        index = self._row(index)
+        term = TermView(self, index).copy()
+
+        if self._name_index is not None:
+            self._unindex_row(index, self.names[index])
+            if self._name_index is not None and index < len(self.names) - 1:
+                self._shift_index(index + 1, -1)
+
+        if self._fragments is not None:
+            del self._fragments[index]
+        self.layout_revision += 1
+        for column in (self.names, self.types, self.descs, self.touches, *self.translations, *self.flags):
+            del column[index]
+
+        return term
+
+    def clear(self):
+        """Remove all the terms along with the language columns."""
+        self._name_index = None
+        self._duplicates = set()
+        self._strings = {}
+        self._touches = {}
+        self.clear_fragments()
+        self.layout_revision += 1
+        self.names.clear()
+        self.types.clear()
+        self.descs.clear()
+        self.touches.clear()
+        self.translations.clear()
+        self.flags.clear()
+
+    def insert_language(self, index: int, source_index: int | None = None):
+        """Insert a language column.
+
+        :param index: index of the new language column.
+        :param source_index: index of the language column to copy the translations from, empty if None.
+        """
+        rows = len(self.names)
+        if source_index is not None and 0 <= source_index < len(self.translations):
+            translations = self.translations[source_index].copy()
+        else:
+            translations = [""] * rows
+
+        self.clear_fragments()
+        self.layout_revision += 1
+        self.translations.insert(index, translations)
+        self.flags.insert(index, bytearray(rows))
+
+    def remove_language(self, index: int):
+        """Remove a language column.
+
+        :param index: index of the language column.
+        """
+        if 0 <= index < len(self.translations):
+            self.clear_fragments()
+            self.layout_revision += 1
+            del self.translations[index]
+            del self.flags[index]
+
+    def move_language(self, from_index: int, to_index: int):
+        """Move a language column.
+
+        :param from_index: current index of the language column.
+        :param to_index: new index of the language column.
+        """
+        if 0 <= from_index < len(self.translations):
+            self.clear_fragments()
+            self.layout_revision += 1
+            self.translations.insert(to_index, self.translations.pop(from_index))
+            self.flags.insert(to_index, self.flags.pop(from_index))
+
+
+SPOOL_SIZE = struct.Struct("<I")
+
+
+class TermSpool:
+    """Append-only storage of the terms in a temporary file, to pass them through without keeping them in memory.
+
+    Used in place of `TermStore` by the parsers when the terms are only written out again.
+    Terms are read back by `records` in the order they were added, padded with empty values
+    to the same number of languages, as a `TermStore` would give them.
+    """
+
+    def __init__(self, case_insensitive: bool = False):
+        """
+        :param case_insensitive: whether term names differing only in case are the same term.
+        """
+        self.case_insensitive = case_insensitive
+        self.file = tempfile.TemporaryFile()
+        self.count = 0
+        self.columns = 0
+        self._has_descriptions = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.file.close()
+
+    def has_descriptions(self):
+        """Check whether any of the terms has a description."""
+        return self._has_descriptions
+
+    def ensure_languages(self, count: int):
+        """Pad the terms to at least `count` languages once they are read.
+
+        :param count: required number of language columns.
+        """
+        self.columns = max(self.columns, count)
+
+    def append(self, term: Mapping, escaped: bool = False):
+        """Add a term after the last one.
+
+        :param term: `TermRecord` or custom term dictionary.
+        :param escaped: whether the translations and touches are in their escaped form.
+            They are unescaped before they are stored.
+        """
+        term = TermRecord.from_mapping(term)
+        translations = list(term.translations or ())
+        flags = list(term.flags or ())
+        touches = list(term.languages_touch or ())
+        if escaped:
+            translations = [unescape_lazy(translation) for translation in translations]
+            touches = [unescape_lazy(touch) for touch in touches]
+
+        data = marshal.dumps((term.name, Tt.get_value(term.type), term.desc, translations, flags, touches))
+        self.file.write(SPOOL_SIZE.pack(len(data)))
+        self.file.write(data)
+
+        self.count += 1
+        self.columns = max(self.columns, len(translations), len(flags))
+        self._has_descriptions = self._has_descriptions or bool(term.desc)
+
+    def clear(self):
+        """Remove all the terms."""
+        self.file.seek(0)
+        self.file.truncate()
+        self.count = 0
+        self.columns = 0
+        self._has_descriptions = False
+
+    def records(self, escaped: bool = False) -> Iterator[dict]:
+        """Iterate over the terms as custom term dictionaries.
+
+        :param escaped: whether to give the translations and touches in their escaped form.
+        :return: generator of custom term dictionaries.
+        """
+        f = self.file
+        f.seek(0)
+        columns = self.columns
+
+        for _ in range(self.count):
+            size, = SPOOL_SIZE.unpack(f.read(4))
+            name, type_, desc, translations, flags, touches = marshal.loads(f.read(size))
+
+            if escaped:
+                translations = [escape(translation) for translation in translations]
+                touches = [escape(touch) for touch in touches]
+
+            yield {
+                "name": name,
+                "type": Tt(type_),
+                "desc": desc,
+                "translations": _pad(translations, columns, ""),
+                "flags": _pad(flags, columns, 0),
+                "languages_touch": touches
+            }
+
+        f.seek(0, 2)
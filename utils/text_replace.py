@@ -0,0 +1,75 @@
+import re
+from typing import Iterable
+
+from utils.helpers import unescape_lazy
+from utils.term_store import TermStore
+
+
+class ColumnReplacement:
+    """Translations of a language column changed by a find and replace, found by `find_replacements`."""
+    __slots__ = ("lang_index", "rows", "old_values", "new_values", "matches")
+
+    def __init__(self, lang_index: int):
+        """
+        :param lang_index: index of the language.
+        """
+        self.lang_index = lang_index
+        # sorted term rows of the changed translations, along with their unescaped values before and after
+        self.rows: list[int] = []
+        self.old_values: list[str] = []
+        self.new_values: list[str] = []
+        self.matches = 0
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def compile_pattern(text: str, is_regex: bool = True, match_case: bool = True):
+    """Compile the text to find.
+
+    :param text: regular expression, or plain text if `is_regex` is False.
+    :param is_regex: whether the text is a regular expression.
+    :param match_case: whether to tell the uppercase and lowercase letters apart.
+    :return: compiled pattern.
+    :raise re.error: if the regular expression is invalid.
+    """
+    return re.compile(text if is_regex else re.escape(text), 0 if match_case else re.IGNORECASE)
+
+
+def find_replacements(
+        terms: TermStore,
+        pattern: re.Pattern,
+        replacement: str,
+        lang_indexes: Iterable[int]
+):
+    """Replace the matches of the pattern in the translations of the languages, without changing the terms.
+
+    Each column is read once, the cells without a match are left as they are by `re.Pattern.subn` alone.
+
+    :param terms: store of the terms.
+    :param pattern: compiled pattern to find, e.g. by `compile_pattern`.
+    :param replacement: replacement template, with the group references as of `re.sub`.
+    :param lang_indexes: indexes of the languages to look in.
+    :return: list of the `ColumnReplacement` of the columns with any translation changed, in the language order.
+    :raise re.error: if the replacement template refers to a group the pattern does not have.
+    """
+    subn = pattern.subn
+    replacements = []
+
+    for lang_index in sorted(set(lang_indexes)):
+        if not 0 <= lang_index < terms.language_count():
+            continue
+
+        column = ColumnReplacement(lang_index)
+        for row, value in enumerate(map(unescape_lazy, terms.translations[lang_index])):
+            new_value, matches = subn(replacement, value)
+            if matches and new_value != value:
+                column.rows.append(row)
+                column.old_values.append(value)
+                column.new_values.append(new_value)
+                column.matches += matches
+
+        if column.rows:
+            replacements.append(column)
+
+    return replacements
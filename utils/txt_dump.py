@@ -0,0 +1,356 @@
+import io
+import mmap
+import re
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from utils.enums import TermType as Tt
+from utils.helpers import EscapedStr, escape, parse_raw_value, unescape
+from utils.term_store import TermStore
+
+# `<indent><align> <type> <name>` or `<indent>[<index>]`, the ` = <value>` part is split off beforehand
+TXT_FIELD_PATTERN = re.compile(r"( *)(?:\d (\S+) (\S+)(?: .*)?|\[\d+])")
+
+
+def _parse_string(value: str):
+    value = value[1:-1]
+    return unescape(value) if "\\" in value else value
+
+
+def _parse_escaped_string(value: str):
+    value = value[1:-1]
+    return EscapedStr(value) if "\\" in value else value
+
+
+def _parse_bool(value: str):
+    return value.lower() == "true"
+
+
+VALUE_PARSERS = {
+    "string": _parse_string,
+    "int": int,
+    "unsigned int": int,
+    "SInt8": int,
+    "UInt8": int,
+    "SInt16": int,
+    "UInt16": int,
+    "SInt32": int,
+    "UInt32": int,
+    "SInt64": int,
+    "UInt64": int,
+    "float": float,
+    "double": float,
+    "bool": _parse_bool
+}
+
+
+def _parse_field(head: str):
+    """Parse the field declaration part of the TXT dump line.
+
+    :param head: line part before ` = `.
+    :return: `(indent, type, name, value parser)` tuple, None for array index lines, empty tuple for unknown lines.
+    """
+    match = TXT_FIELD_PATTERN.fullmatch(head.rstrip())
+    if match is None:
+        return ()
+
+    indent, type_name, name = match.groups()
+    if type_name is None:
+        return None
+
+    return len(indent), type_name, name, VALUE_PARSERS.get(type_name, parse_raw_value)
+
+
+def iter_txt_dump(dump_lines: Iterable[str], lazy_strings: bool = False) -> Iterator[tuple[int, str, str, Any]]:
+    """Lazily tokenize the UABEA TXT dump.
+
+    Values are parsed according to their declared UABEA type, unknown types fall back to `parse_raw_value`.
+    Arrays of primitive values are read in one go and yielded as a single `Array` token with a list value,
+    arrays of objects yield an `Array` token without a value followed by their elements' tokens.
+    Array index (`[i]`) and size lines are skipped.
+
+    :param dump_lines: iterable of string lines, e.g. an opened text file.
+    :param lazy_strings: whether to keep the strings of primitive arrays, i.e. the translations,
+        in their escaped form, see `EscapedStr`.
+    :return: generator of `(indent, type, name, value)` tuples, `value` is None for objects.
+    """
+    # field declarations repeat for every term, so each distinct one is parsed only once
+    fields: dict[str, tuple] = {}
+    lines = iter(dump_lines)
+
+    for raw in lines:
+        head, sep, value = raw.partition(" = ")
+
+        field = fields.get(head)
+        if field is None:
+            field = _parse_field(head)
+            if field is None:
+                continue
+            fields[head] = field
+
+        if not field:
+            continue
+
+        indent, type_name, name, parser = field
+
+        if sep:
+            yield indent, type_name, name, parser(value.rstrip())
+            continue
+
+        if type_name != "Array":
+            yield indent, type_name, name, None
+            continue
+
+        size = int(next(lines, "").rpartition("=")[2] or 0)
+        if size <= 0:
+            yield indent, type_name, name, []
+            continue
+
+        next(lines, None)  # [0]
+        head, sep, value = next(lines, "").partition(" = ")
+        item = fields.get(head) or _parse_field(head)
+        if not item:
+            yield indent, type_name, name, None
+            continue
+
+        fields[head] = item
+
+        if not sep:
+            yield indent, type_name, name, None
+            yield item[0], item[1], item[2], None
+            continue
+
+        parser = item[3]
+        # `[i]` and `<type> data = <value>` lines alternate, take every value line
+        value_lines = islice(lines, 1, 2 * (size - 1), 2)
+
+        if lazy_strings and parser is _parse_string:
+            # inlined, as most strings are taken as they are
+            values = [_parse_escaped_string(value.rstrip())]
+            for line in value_lines:
+                value = line[line.index(" = ") + 4:].rstrip()[:-1]
+                values.append(EscapedStr(value) if "\\" in value else value)
+            yield indent, type_name, name, values
+            continue
+
+        values = [parser(value.rstrip())]
+        for line in value_lines:
+            values.append(parser(line[line.index(" = ") + 3:].rstrip()))
+
+        yield indent, type_name, name, values
+
+
+def build_txt_tree(
+        tokens: Iterable[tuple[int, str, str, Any]],
+        item_parsers: dict[str, Callable[[dict], Any]] | None = None
+):
+    """Build the UABEA JSON dump structure from TXT dump tokens.
+
+    :param tokens: tokens produced by `iter_txt_dump`.
+    :param item_parsers: functions to convert the object elements of the named arrays with,
+        e.g. `{"mTerms": parse_term}`. Each element is converted as soon as it is complete.
+    :return: UABEA JSON dump content.
+    """
+    item_parsers = item_parsers or {}
+    root = {}
+    # (indent, container, name, parser of the container's items)
+    stack: list[tuple[int, Any, str, Callable | None]] = [(-1, root, "", None)]
+
+    def close():
+        container = stack.pop()[1]
+        _, parent, _, parser = stack[-1]
+        if parser is not None and container.__class__ is dict:
+            parent[-1] = parser(container)
+
+    for indent, type_name, name, value in tokens:
+        # find parent by indentation
+        while stack[-1][0] >= indent:
+            close()
+
+        parent = stack[-1][1]
+        is_list = parent.__class__ is list
+
+        if value is not None:
+            if is_list:
+                # skip the array size, elements are counted by themselves
+                if name != "size":
+                    parent.append(value)
+            else:
+                parent[name] = value
+
+        elif type_name == "Array":
+            arr = []
+            if not is_list:
+                parent["Array"] = arr
+            stack.append((indent, arr, name, item_parsers.get(stack[-1][2])))
+
+        elif indent:
+            # object start (vector, PPtr etc)
+            obj = {}
+            if is_list:
+                parent.append(obj)
+            else:
+                parent[name] = obj
+            stack.append((indent, obj, name, None))
+
+    while len(stack) > 1:
+        close()
+
+    return root
+
+
+TXT_TERMS_PATTERN = re.compile(rb"\n  0 TermData mTerms\r?\n[^\n]*\n[^\n]*\n")
+# `[i]` line of an array item at four spaces of indentation, as the terms are
+TXT_ITEM_START_PATTERN = re.compile(rb"\n    \[")
+TXT_TERM_START_PATTERN = re.compile(rb"    \[\d+]\r?\n     0 TermData data\r?\n")
+# first line indented less than the terms array items
+TXT_TERMS_END_PATTERN = re.compile(rb"\n(?! {4})")
+# field declarations preceding the `mTerms` items, fed to the parser of a split off part of them
+TXT_TERMS_PREFIX = (
+    " 0 LanguageSourceData mSource\n"
+    "  0 TermData mTerms\n"
+    "   1 Array Array (1 items)\n"
+    "    0 int size = 1\n"
+)
+
+
+def split_txt_terms(path: str | Path, parts: int):
+    """Split the UABEA TXT dump from the first `mTerms` array item to its end into parts at item boundaries.
+
+    The end of the terms is not looked for, it is left to `parse_txt_terms_range`
+    to not scan the whole file here.
+
+    :param path: path to the dump file.
+    :param parts: number of parts.
+    :return: `(terms declaration start, [(part start, part end), ...])` byte offsets,
+        None if the dump has no terms array items.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        declaration = TXT_TERMS_PATTERN.search(data)
+        if declaration is None or not TXT_TERM_START_PATTERN.match(data, declaration.end()):
+            return None
+
+        start, end = declaration.end(), len(data)
+        step = max((end - start) // max(parts, 1), 1)
+
+        ranges = []
+        while start < end:
+            boundary = TXT_ITEM_START_PATTERN.search(data, start + step)
+            part_end = boundary.start() + 1 if boundary else end
+            ranges.append((start, part_end))
+            start = part_end
+
+        return declaration.start() + 1, ranges
+
+
+def parse_txt_terms_range(
+        path: str | Path,
+        start: int,
+        end: int,
+        item_parser: Callable[[dict], dict],
+        lazy_languages: bool = False
+):
+    """Parse a part of the UABEA TXT dump split by `split_txt_terms`.
+
+    :param path: path to the dump file.
+    :param start: byte offset of the part.
+    :param end: byte offset after the part.
+    :param item_parser: function to convert the UABEA term dictionaries with.
+    :param lazy_languages: whether to store the language columns packed, see `TermStore`.
+    :return: `(store of the parsed terms, byte offset of the terms end)` tuple.
+        The offset is None if the terms continue after the part, and `start` if the part has no terms.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    if not TXT_TERM_START_PATTERN.match(data):
+        return TermStore(lazy_languages=lazy_languages), start
+
+    # the last new line of a part is followed by the next one, not by the end of the terms
+    terms_end = TXT_TERMS_END_PATTERN.search(data, 0, len(data) - 1)
+    if terms_end is not None:
+        data = data[:terms_end.start() + 1]
+        terms_end = start + terms_end.start() + 1
+
+    terms = TermStore(lazy_languages=lazy_languages)
+    build_txt_tree(
+        iter_txt_dump(io.StringIO(TXT_TERMS_PREFIX + data.decode("utf-8"), newline=None), lazy_strings=True),
+        {"mTerms": lambda term: terms.append(item_parser(term), escaped=True)}
+    )
+    return terms, terms_end
+
+
+STRING_ITEM_TEMPLATE = "        [{0}]\n         1 string data = \""
+UINT8_ITEM_TEMPLATE = "        [{0}]\n         0 UInt8 data = "
+
+
+def _extend_templates(templates: list[str], template: str, count: int):
+    for index in range(len(templates), count):
+        templates.append(template.format(index))
+
+
+def render_txt_term_fragments(terms: Iterable[dict], has_descriptions: bool = False) -> Iterator[str]:
+    """Render the terms as the `mTerms` array items of the UABEA TXT dump, without their array index lines.
+
+    The fragments do not depend on the term position, so they can be kept until the terms change.
+    The item lines of the translations are templated once per language index, not per term.
+
+    :param terms: custom term dictionaries, with the translations and touches in their escaped form
+        as given by `TermStore.records(escaped=True)`. They are written verbatim.
+    :param has_descriptions: whether to write the term descriptions.
+    :return: generator of TXT dump chunks, one per term.
+    """
+    string_items: list[str] = []
+    uint8_items: list[str] = []
+
+    for term in terms:
+        translations = term["translations"]
+        flags = term["flags"]
+        languages_touch = term["languages_touch"]
+
+        _extend_templates(string_items, STRING_ITEM_TEMPLATE, max(len(translations), len(languages_touch)))
+        _extend_templates(uint8_items, UINT8_ITEM_TEMPLATE, len(flags))
+
+        parts = [
+            "     0 TermData data\n"
+            f"      1 string Term = \"{escape(term['name'])}\"\n"
+            f"      0 int TermType = {Tt[term['type']]}\n"
+        ]
+
+        if has_descriptions:
+            parts.append(f"      1 string Description = \"{escape(term['desc'])}\"\n")
+
+        parts.append(
+            "      0 string Languages\n"
+            f"       1 Array Array ({len(translations)} items)\n"
+            f"        0 int size = {len(translations)}\n"
+        )
+        parts += [f"{item}{value}\"\n" for item, value in zip(string_items, translations)]
+
+        parts.append(
+            "      0 vector Flags\n"
+            f"       1 Array Array ({len(flags)} items)\n"
+            f"        0 int size = {len(flags)}\n"
+        )
+        parts += [f"{item}{value}\n" for item, value in zip(uint8_items, flags)]
+
+        parts.append(
+            "      0 string Languages_Touch\n"
+            f"       1 Array Array ({len(languages_touch)} items)\n"
+            f"        0 int size = {len(languages_touch)}\n"
+        )
+        parts += [f"{item}{value}\"\n" for item, value in zip(string_items, languages_touch)]
+
+        yield "".join(parts)
+
+
+def render_txt_fragments_chunk(terms: list[dict], has_descriptions: bool = False):
+    """Render a chunk of the terms with `render_txt_term_fragments`, e.g. in a worker process.
+
+    :param terms: custom term dictionaries, with the translations and touches in their escaped form.
+    :param has_descriptions: whether to write the term descriptions.
+    :return: list of TXT dump chunks, one per term.
+    """
+    return list(render_txt_term_fragments(terms, has_descriptions))